@@ -0,0 +1,543 @@
+"""Crate benchmark - reproducible performance run of the browser panel, without Nuke.
+
+Generates a synthetic asset library (thousands of folders and files of mixed formats),
+renders it with a stand-in F3D (fake_f3d.py, writes a PNG after a configurable delay) and
+drives the real ThreeDAssetBrowser from menu.py under the offscreen Qt platform, with a
+stubbed nuke module. Measures folder open latency, zoom and resize cost, time until every
+thumbnail of a folder is rendered and peak memory, then compares against a stored baseline:
+
+    python benchmarks/crate_benchmark.py                   # run and compare to baseline.json
+    python benchmarks/crate_benchmark.py --save-baseline   # record a new baseline
+
+Exits with 1 when a measurement is slower than the baseline by more than --tolerance.
+Baselines only compare on the same machine - record one before changing the code.
+"""
+import argparse
+import contextlib
+import importlib.util
+import json
+import os
+import platform
+import random
+import shutil
+import stat
+import statistics
+import struct
+import sys
+import tempfile
+import time
+import types
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+CRATE_DIR = os.path.dirname(BENCH_DIR)
+BASELINE_FILE = os.path.join(BENCH_DIR, "baseline.json")
+sys.path.insert(0, BENCH_DIR)
+
+from fake_f3d import png_bytes  # noqa: E402
+
+# Extensions of the synthetic library and how often each one shows up
+FORMAT_WEIGHTS = {
+    ".obj": 30, ".fbx": 10, ".ply": 8, ".glb": 8, ".abc": 4, ".usd": 4, ".splat": 3,
+    ".png": 12, ".tga": 8, ".hdr": 4, ".exr": 5, ".txt": 4,
+}
+MODEL_TEXT = "# Crate benchmark asset\nv 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3\n"
+TEXTURE_SIZE = 256
+BROKEN_EVERY = 25  # One asset in this many fails to render in the render folder
+
+# Slowdowns smaller than this are noise, whatever the ratio (by unit suffix of the measurement)
+ABSOLUTE_SLACK = {"_seconds": 0.01, "_ms": 1.0, "_mb": 16.0}
+# Shown next to the baseline but too noisy to fail a run on
+INFORMATIONAL = {"zoom_step_max_ms", "resize_step_max_ms", "folder_first_rows_cold_seconds"}
+
+_console = sys.stdout
+
+
+def note(message):
+    """Progress line on the real console - Crate's own output goes to the log file"""
+    print(message, file=_console, flush=True)
+
+
+# ---------------------------------------------------------------------------------------------
+# Synthetic library
+# ---------------------------------------------------------------------------------------------
+
+def tga_bytes(width, height, color):
+    """Uncompressed 24-bit TGA, with the version 2 footer Qt's reader asks for"""
+    header = struct.pack("<BBBHHBHHHHBB", 0, 0, 2, 0, 0, 0, 0, 0, width, height, 24, 0)
+    footer = struct.pack("<II", 0, 0) + b"TRUEVISION-XFILE.\x00"
+    return header + bytes(reversed(color)) * (width * height) + footer
+
+
+def hdr_bytes(width, height):
+    """Radiance HDR with flat (not run-length encoded) scanlines of a gradient"""
+    header = f"#?RADIANCE\nFORMAT=32-bit_rle_rgbe\n\n-Y {height} +X {width}\n".encode("ascii")
+    rows = []
+    for y in range(height):
+        rows.append(b"".join(bytes((x * 255 // width, y * 255 // height, 128, 129)) for x in range(width)))
+    return header + b"".join(rows)
+
+
+class LibraryGenerator:
+    """Writes the synthetic asset tree - the same seed always gives the same library"""
+
+    def __init__(self, root, seed):
+        self.root = root
+        self.random = random.Random(seed)
+        self.extensions = list(FORMAT_WEIGHTS)
+        self.weights = [FORMAT_WEIGHTS[ext] for ext in self.extensions]
+        # Texture contents are the same for every file of a type, only the bytes on disk matter
+        self.contents = {
+            ".png": png_bytes(TEXTURE_SIZE, TEXTURE_SIZE, (90, 140, 200)),
+            ".tga": tga_bytes(TEXTURE_SIZE, TEXTURE_SIZE, (200, 120, 60)),
+            ".hdr": hdr_bytes(64, 64),
+            ".exr": b"v/1\x01" + bytes(4096),  # Not a readable EXR - lands in the failure log
+        }
+        self.files = 0
+        self.folders = 0
+
+    def write_file(self, folder, name, ext):
+        content = self.contents.get(ext)
+        if content is None:
+            content = (MODEL_TEXT * self.random.randint(1, 40)).encode("ascii")
+        with open(os.path.join(folder, name + ext), "wb") as f:
+            f.write(content)
+        self.files += 1
+
+    def make_folder(self, path):
+        os.makedirs(path, exist_ok=True)
+        self.folders += 1
+        return path
+
+    def fill_folder(self, folder, count, extensions=None):
+        for i in range(count):
+            if extensions is None:
+                ext = self.random.choices(self.extensions, self.weights)[0]
+            else:
+                ext = self.random.choice(extensions)
+            self.write_file(folder, f"asset_{i:05d}", ext)
+
+    def generate(self, folders, files_per_folder, big_folder, render_folder):
+        """Many small folders, a few with subfolders, one very large folder and one folder to render"""
+        for i in range(folders):
+            folder = self.make_folder(os.path.join(self.root, f"folder_{i:04d}"))
+            self.fill_folder(folder, files_per_folder)
+            if i % 10 == 0:
+                self.fill_folder(self.make_folder(os.path.join(folder, "variants")), 3)
+        self.fill_folder(self.make_folder(os.path.join(self.root, "big")), big_folder)
+
+        render = self.make_folder(os.path.join(self.root, "render"))
+        for i in range(render_folder):
+            name = f"broken_{i:04d}" if i % BROKEN_EVERY == BROKEN_EVERY - 1 else f"model_{i:04d}"
+            self.write_file(render, name, self.random.choice([".obj", ".fbx", ".ply", ".glb"]))
+        return self.root
+
+
+def write_f3d_launcher(work_dir):
+    """Executable Crate can call as F3D_PATH, running fake_f3d.py with this python"""
+    fake_f3d = os.path.join(BENCH_DIR, "fake_f3d.py")
+    if sys.platform == "win32":
+        launcher = os.path.join(work_dir, "f3d.cmd")
+        with open(launcher, "w") as f:
+            f.write(f'@"{sys.executable}" "{fake_f3d}" %*\n')
+    else:
+        launcher = os.path.join(work_dir, "f3d")
+        with open(launcher, "w") as f:
+            f.write(f'#!/bin/sh\nexec "{sys.executable}" "{fake_f3d}" "$@"\n')
+        os.chmod(launcher, os.stat(launcher).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return launcher
+
+
+# ---------------------------------------------------------------------------------------------
+# Crate under test
+# ---------------------------------------------------------------------------------------------
+
+class _Node(dict):
+    def __missing__(self, knob):
+        return types.SimpleNamespace(setValue=lambda value: None)
+
+    def setXYpos(self, x, y):
+        pass
+
+
+def install_nuke_stubs():
+    """Just enough of nuke and nukescripts for menu.py to load and register its panel"""
+    nuke = types.ModuleType("nuke")
+    nuke.message = lambda text: print(f"[nuke.message] {text}")
+    nuke.createNode = lambda node_class: _Node()
+    nuke.root = lambda: types.SimpleNamespace(width=lambda: 2048, height=lambda: 1556)
+    nukescripts = types.ModuleType("nukescripts")
+    nukescripts.registerWidgetAsPanel = lambda *args, **kwargs: None
+    sys.modules.setdefault("nuke", nuke)
+    sys.modules.setdefault("nukescripts", nukescripts)
+
+
+def load_crate():
+    spec = importlib.util.spec_from_file_location("crate_menu", os.path.join(CRATE_DIR, "menu.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def peak_memory_mb():
+    """Peak resident memory of this process, None when the platform does not tell"""
+    try:
+        import resource
+    except ImportError:
+        resource = None
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Kilobytes on Linux, bytes on macOS
+        return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+    try:
+        import psutil
+    except ImportError:
+        return None
+    memory = psutil.Process().memory_info()
+    return round(getattr(memory, "peak_wset", memory.rss) / (1024 * 1024), 1)
+
+
+def median(measure, *args, repeat=5):
+    """Median of several runs of a measurement - a single sample is too noisy to compare.
+    Measurements returning several timings get the median of each."""
+    samples = [measure(*args) for _ in range(repeat)]
+    if isinstance(samples[0], tuple):
+        return tuple(statistics.median(values) for values in zip(*samples))
+    return statistics.median(samples)
+
+
+class BrowserBench:
+    """Drives one ThreeDAssetBrowser and times what the user waits for"""
+
+    def __init__(self, crate, app, timeout):
+        self.crate = crate
+        self.app = app
+        self.timeout = timeout
+        self.QtCore = crate.QtCore
+        self.scans_finished = {}  # scan id -> perf_counter when the rows were sorted and shown
+        self.first_rows = {}  # scan id -> perf_counter of the first batch of rows
+        self.index = None  # Library index of the crawl measurement
+        self.crawl_done = False
+        self.search_done = False
+
+        start = time.perf_counter()
+        self.browser = crate.ThreeDAssetBrowser()
+        self.browser.resize(1280, 800)
+        self.browser.show()
+        self.startup_seconds = time.perf_counter() - start
+        # The cache directory and F3D are checked in the background, the panel lists folders after that
+        self.wait_until(lambda: self.browser.thumbnail_cache.ready, "the startup checks")
+        self.ready_seconds = time.perf_counter() - start
+        self.browser.directory_scanner.scan_finished.connect(self.on_scan_finished)
+        self.browser.directory_scanner.entries_found.connect(self.on_entries_found)
+
+    def on_scan_finished(self, scan_id, path, error):
+        self.scans_finished.setdefault(scan_id, time.perf_counter())
+
+    def on_entries_found(self, scan_id, entries):
+        self.first_rows.setdefault(scan_id, time.perf_counter())
+
+    def on_crawl_finished(self, folders_read):
+        self.crawl_done = True
+
+    def on_search_finished(self, search_id, entries):
+        self.search_done = True
+
+    def wait_until(self, condition, what):
+        """Run the event loop until condition() is true - returns the seconds waited"""
+        start = time.perf_counter()
+        while not condition():
+            if time.perf_counter() - start > self.timeout:
+                raise TimeoutError(f"Timed out after {self.timeout}s waiting for {what}")
+            self.app.processEvents()
+            time.sleep(0.001)  # Let the worker threads have the GIL
+        return time.perf_counter() - start
+
+    def repaint(self):
+        self.browser.asset_view.viewport().repaint()
+
+    def settle(self):
+        """Drop queued renders and let the running ones finish, so measurements start from a quiet panel"""
+        self.browser.thumbnail_cache.scheduler.clear()
+        self.wait_until(self.idle, "the earlier renders to finish")
+
+    def open_folder(self, path, force=False):
+        """(seconds until the folder is listed and painted, seconds until its first rows)
+        force reads the folder from disk again, like Refresh, instead of the listing kept in memory"""
+        self.settle()
+        start = time.perf_counter()
+        self.browser.load_assets(path, force)
+        scan_id = self.browser.scan_id
+        self.wait_until(lambda: scan_id in self.scans_finished, f"the listing of {path}")
+        self.repaint()
+        end = time.perf_counter()
+        first_rows = self.first_rows.get(scan_id, self.scans_finished[scan_id]) - start
+        return end - start, first_rows
+
+    def idle(self):
+        cache = self.browser.thumbnail_cache
+        return not cache.scheduler.pending_count() and not cache.decoder.pending_count() and not cache.deferred
+
+    def wait_for_thumbnails(self, path):
+        """Open a folder with an empty cache and wait until every thumbnail in it is rendered"""
+        # Renders still queued for the folders opened before are not part of this measurement
+        self.settle()
+        start = time.perf_counter()
+        self.open_folder(path)
+        self.wait_until(self.idle, f"the thumbnails of {path}")
+        # Paint the finished thumbnails, which decodes the visible ones
+        self.repaint()
+        self.wait_until(self.idle, "the visible thumbnails to decode")
+        self.app.processEvents()
+        return time.perf_counter() - start
+
+    def rendered_count(self):
+        cache = self.browser.thumbnail_cache
+        return sum(1 for entry in self.browser.asset_model.entries
+                   if entry.kind == "model" and cache.renderer.is_cached(cache.cache_key(entry.path)))
+
+    def warm_visible_thumbnails(self, path):
+        """Revisit a rendered folder with nothing in memory - seconds until the visible cells show thumbnails"""
+        cache = self.browser.thumbnail_cache
+        cache.cache.clear()
+        cache.missing.clear()
+        start = time.perf_counter()
+        self.open_folder(path)
+        self.wait_until(self.idle, "the visible thumbnails to decode")
+        self.app.processEvents()
+        self.repaint()
+        return time.perf_counter() - start
+
+    def zoom_steps(self):
+        """Milliseconds per zoom step, including the synchronous repaint of the grid"""
+        browser = self.browser
+        steps = [browser.fit_to_view] + [browser.zoom_out] * 3 + [browser.zoom_in] * 8 + [browser.fit_to_view]
+        timings = []
+        for step in steps:
+            start = time.perf_counter()
+            step()
+            self.app.processEvents()
+            self.repaint()
+            timings.append((time.perf_counter() - start) * 1000)
+            # Levels the new size needs are decoded in the background, outside the measured step
+            self.wait_until(self.idle, "the zoomed thumbnails to decode")
+        return timings
+
+    def resize_steps(self):
+        """Milliseconds per panel resize, including re-flowing and repainting the grid"""
+        timings = []
+        for width, height in [(900, 700), (1600, 1000), (1100, 760), (1920, 1080), (1280, 800)] * 2:
+            start = time.perf_counter()
+            self.browser.resize(width, height)
+            self.app.processEvents()
+            self.browser.handle_resize()
+            self.repaint()
+            timings.append((time.perf_counter() - start) * 1000)
+            self.wait_until(self.idle, "the resized grid to decode")
+        return timings
+
+    def crawl(self, root, index_path):
+        """Index the whole library from scratch - in an index of its own, the panel crawls its index by itself"""
+        self.index = self.crate.LibraryIndex(index_path, self.browser)
+        self.index.crawl_finished.connect(self.on_crawl_finished)
+        self.index.search_finished.connect(self.on_search_finished)
+        self.crawl_done = False
+        start = time.perf_counter()
+        self.index.crawl(root)
+        self.wait_until(lambda: self.crawl_done, "the library crawl")
+        return time.perf_counter() - start
+
+    def search(self, text):
+        self.search_done = False
+        start = time.perf_counter()
+        self.index.search(text)
+        self.wait_until(lambda: self.search_done, "the library search")
+        return time.perf_counter() - start
+
+
+def run_benchmark(args, work_dir):
+    """Build the library, run every measurement and return the results document"""
+    note(f"🏗️  Generating the synthetic library in {work_dir} ...")
+    start = time.perf_counter()
+    generator = LibraryGenerator(os.path.join(work_dir, "library"), args.seed)
+    library = generator.generate(args.folders, args.files_per_folder, args.big_folder, args.render_folder)
+    note(f"   {generator.folders} folders, {generator.files} files ({time.perf_counter() - start:.1f}s)")
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ["CRATE_FAKE_F3D_DELAY"] = str(args.f3d_delay)
+    install_nuke_stubs()
+
+    log_path = os.path.join(work_dir, "crate.log")
+    with open(log_path, "w", encoding="utf-8") as log, contextlib.redirect_stdout(_console if args.verbose else log):
+        crate = load_crate()
+        app = crate.QtWidgets.QApplication.instance() or crate.QtWidgets.QApplication(["crate_benchmark"])
+        crate.ASSET_DIR = library
+        crate.CACHE_DIR = os.path.join(work_dir, "cache")
+        crate.F3D_PATH = write_f3d_launcher(work_dir)
+        crate.RENDER_WORKERS = args.workers
+        crate.WATCH_FOLDERS = False
+        crate.LIBRARY_RECRAWL_MINUTES = 0
+        crate.METRICS_FILE = None
+
+        results = {}
+        bench = BrowserBench(crate, app, args.timeout)
+        results["panel_startup_seconds"] = bench.startup_seconds
+        results["panel_ready_seconds"] = bench.ready_seconds
+        results["root_open_seconds"], _ = median(bench.open_folder, library, True, repeat=args.repeat)
+
+        note("📚 Crawling the library index ...")
+        results["library_crawl_seconds"] = bench.crawl(library, os.path.join(work_dir, "benchmark_index.sqlite"))
+        results["library_search_seconds"] = median(bench.search, "asset_0001", repeat=args.repeat)
+
+        note("📂 Opening folders ...")
+        big = os.path.join(library, "big")
+        results["folder_open_cold_seconds"], results["folder_first_rows_cold_seconds"] = median(
+            bench.open_folder, big, True, repeat=args.repeat)
+        results["folder_open_warm_seconds"], _ = median(bench.open_folder, big, repeat=args.repeat)
+        results["folder_open_small_seconds"], _ = median(
+            bench.open_folder, os.path.join(library, "folder_0001"), True, repeat=args.repeat)
+
+        note(f"🖼️  Rendering {args.render_folder} thumbnails ...")
+        render = os.path.join(library, "render")
+        results["thumbnails_all_seconds"] = bench.wait_for_thumbnails(render)
+        rendered = bench.rendered_count()
+        results["thumbnails_visible_warm_seconds"] = median(bench.warm_visible_thumbnails, render, repeat=args.repeat)
+
+        note("🔍 Zooming and resizing ...")
+        zoom = bench.zoom_steps()
+        results["zoom_step_median_ms"] = statistics.median(zoom)
+        results["zoom_step_max_ms"] = max(zoom)
+        resize = bench.resize_steps()
+        results["resize_step_median_ms"] = statistics.median(resize)
+        results["resize_step_max_ms"] = max(resize)
+
+        results["peak_memory_mb"] = peak_memory_mb()
+        pipeline = crate.metrics.summary_lines()
+        pixmap_stats = bench.browser.thumbnail_cache.cache.stats()
+        qt_version = crate.QtCore.qVersion()
+        pyside_version = getattr(sys.modules.get("PySide2"), "__version__", "unknown")
+        numpy_version = crate.np.__version__ if crate.np is not None else None
+        bench.browser.thumbnail_cache.scheduler.clear()
+        bench.browser.close()
+
+    expected = args.render_folder - args.render_folder // BROKEN_EVERY
+    if rendered != expected:
+        note(f"⚠️  {rendered} of {expected} renderable thumbnails landed in the cache")
+    return {
+        "recorded": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "environment": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "qt": qt_version,
+            "pyside": pyside_version,
+            "numpy": numpy_version,
+            "cpus": os.cpu_count(),
+        },
+        "parameters": {
+            "seed": args.seed,
+            "folders": args.folders,
+            "files_per_folder": args.files_per_folder,
+            "big_folder": args.big_folder,
+            "render_folder": args.render_folder,
+            "f3d_delay": args.f3d_delay,
+            "workers": args.workers,
+            "repeat": args.repeat,
+        },
+        "results": {name: (round(value, 4) if isinstance(value, float) else value) for name, value in results.items()},
+        "thumbnails_rendered": rendered,
+        "pixmap_cache": pixmap_stats,
+        "pipeline": pipeline,
+    }
+
+
+# ---------------------------------------------------------------------------------------------
+# Baseline comparison
+# ---------------------------------------------------------------------------------------------
+
+def slack(name):
+    for suffix, amount in ABSOLUTE_SLACK.items():
+        if name.endswith(suffix):
+            return amount
+    return 0.0
+
+
+def compare(current, baseline, tolerance):
+    """Print every measurement next to the baseline - returns the names that regressed"""
+    if baseline.get("parameters") != current["parameters"]:
+        note("⚠️  The baseline was recorded with different parameters - the comparison is only indicative")
+    regressions = []
+    note(f"\n{'measurement':<34} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for name, value in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if value is None or base is None:
+            note(f"{name:<34} {'-':>10} {value if value is not None else '-':>10}")
+            continue
+        ratio = value / base if base else float("inf") if value else 1.0
+        slower = value > base * tolerance and value - base > slack(name)
+        if slower and name not in INFORMATIONAL:
+            regressions.append(name)
+        flag = ("  (slower, not checked)" if name in INFORMATIONAL else "  ❌ slower") if slower else ""
+        note(f"{name:<34} {base:>10.4g} {value:>10.4g} {ratio:>6.2f}x{flag}")
+    return regressions
+
+
+def report(current):
+    note(f"\n{'measurement':<34} {'current':>10}")
+    for name, value in current["results"].items():
+        note(f"{name:<34} {value if value is not None else '-':>10}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Crate panel on a synthetic library with a stand-in F3D.")
+    parser.add_argument("--folders", type=int, default=1000, help="Number of small asset folders (default: 1000)")
+    parser.add_argument("--files-per-folder", type=int, default=8, help="Files in each small folder (default: 8)")
+    parser.add_argument("--big-folder", type=int, default=3000, help="Files in the one large folder (default: 3000)")
+    parser.add_argument("--render-folder", type=int, default=200, help="Models rendered from scratch (default: 200)")
+    parser.add_argument("--f3d-delay", type=float, default=0.05, help="Seconds the stand-in F3D takes per render (default: 0.05)")
+    parser.add_argument("--workers", type=int, default=4, help="Renders at once, RENDER_WORKERS (default: 4)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs of each folder open and search, the median is kept (default: 5)")
+    parser.add_argument("--seed", type=int, default=7, help="Seed of the synthetic library (default: 7)")
+    parser.add_argument("--timeout", type=float, default=600, help="Give up on a measurement after this many seconds")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="Baseline to compare with (default: benchmarks/baseline.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline instead of comparing")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="Slowdown ratio that counts as a regression (default: 1.5)")
+    parser.add_argument("--output", help="Also write the results of this run to this JSON file")
+    parser.add_argument("--work-dir", help="Build the library and cache here instead of a temporary folder")
+    parser.add_argument("--keep", action="store_true", help="Keep the synthetic library, cache and Crate log")
+    parser.add_argument("--verbose", action="store_true", help="Show Crate's console output")
+    args = parser.parse_args(argv)
+
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="crate_benchmark_")
+    os.makedirs(work_dir, exist_ok=True)
+    try:
+        current = run_benchmark(args, work_dir)
+    finally:
+        if args.keep or args.work_dir:
+            note(f"   library, cache and crate.log kept in {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=1)
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(current, f, indent=1)
+        report(current)
+        note(f"\n💾 Baseline written to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        report(current)
+        note(f"\nNo baseline at {args.baseline} - record one with --save-baseline")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(current, baseline, args.tolerance)
+    if regressions:
+        note(f"\n❌ {len(regressions)} measurement(s) slower than the baseline by more than {args.tolerance}x")
+        return 1
+    note("\n✅ No regression against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
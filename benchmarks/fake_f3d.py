@@ -0,0 +1,73 @@
+"""Stand-in for the F3D executable, used by the Crate benchmark.
+
+Accepts the arguments Crate passes to F3D, waits CRATE_FAKE_F3D_DELAY seconds (a render)
+and writes a solid color PNG of the requested resolution to --output. Files with "broken"
+in their name fail like a crashing F3D render. Only needs the python standard library.
+"""
+import hashlib
+import os
+import struct
+import sys
+import time
+import zlib
+
+VERSION = "F3D 2.5.0 (Crate benchmark stand-in)"
+
+
+def png_bytes(width, height, color):
+    """A solid RGB PNG, encoded without any imaging library"""
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xffffffff)
+    row = b"\x00" + bytes(color) * width
+    pixels = zlib.compress(row * height, 1)
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", pixels) + chunk(b"IEND", b"")
+
+
+def parse_args(argv):
+    """(input file, output file, (width, height)) from an F3D command line"""
+    input_path = output_path = None
+    resolution = (1000, 600)  # F3D's default window size
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--output":
+            i += 1
+            output_path = argv[i]
+        elif arg.startswith("--output="):
+            output_path = arg.split("=", 1)[1]
+        elif arg == "--resolution":
+            i += 1
+            resolution = tuple(int(value) for value in argv[i].split(","))
+        elif arg.startswith("--resolution="):
+            resolution = tuple(int(value) for value in arg.split("=", 1)[1].split(","))
+        elif not arg.startswith("-") and input_path is None:
+            input_path = arg
+        i += 1
+    return input_path, output_path, resolution
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if "--version" in argv:
+        print(VERSION)
+        return 0
+    input_path, output_path, resolution = parse_args(argv)
+    if input_path is None:
+        print("fake f3d: no input file", file=sys.stderr)
+        return 1
+
+    time.sleep(float(os.environ.get("CRATE_FAKE_F3D_DELAY", "0.05")))
+    if "broken" in os.path.basename(input_path):
+        print(f"fake f3d: cannot read {input_path}", file=sys.stderr)
+        return 3
+    if output_path:
+        # A color per asset, so thumbnails are told apart when watching the benchmark
+        color = hashlib.md5(input_path.encode("utf-8")).digest()[:3]
+        with open(output_path, "wb") as f:
+            f.write(png_bytes(resolution[0], resolution[1], color))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
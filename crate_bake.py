@@ -0,0 +1,194 @@
+"""Crate bake - headless bulk pre-render of the shared thumbnail cache.
+
+Walks a library root and renders every missing or stale thumbnail into the same
+cache layout the Crate panel uses, so the first visit to a folder is instant for
+everyone. Runs without Nuke or a display (PySide2 is still needed to check images),
+for example overnight on a render node after ingest:
+
+    python crate_bake.py "L:/3D Objects" --workers 8 --report bake_report.json
+
+Interrupted bakes resume where they stopped: thumbnails already in the cache are
+skipped, and failures recorded in the shared failure log (written by the panel too)
+are not retried before their backoff expires unless --retry-failed is given.
+"""
+import argparse
+import concurrent.futures
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import sys
+import time
+
+CRATE_DIR = os.path.dirname(os.path.abspath(__file__))
+JOURNAL_NAME = "crate_bake_journal.jsonl"
+
+# Per process: menu.py loaded as a module, and the renderer of this worker
+_crate = None
+_renderer = None
+_verbose = False
+
+
+def load_crate(quiet=True):
+    """Load Crate's menu.py as a module (it skips the panel registration outside Nuke)"""
+    spec = importlib.util.spec_from_file_location("crate_menu", os.path.join(CRATE_DIR, "menu.py"))
+    module = importlib.util.module_from_spec(spec)
+    output = io.StringIO() if quiet else sys.stdout
+    with contextlib.redirect_stdout(output):
+        spec.loader.exec_module(module)
+    return module
+
+
+def init_worker(cache_dir, temp_dir, f3d_path, verbose):
+    """Process pool initializer - every worker renders with its own copy of Crate"""
+    global _crate, _renderer, _verbose
+    _crate = load_crate()
+    _crate.F3D_PATH = f3d_path
+    _renderer = _crate.ThumbnailRenderer(cache_dir, temp_dir)
+    _renderer.costs.load()
+    _verbose = verbose
+
+
+def bake_one(file_path, thumb_key, identity):
+    """Render one thumbnail in a worker process"""
+    start = time.time()
+    output = sys.stdout if _verbose else io.StringIO()
+    with contextlib.redirect_stdout(output):
+        # Assets still backing off were already left out by the scan, unless --retry-failed
+        outcome = _renderer.render(file_path, thumb_key, identity, retry_failed=True)
+    return {"path": file_path, "key": thumb_key, "outcome": outcome, "seconds": round(time.time() - start, 3)}
+
+
+def find_assets(crate, root):
+    """Every file under root that Crate renders thumbnails for, with its size and mtime"""
+    pending = [root]
+    while pending:
+        dir_path = pending.pop()
+        try:
+            entries = crate.DirectoryScanner.read_directory(dir_path)
+        except OSError as e:
+            print(f"❌ Cannot read {dir_path}: {e}")
+            continue
+        for entry in entries:
+            if entry.kind == "folder":
+                pending.append(entry.path)
+            elif entry.ext in crate.F3D_FORMATS or entry.ext in crate.TEXTURE_FORMATS:
+                yield entry
+
+
+def format_duration(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m{seconds:02d}s" if hours else f"{minutes}m{seconds:02d}s"
+
+
+def main(argv=None):
+    crate = load_crate()
+
+    parser = argparse.ArgumentParser(description="Pre-render Crate thumbnails for a whole library, without Nuke.")
+    parser.add_argument("root", nargs="?", default=crate.ASSET_DIR, help="Library root to walk (default: ASSET_DIR)")
+    parser.add_argument("--cache-dir", default=crate.CACHE_DIR, help="Thumbnail cache directory (default: CACHE_DIR)")
+    parser.add_argument("--f3d", default=crate.F3D_PATH, help="F3D executable (default: F3D_PATH)")
+    parser.add_argument("--workers", type=int, default=crate.default_render_workers(),
+                        help="Number of renders to run at once (default: RENDER_WORKERS)")
+    parser.add_argument("--retry-failed", action="store_true", help="Retry failed assets even if their retry delay has not expired")
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would be rendered")
+    parser.add_argument("--report", help="Write a JSON summary to this file")
+    parser.add_argument("--verbose", action="store_true", help="Show F3D output for every render")
+    args = parser.parse_args(argv)
+
+    crate.F3D_PATH = args.f3d
+    if not os.path.exists(args.f3d):
+        print(f"❌ F3D not found at: {args.f3d}")
+        return 2
+    os.makedirs(args.cache_dir, exist_ok=True)
+    temp_dir = os.path.join(crate.tempfile.gettempdir(), "nuke_3d_temp")
+    os.makedirs(temp_dir, exist_ok=True)
+    renderer = crate.ThumbnailRenderer(args.cache_dir, temp_dir)
+    renderer.costs.load()
+
+    journal_file = os.path.join(args.cache_dir, JOURNAL_NAME)
+
+    print(f"🔍 Scanning {args.root} ...")
+    start = time.time()
+    counts = {"found": 0, crate.RENDER_CACHED: 0, "skipped_failed": 0}
+    jobs = []
+    for entry in find_assets(crate, args.root):
+        counts["found"] += 1
+        identity = crate.ThumbnailCache.file_identity(entry.path, entry.mtime_ns, entry.size)
+        thumb_key = crate.ThumbnailCache.identity_key(identity)
+        if renderer.is_cached(thumb_key):
+            counts[crate.RENDER_CACHED] += 1
+        elif not args.retry_failed and renderer.failures.blocks(entry.path, thumb_key):
+            counts["skipped_failed"] += 1
+        else:
+            jobs.append((entry.path, thumb_key, identity))
+    # Cheapest first - quick assets land in the cache before the heavy ones occupy the workers
+    jobs.sort(key=lambda job: renderer.costs.predict(os.path.splitext(job[0])[1].lower(), job[2]["size"]))
+    print(f"   {counts['found']} models and textures, {counts[crate.RENDER_CACHED]} already cached, "
+          f"{counts['skipped_failed']} failed before, {len(jobs)} to render "
+          f"(scan took {format_duration(time.time() - start)})")
+
+    interrupted = False
+    render_seconds = 0.0
+    if jobs and not args.dry_run:
+        print(f"🔄 Rendering with {args.workers} workers...")
+        render_start = time.time()
+        done = 0
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=args.workers, initializer=init_worker,
+            initargs=(args.cache_dir, temp_dir, args.f3d, args.verbose))
+        try:
+            futures = [executor.submit(bake_one, *job) for job in jobs]
+            with open(journal_file, "a") as journal_out:
+                for future in concurrent.futures.as_completed(futures):
+                    result = future.result()
+                    done += 1
+                    counts[result["outcome"]] = counts.get(result["outcome"], 0) + 1
+                    render_seconds += result["seconds"]
+                    # One line per finished asset, a history of every bake next to the cache
+                    journal_out.write(json.dumps(result) + "\n")
+                    journal_out.flush()
+
+                    elapsed = time.time() - render_start
+                    eta = elapsed / done * (len(jobs) - done)
+                    icon = "✅" if result["outcome"] in crate.RENDER_SUCCESS else "❌"
+                    print(f"[{done}/{len(jobs)}] {icon} {result['outcome']:<9} {result['seconds']:6.1f}s  "
+                          f"{os.path.basename(result['path'])}  (ETA {format_duration(eta)})")
+        except KeyboardInterrupt:
+            interrupted = True
+            print("\n⏹️  Interrupted - run the same command again to resume")
+            executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            executor.shutdown()
+
+    elapsed = time.time() - start
+    summary = {
+        "root": args.root,
+        "cache_dir": args.cache_dir,
+        "workers": args.workers,
+        "dry_run": args.dry_run,
+        "interrupted": interrupted,
+        "elapsed_seconds": round(elapsed, 1),
+        "render_seconds": round(render_seconds, 1),
+        "to_render": len(jobs),
+        "counts": counts,
+    }
+    print("\n📋 Bake summary")
+    for name, count in counts.items():
+        print(f"   {name:<15} {count}")
+    print(f"   total time      {format_duration(elapsed)}")
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(summary, f, indent=1)
+        print(f"   report written to {args.report}")
+
+    # Assets another workstation was rendering are not failures - they land in the cache by themselves
+    failed = sum(count for name, count in counts.items()
+                 if name not in ("found", "skipped_failed", crate.RENDER_BUSY) and name not in crate.RENDER_SUCCESS)
+    return 1 if interrupted or failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,51 @@
 import os
-import nuke
-import nukescripts
+try:
+    import nuke
+    import nukescripts
+except ImportError:
+    # Headless use (crate_bake.py) - the panel itself only runs inside Nuke
+    nuke = None
+    nukescripts = None
 from PySide2 import QtWidgets, QtCore, QtGui
 import subprocess
-import functools
 import threading
 import time
 import tempfile
 import traceback
-import shutil
 import hashlib
 import math
+import heapq
+import itertools
+import json
+import socket
+import collections
+import sqlite3
+import contextlib
+import array
+import mmap
+import uuid
+import bisect
+import struct
+import re
+import operator
+
+# Optional float image readers for EXR thumbnails - HDR and the formats Qt reads work without them
+try:
+    import OpenImageIO as oiio
+except ImportError:
+    oiio = None
+try:
+    import OpenEXR
+    import Imath
+except ImportError:
+    OpenEXR = None
+    Imath = None
+# Optional - with it, point clouds and splats (.ply, .splat) are previewed in Python instead of by F3D,
+# and float textures are decoded and tone-mapped without per-pixel python loops
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 print("Crate v1.0 by Nicolas Landajo - loading...")
 
@@ -18,114 +53,2033 @@ print("Crate v1.0 by Nicolas Landajo - loading...")
 ASSET_DIR = r"L:/3D Objects"
 F3D_PATH = r"C:\Users\Public\f3d_3DModelBrowser\bin\f3d.exe"
 
+# Shared thumbnail cache - a network path lets every workstation reuse the same renders
+CACHE_DIR = r"S:\01_root\0050_pipeline\0030_software package\0050_nuke\0113_3d object browser\temp_thumbs_cache"
+# Seconds a check of the shared cache or of F3D may take at startup before Crate falls back to a local cache
+PROBE_TIMEOUT_SECONDS = 5
+# Disk budget of the shared cache (None = no limit). A background cleanup removes thumbnails of deleted or changed
+# assets, then the least recently used ones above the budget - every CACHE_GC_HOURS, on one workstation at a time
+CACHE_BUDGET_MB = 20480
+CACHE_GC_HOURS = 24
+
+# Number of F3D renders allowed to run at the same time (None = half of the CPU cores)
+RENDER_WORKERS = None
+# Number of threads reading and decoding thumbnails from the cache
+DECODE_WORKERS = 2
+# F3D timeouts adapt to the format and size of each asset and to past render times, within these bounds
+RENDER_TIMEOUT_MIN_SECONDS = 60
+RENDER_TIMEOUT_MAX_SECONDS = 900
+
+# Assets under these prefixes are copied to a local staging area before F3D opens them
+NETWORK_PATH_PREFIXES = ('L:/', 'L:\\', '\\\\', '//')
+# Disk budget of the local staging area, oldest copies are evicted first
+STAGING_BUDGET_MB = 4096
+# Memory budget of the in-process thumbnail pixmaps, least recently painted are evicted first
+PIXMAP_CACHE_MB = 256
+
+# Watch the folder on screen for published or changed assets - network folders are re-listed every WATCH_POLL_SECONDS
+WATCH_FOLDERS = True
+WATCH_POLL_SECONDS = 15
+# Bring the library-wide search index up to date every N minutes (0 = only once at startup)
+LIBRARY_RECRAWL_MINUTES = 10
+
+# Performance metrics are always shown in the Debug dialog. Set a file to also export them every
+# METRICS_EXPORT_SECONDS - as JSON lines (".jsonl") or as a Prometheus textfile collector file (".prom")
+METRICS_FILE = None
+METRICS_EXPORT_SECONDS = 60
+
+# Comprehensive model formats - Added .splat to the list
+MODEL_FORMATS = {
+    '.obj', '.fbx', '.stl', '.ply', '.dae', '.3ds', '.abc', '.usd', '.usda', '.usdc', '.usdz',
+    '.gltf', '.glb', '.step', '.stp', '.iges', '.igs', '.x3d', '.wrl', '.bgeo', '.bgeo.sc',
+    '.blend', '.lxo', '.c4d', '.ma', '.mb', '.ifc', '.skp', '.vrml', '.ac', '.ase', '.dxf', '.spz', '.splat'
+}
+TEXTURE_FORMATS = {'.exr', '.png', '.jpg', '.jpeg', '.tga', '.tif', '.tiff', '.hdr'}
+# Model formats Crate asks F3D to render thumbnails for - Added .splat to the list
+F3D_FORMATS = {'.obj', '.fbx', '.stl', '.ply', '.gltf', '.glb', '.abc', '.usd', '.usdc', '.splat'}
+
+# F3D arguments used for thumbnail renders - they are part of the cache key, so changing them re-renders
+F3D_RENDER_OPTIONS = ["--no-background"]
+
 print(f"Searching Crate Asset directory: {ASSET_DIR}")
 print(f"Using F3D path: {F3D_PATH}")
+# F3D and the cache directory are checked in the background when the panel opens (see StorageProbe)
 
-# Check if F3D exists
-if not os.path.exists(F3D_PATH):
-    print(f"❌ F3D not found at: {F3D_PATH}")
-else:
-    print("F3D executable found!")
+_f3d_version = None
+_f3d_version_lock = threading.Lock()
 
-class ThumbnailCache:
-    """Cache for storing thumbnails with smart generation strategies"""
+
+def get_f3d_version():
+    """F3D version string, queried once per session - part of every thumbnail cache key"""
+    global _f3d_version
+    with _f3d_version_lock:
+        if _f3d_version is None:
+            try:
+                result = subprocess.run([F3D_PATH, "--version"], capture_output=True, timeout=10, text=True)
+                lines = [line.strip() for line in (result.stdout or result.stderr).splitlines() if line.strip()]
+                _f3d_version = lines[0] if lines else "unknown"
+            except Exception as e:
+                print(f"❌ Could not query F3D version: {e}")
+                _f3d_version = "unknown"
+        return _f3d_version
+
+
+def set_f3d_version(version):
+    """Use this F3D version for the session without asking F3D - when it cannot be reached,
+    so computing a cache key never waits on it"""
+    global _f3d_version
+    with _f3d_version_lock:
+        _f3d_version = version
+
+
+def run_with_timeout(func, timeout, *args):
+    """Call func on a daemon thread and wait for it at most timeout seconds.
+    Raises TimeoutError if it is still blocked (e.g. on an offline share) - the thread is abandoned."""
+    outcome = {}
+    
+    def target():
+        try:
+            outcome["result"] = func(*args)
+        except BaseException as e:
+            outcome["error"] = e
+    
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        raise TimeoutError(f"no answer after {timeout}s")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome.get("result")
+
+
+# Thumbnail pyramid - F3D renders the largest level, the smaller ones are downscaled from it in the same pass.
+# Cells paint the nearest stored level, so zooming never rescales or upscales on the UI thread.
+# The largest level covers the largest cell (200 px at the maximum zoom), bigger renders would never be shown.
+THUMBNAIL_LEVELS = (64, 128, 256)
+
+
+def thumbnail_level(size):
+    """Smallest stored pyramid level at least as large as the requested cell size"""
+    for level in THUMBNAIL_LEVELS:
+        if level >= size:
+            return level
+    return THUMBNAIL_LEVELS[-1]
+
+
+def f3d_render_options():
+    """Full F3D options of a thumbnail render - part of the cache key"""
+    top = THUMBNAIL_LEVELS[-1]
+    return F3D_RENDER_OPTIONS + [f"--resolution={top},{top}"]
+
+# Render priorities - lower numbers are rendered first
+PRIORITY_VISIBLE = 0  # Cell currently on screen
+PRIORITY_NORMAL = 1  # Cell in the current folder but scrolled out of view
+
+
+def default_render_workers():
+    """Number of concurrent F3D renders, tied to the CPU count unless RENDER_WORKERS is set"""
+    if RENDER_WORKERS:
+        return max(1, int(RENDER_WORKERS))
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+class PerfMetrics:
+    """Thread-safe counters and latency histograms of the browser and the thumbnail pipeline"""
+    BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)  # Seconds
+    
     def __init__(self):
-        print("📸 Initializing thumbnail cache...")
-        self.cache = {}
-        self.failed_attempts = {}  # Track failed F3D attempts
-        self.active_generations = {}  # Track ongoing generations
+        self.lock = threading.Lock()
+        self.started_at = time.time()
+        self.counters = collections.Counter()  # (name, labels) -> count
+        self.histograms = {}  # (name, labels) -> {"buckets": [...], "sum": seconds, "count": n}
+    
+    @staticmethod
+    def key(name, labels):
+        return name, tuple(sorted(labels.items()))
+    
+    def count(self, name, amount=1, **labels):
+        with self.lock:
+            self.counters[self.key(name, labels)] += amount
+    
+    def observe(self, name, seconds, **labels):
+        key = self.key(name, labels)
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = {"buckets": [0] * (len(self.BUCKETS) + 1), "sum": 0.0, "count": 0}
+            histogram["buckets"][bisect.bisect_left(self.BUCKETS, seconds)] += 1
+            histogram["sum"] += seconds
+            histogram["count"] += 1
+    
+    @contextlib.contextmanager
+    def timer(self, name, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+    
+    def quantile(self, histogram, q):
+        """Upper bound of the bucket holding the q-quantile"""
+        rank = q * histogram["count"]
+        seen = 0
+        for bound, count in zip(self.BUCKETS, histogram["buckets"]):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+    
+    def snapshot(self):
+        """Everything recorded so far, as plain data"""
+        with self.lock:
+            counters = [{"name": name, "labels": dict(labels), "value": value}
+                        for (name, labels), value in sorted(self.counters.items())]
+            histograms = [{"name": name, "labels": dict(labels), "count": histogram["count"],
+                           "sum": round(histogram["sum"], 6), "buckets": list(histogram["buckets"])}
+                          for (name, labels), histogram in sorted(self.histograms.items())]
+        return {"time": time.time(), "host": socket.gethostname(), "uptime": round(time.time() - self.started_at, 1),
+                "buckets": list(self.BUCKETS), "counters": counters, "histograms": histograms}
+    
+    @staticmethod
+    def label_text(labels):
+        return "{" + ",".join(f"{name}={value}" for name, value in labels.items()) + "}" if labels else ""
+    
+    def summary_lines(self):
+        """Human readable lines for the Debug dialog"""
+        snapshot = self.snapshot()
+        lines = []
+        for counter in snapshot["counters"]:
+            lines.append(f"{counter['name']}{self.label_text(counter['labels'])}: {counter['value']}")
+        for histogram in snapshot["histograms"]:
+            average = histogram["sum"] / histogram["count"] if histogram["count"] else 0.0
+            lines.append(f"{histogram['name']}{self.label_text(histogram['labels'])}: n={histogram['count']} "
+                         f"avg={average * 1000:.0f}ms p50<={self.quantile(histogram, 0.5) * 1000:.0f}ms "
+                         f"p95<={self.quantile(histogram, 0.95) * 1000:.0f}ms")
+        return lines
+    
+    def prometheus_text(self):
+        """Prometheus text exposition format, for the node exporter's textfile collector"""
+        snapshot = self.snapshot()
         
-        # Use network path for shared cache across multiple computers
-        self.cache_dir = r"S:\01_root\0050_pipeline\0030_software package\0050_nuke\0113_3d object browser\temp_thumbs_cache"
+        def labels_text(labels, **extra):
+            labels = dict(labels, **extra)
+            if not labels:
+                return ""
+            return "{" + ",".join(f'{name}="{value}"' for name, value in labels.items()) + "}"
         
-        # Fallback to local temp if network path is not available
-        if not os.path.exists(self.cache_dir):
+        lines = []
+        # Series are sorted by name, so each family is contiguous - its TYPE line goes before its first series
+        typed = set()
+        for counter in snapshot["counters"]:
+            name = f"crate_{counter['name']}_total"
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name}{labels_text(counter['labels'])} {counter['value']}")
+        for histogram in snapshot["histograms"]:
+            name = f"crate_{histogram['name']}"
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} histogram")
+            cumulative = 0
+            for bound, count in zip(self.BUCKETS + ("+Inf",), histogram["buckets"]):
+                cumulative += count
+                lines.append(f"{name}_bucket{labels_text(histogram['labels'], le=bound)} {cumulative}")
+            lines.append(f"{name}_sum{labels_text(histogram['labels'])} {histogram['sum']}")
+            lines.append(f"{name}_count{labels_text(histogram['labels'])} {histogram['count']}")
+        return "\n".join(lines) + "\n"
+    
+    def export(self, path=None):
+        """Append a JSON line snapshot, or rewrite a Prometheus textfile (picked by the file extension)"""
+        path = path or METRICS_FILE
+        if not path:
+            return
+        try:
+            if path.endswith(".prom"):
+                # The collector may read at any time - write aside and rename into place
+                temp_file = f"{path}.{os.getpid()}.tmp"
+                with open(temp_file, 'w') as f:
+                    f.write(self.prometheus_text())
+                os.replace(temp_file, path)
+            else:
+                with open(path, 'a') as f:
+                    f.write(json.dumps(self.snapshot()) + "\n")
+        except OSError as e:
+            print(f"❌ Could not export metrics to {path}: {e}")
+
+
+# One set of metrics per process, recorded from every thread
+metrics = PerfMetrics()
+
+
+class RenderJob:
+    """A single queued thumbnail render for one asset file"""
+    def __init__(self, job_key, file_path, priority, cost=0.0, view=None):
+        self.job_key = job_key
+        self.file_path = file_path
+        self.priority = priority
+        self.cost = cost  # Predicted seconds - cheaper jobs go first within a priority
+        self.view = view  # Folder or search that wants the result, None = wanted whatever is shown
+        self.seq = 0  # Matches the newest heap entry for this job
+        self.running = False
+        self.queued_at = time.perf_counter()
+        self.started_at = None
+        self.cancel_event = threading.Event()  # Set when a running job's result is no longer wanted
+
+
+class RenderScheduler:
+    """Bounded pool of render workers fed by a priority queue, deduplicated per asset"""
+    def __init__(self, render_func, max_workers=None, thread_name="CrateRender"):
+        self.render_func = render_func
+        self.max_workers = max_workers or default_render_workers()
+        self.thread_name = thread_name
+        self._condition = threading.Condition()
+        self._heap = []  # (priority, cost, seq, job_key) - stale entries are skipped when popped
+        self._jobs = {}  # job_key -> RenderJob, queued or running
+        self._counter = itertools.count()
+        self._workers = []
+    
+    def submit(self, job_key, file_path, priority=PRIORITY_NORMAL, cost=0.0, view=None):
+        """Queue a render unless the same asset is already queued or running. Returns True if queued.
+        Jobs run by priority, then cheapest predicted cost first, then in submission order."""
+        with self._condition:
+            job = self._jobs.get(job_key)
+            if job is not None:
+                # Already known - now wanted by this view too, and only ever raise its priority.
+                # A submit without a view keeps the one the job has.
+                if job.view is not None and view is not None:
+                    job.view = view
+                if not job.running and priority < job.priority:
+                    self._push(job, priority)
+                return False
+            
+            job = RenderJob(job_key, file_path, priority, cost, view)
+            self._jobs[job_key] = job
+            self._push(job, priority)
+            self._start_workers()
+            return True
+    
+    def is_pending(self, job_key):
+        """True while a render for this asset is queued or running"""
+        with self._condition:
+            return job_key in self._jobs
+    
+    def pending_count(self):
+        """Number of queued plus running renders"""
+        with self._condition:
+            return len(self._jobs)
+    
+    def running_count(self):
+        """Number of renders currently running"""
+        with self._condition:
+            return sum(1 for job in self._jobs.values() if job.running)
+    
+    def retain_view(self, view, keep_running=None):
+        """Drop queued jobs of other views and cancel their running ones, except those keep_running(job) accepts.
+        Jobs without a view are left alone. Returns (dropped, cancelled) counts."""
+        dropped = cancelled = 0
+        with self._condition:
+            for job_key, job in list(self._jobs.items()):
+                if job.view is None or job.view == view:
+                    continue
+                if not job.running:
+                    del self._jobs[job_key]  # Its heap entry is skipped when popped
+                    dropped += 1
+                elif not job.cancel_event.is_set() and not (keep_running and keep_running(job)):
+                    job.cancel_event.set()
+                    cancelled += 1
+        return dropped, cancelled
+    
+    def clear(self):
+        """Drop every queued job - running renders are left to finish"""
+        with self._condition:
+            self._heap = []
+            for job_key in [key for key, job in self._jobs.items() if not job.running]:
+                del self._jobs[job_key]
+    
+    def _push(self, job, priority):
+        job.priority = priority
+        job.seq = next(self._counter)
+        heapq.heappush(self._heap, (priority, job.cost, job.seq, job.job_key))
+        self._condition.notify()
+    
+    def _start_workers(self):
+        # Workers are started lazily and stay alive waiting for new jobs
+        while len(self._workers) < self.max_workers and len(self._workers) < len(self._jobs):
+            worker = threading.Thread(target=self._worker_loop, daemon=True,
+                                      name=f"{self.thread_name}-{len(self._workers) + 1}")
+            self._workers.append(worker)
+            worker.start()
+    
+    def _next_job(self):
+        with self._condition:
+            while True:
+                while self._heap:
+                    priority, cost, seq, job_key = heapq.heappop(self._heap)
+                    job = self._jobs.get(job_key)
+                    # Skip entries superseded by a re-prioritization or dropped by clear()
+                    if job is None or job.running or job.seq != seq:
+                        continue
+                    job.running = True
+                    job.started_at = time.perf_counter()
+                    return job
+                self._condition.wait()
+    
+    def _worker_loop(self):
+        while True:
+            job = self._next_job()
+            metrics.observe("queue_wait_seconds", time.perf_counter() - job.queued_at, queue=self.thread_name)
             try:
-                os.makedirs(self.cache_dir, exist_ok=True)
-                print(f"💾 Created network cache directory: {self.cache_dir}")
+                self.render_func(job)
             except Exception as e:
-                print(f"❌ Cannot create network cache directory: {e}")
-                # Fallback to local temp directory
-                self.cache_dir = os.path.join(tempfile.gettempdir(), "nuke_3d_thumbnails")
-                os.makedirs(self.cache_dir, exist_ok=True)
-                print(f"🔄 Using local cache directory: {self.cache_dir}")
+                print(f"💥 Render worker error for {os.path.basename(job.file_path)}: {e}")
+            finally:
+                with self._condition:
+                    if self._jobs.get(job.job_key) is job:
+                        del self._jobs[job.job_key]
+
+
+def is_network_path(file_path):
+    """True for assets on the network library, which F3D should read from a local copy"""
+    return file_path.startswith(NETWORK_PATH_PREFIXES)
+
+
+class RenderCancelled(Exception):
+    """A render was stopped because its result is no longer wanted"""
+
+
+class StagingCancelled(RenderCancelled):
+    """A staged copy was cancelled before it completed"""
+
+
+class StagingCache:
+    """Local copies of network assets for F3D, keyed by source identity and bounded by a disk budget (LRU).
+    Repeated renders of the same asset (regenerate, new render settings, Test F3D) reuse the copy."""
+    CHUNK_SIZE = 1024 * 1024
+    
+    def __init__(self, staging_dir, budget_bytes=None):
+        self.staging_dir = staging_dir
+        self.budget_bytes = budget_bytes if budget_bytes is not None else STAGING_BUDGET_MB * 1024 * 1024
+        os.makedirs(self.staging_dir, exist_ok=True)
+        self.lock = threading.Lock()
+        self.key_locks = {}  # staging key -> lock, so one asset is only copied once at a time
+        self.in_use = collections.Counter()  # local path -> renders using it, never evicted
+    
+    def local_path(self, file_path, mtime_ns, file_size):
+        """Where the copy of this exact version of the file lives"""
+        staging_key = hashlib.md5(f"{file_path}|{mtime_ns}|{file_size}".encode()).hexdigest()[:16]
+        return os.path.join(self.staging_dir, staging_key + os.path.splitext(file_path)[1].lower())
+    
+    @contextlib.contextmanager
+    def staged(self, file_path, mtime_ns=None, file_size=None, cancel_event=None):
+        """Context manager yielding a local copy of file_path, protected from eviction while in use"""
+        if mtime_ns is None or file_size is None:
+            stat = os.stat(file_path)
+            mtime_ns, file_size = stat.st_mtime_ns, stat.st_size
+        local_path = self.local_path(file_path, mtime_ns, file_size)
+        
+        with self.lock:
+            key_lock = self.key_locks.setdefault(local_path, threading.Lock())
+            self.in_use[local_path] += 1
+        try:
+            with key_lock:
+                if os.path.exists(local_path) and os.path.getsize(local_path) == file_size:
+                    os.utime(local_path)  # Mark as recently used for the LRU
+                else:
+                    with metrics.timer("staging_copy_seconds"):
+                        self._copy(file_path, local_path, cancel_event)
+                    metrics.count("staging_copy_bytes", file_size)
+                    self.evict()
+            yield local_path
+        finally:
+            with self.lock:
+                self.in_use[local_path] -= 1
+                if self.in_use[local_path] <= 0:
+                    del self.in_use[local_path]
+    
+    def _copy(self, file_path, local_path, cancel_event):
+        """Streamed copy that can be cancelled between chunks - readers never see a partial file"""
+        part_path = f"{local_path}.{os.getpid()}-{threading.get_ident()}.part"
+        try:
+            with open(file_path, 'rb') as src, open(part_path, 'wb') as dst:
+                while True:
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise StagingCancelled(file_path)
+                    chunk = src.read(self.CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+            os.replace(part_path, local_path)
+        finally:
+            if os.path.exists(part_path):
+                try:
+                    os.remove(part_path)
+                except OSError:
+                    pass
+    
+    def evict(self):
+        """Delete least recently used copies until the staging area fits its budget"""
+        try:
+            files = []
+            with os.scandir(self.staging_dir) as it:
+                for dir_entry in it:
+                    if dir_entry.is_file() and not dir_entry.name.endswith('.part'):
+                        stat = dir_entry.stat()
+                        files.append((stat.st_mtime, stat.st_size, dir_entry.path))
+            total = sum(size for _, size, _ in files)
+            with self.lock:
+                in_use = {os.path.normpath(path) for path in self.in_use}
+            for _, size, path in sorted(files):
+                if total <= self.budget_bytes:
+                    break
+                if os.path.normpath(path) in in_use:
+                    continue
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass  # Open in another process (e.g. a bake worker)
+        except OSError as e:
+            print(f"❌ Staging cleanup failed: {e}")
+    
+    def usage(self):
+        """(files, bytes) currently in the staging area"""
+        count = total = 0
+        try:
+            with os.scandir(self.staging_dir) as it:
+                for dir_entry in it:
+                    if dir_entry.is_file():
+                        count += 1
+                        total += dir_entry.stat().st_size
+        except OSError:
+            pass
+        return count, total
+
+
+# Outcomes of ThumbnailRenderer.render()
+RENDER_RENDERED = "rendered"
+RENDER_CACHED = "cached"  # A valid thumbnail for this exact key was already in the cache
+RENDER_TOO_LARGE = "too_large"
+RENDER_TIMEOUT = "timeout"
+RENDER_FAILED = "failed"  # F3D crashed or returned an error
+RENDER_UNSUPPORTED = "unsupported"  # The file could not be read into a thumbnail
+RENDER_CANCELLED = "cancelled"  # Not a failure of the asset, never recorded
+RENDER_BUSY = "busy"  # Another workstation holds the lease, its result is picked up when it lands
+RENDER_SUCCESS = {RENDER_RENDERED, RENDER_CACHED}
+
+
+class RenderLeases:
+    """Claims on renders in the shared cache, so workstations opening the same folder split the work.
+    A lease is a file created atomically (O_EXCL) holding its owner and expiry. Leases of crashed
+    sessions are taken over once expired. Best effort - at worst an asset is rendered twice."""
+    LEASE_SECONDS = RENDER_TIMEOUT_MAX_SECONDS + 600  # Longer than a staged copy plus the longest F3D timeout
+    
+    def __init__(self, leases_dir):
+        self.leases_dir = leases_dir
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self.lock = threading.Lock()
+        self.tokens = {}  # thumb key -> token of the leases this session holds
+    
+    def lease_path(self, thumb_key):
+        return os.path.join(self.leases_dir, f"{thumb_key}.lease")
+    
+    def read(self, thumb_key):
+        """Current lease of a key, or None"""
+        try:
+            with open(self.lease_path(thumb_key)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def acquire(self, thumb_key):
+        """Claim the render of a key. Returns False while another live session holds it."""
+        lease_file = self.lease_path(thumb_key)
+        token = uuid.uuid4().hex
+        now = time.time()
+        lease = {"owner": self.owner, "token": token, "acquired_at": now, "expires_at": now + self.LEASE_SECONDS}
+        for _ in range(2):
+            try:
+                os.makedirs(self.leases_dir, exist_ok=True)
+                fd = os.open(lease_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                current = self.read(thumb_key)
+                if current is None:
+                    # Being written right now, or left empty by a crash - judge it by its age
+                    try:
+                        expires_at = os.path.getmtime(lease_file) + self.LEASE_SECONDS
+                    except OSError:
+                        continue  # Released in the meantime
+                    current = {"owner": "unknown", "expires_at": expires_at}
+                if current.get("expires_at", 0) > time.time():
+                    return False
+                print(f"♻️  Taking over expired render lease of {current.get('owner')}")
+                try:
+                    os.remove(lease_file)
+                except OSError:
+                    pass
+                continue
+            except OSError as e:
+                # Cannot coordinate (e.g. read-only cache) - render anyway
+                print(f"⚠️  Cannot create render lease: {e}")
+                return True
+            with os.fdopen(fd, 'w') as f:
+                json.dump(lease, f)
+            with self.lock:
+                self.tokens[thumb_key] = token
+            return True
+        return False
+    
+    def release(self, thumb_key):
+        """Drop a lease this session holds"""
+        with self.lock:
+            token = self.tokens.pop(thumb_key, None)
+        if token is None:
+            return
+        current = self.read(thumb_key)
+        if current is not None and current.get("token") == token:
+            try:
+                os.remove(self.lease_path(thumb_key))
+            except OSError:
+                pass
+
+
+class FailureLog:
+    """Failed renders recorded next to the shared cache - one small JSON file per asset, shared by every workstation.
+    A failure is retried after a delay that doubles with each attempt, and right away once the source file
+    changes (the record is tied to the cache key, which includes the file's mtime and size)."""
+    # First retry delay in hours per failure class, None = only retried once the file changes
+    RETRY_HOURS = {RENDER_TIMEOUT: 6, RENDER_FAILED: 1, RENDER_TOO_LARGE: None, RENDER_UNSUPPORTED: None}
+    MAX_RETRY_HOURS = 24 * 7
+    
+    def __init__(self, failures_dir):
+        self.failures_dir = failures_dir
+        self.lock = threading.Lock()
+        self.records = {}  # file path -> record, or None when it has none
+    
+    def record_path(self, file_path):
+        return os.path.join(self.failures_dir, f"{ThumbnailCache.path_hash(file_path)}.json")
+    
+    def load(self, file_path):
+        """Failure record of a file, read from the shared cache the first time it is asked for"""
+        with self.lock:
+            if file_path in self.records:
+                return self.records[file_path]
+        try:
+            with open(self.record_path(file_path)) as f:
+                record = json.load(f)
+            if record.get("path") != file_path:
+                record = None  # Another file with the same path hash
+        except (OSError, ValueError):
+            record = None
+        with self.lock:
+            self.records[file_path] = record
+        return record
+    
+    def blocks(self, file_path, thumb_key, load=True):
+        """True while a failure of this exact file version waits for its retry time.
+        With load=False only records already in memory are looked at (no disk access, for the GUI thread)."""
+        if load:
+            record = self.load(file_path)
         else:
-            print(f"💾 Using network cache directory: {self.cache_dir}")
+            with self.lock:
+                record = self.records.get(file_path)
+        if not record or record["thumb_key"] != thumb_key:
+            return False
+        return record["retry_after"] is None or time.time() < record["retry_after"]
+    
+    def record(self, file_path, thumb_key, outcome, identity, **details):
+        """Record a failed render, backing off further if the same file version failed before.
+        details (e.g. the timeout used) are stored with the record."""
+        previous = self.load(file_path)
+        attempts = previous["attempts"] + 1 if previous and previous["thumb_key"] == thumb_key else 1
+        now = time.time()
+        hours = self.RETRY_HOURS.get(outcome, 1)
+        if hours is not None:
+            hours = min(self.MAX_RETRY_HOURS, hours * 2 ** (attempts - 1))
+        record = {
+            "path": file_path,
+            "thumb_key": thumb_key,
+            "class": outcome,
+            "attempts": attempts,
+            "failed_at": now,
+            "retry_after": None if hours is None else now + hours * 3600,
+            "host": socket.gethostname(),
+            "identity": identity,
+        }
+        record.update(details)
+        with self.lock:
+            self.records[file_path] = record
         
-        # Create temp directory for network file processing (local to each machine)
-        self.temp_dir = os.path.join(tempfile.gettempdir(), "nuke_3d_temp")
-        os.makedirs(self.temp_dir, exist_ok=True)
+        record_file = self.record_path(file_path)
+        temp_file = f"{record_file}.{os.getpid()}-{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.failures_dir, exist_ok=True)
+            with open(temp_file, 'w') as f:
+                json.dump(record, f, indent=1)
+            os.replace(temp_file, record_file)
+        except OSError as e:
+            print(f"❌ Could not record failure of {os.path.basename(file_path)}: {e}")
+        return record
+    
+    def clear(self, file_path):
+        """Forget the failure of a file once it rendered"""
+        if self.load(file_path) is None:
+            return
+        with self.lock:
+            self.records[file_path] = None
+        try:
+            os.remove(self.record_path(file_path))
+        except OSError:
+            pass
+    
+    def count(self):
+        """Number of failures known to this session"""
+        with self.lock:
+            return sum(1 for record in self.records.values() if record)
+
+
+class RenderCostModel:
+    """Predicts how long a thumbnail render takes from the asset's format and size class, learning from past
+    renders. Cheap renders are queued first and F3D timeouts scale with the prediction.
+    The history is shared next to the cache: sessions add what they measured to the file, nothing is overwritten."""
+    # Seconds of an F3D render with nothing recorded yet: a per format base plus time to load the file
+    BASE_SECONDS = {'.abc': 4.0, '.usd': 4.0, '.usdc': 4.0, '.usdz': 4.0, '.fbx': 3.0, '.gltf': 2.0, '.glb': 2.0,
+                    '.obj': 1.5, '.ply': 1.5, '.splat': 2.0, '.stl': 1.0}
+    DEFAULT_BASE_SECONDS = 2.0
+    TEXTURE_SECONDS = 0.2
+    SECONDS_PER_MB = 0.05
+    SIZE_CLASSES_MB = (1, 10, 100, 1000)  # Upper bounds of the size classes, the last class is open
+    PRIOR_WEIGHT = 1  # How many renders the default guess counts for once history comes in
+    HISTORY_LIMIT = 500  # Renders per class before older ones count half - follows F3D and hardware changes
+    TIMEOUT_FACTOR = 4  # Timeout = this many times the predicted seconds...
+    TIMEOUT_MAX_FACTOR = 2  # ...and at least this many times the slowest successful render of the class
+    SAVE_SECONDS = 30
+    
+    def __init__(self, history_file):
+        self.history_file = history_file
+        self.lock = threading.Lock()
+        self.history = {}  # "ext size class" -> stats, as last read from the file plus what this session added
+        self.pending = {}  # Stats added since the last save
+        self.saved_at = time.time()
+    
+    @classmethod
+    def size_class(cls, size):
+        """Label of the size class of a file size in bytes, e.g. '<10MB'"""
+        size_mb = (size or 0) / (1024 * 1024)
+        for bound in cls.SIZE_CLASSES_MB:
+            if size_mb < bound:
+                return f"<{bound}MB" if bound < 1000 else f"<{bound // 1000}GB"
+        return f">={cls.SIZE_CLASSES_MB[-1] // 1000}GB"
+    
+    @classmethod
+    def default_seconds(cls, ext, size):
+        if ext in TEXTURE_FORMATS:
+            return cls.TEXTURE_SECONDS
+        return cls.BASE_SECONDS.get(ext, cls.DEFAULT_BASE_SECONDS) + (size or 0) / (1024 * 1024) * cls.SECONDS_PER_MB
+    
+    def predict(self, ext, size):
+        """Expected seconds to render an asset - the recorded average of its class, pulled toward the default guess
+        while there are few renders"""
+        default = self.default_seconds(ext, size)
+        with self.lock:
+            stats = self.history.get(f"{ext} {self.size_class(size)}")
+        if not stats or not stats["renders"]:
+            return default
+        return (stats["seconds"] + default * self.PRIOR_WEIGHT) / (stats["renders"] + self.PRIOR_WEIGHT)
+    
+    def timeout(self, ext, size, previous_timeouts=0):
+        """F3D timeout for an asset: a multiple of its prediction, doubled for every earlier timeout of the same file"""
+        with self.lock:
+            stats = self.history.get(f"{ext} {self.size_class(size)}") or {}
+        timeout = max(self.TIMEOUT_FACTOR * self.predict(ext, size),
+                      self.TIMEOUT_MAX_FACTOR * stats.get("max", 0), RENDER_TIMEOUT_MIN_SECONDS)
+        return min(RENDER_TIMEOUT_MAX_SECONDS, timeout * 2 ** previous_timeouts)
+    
+    def record(self, ext, size, outcome, seconds, predicted):
+        """Learn from a finished render. Timeouts count as renders of the timeout length - the asset takes longer."""
+        if outcome not in (RENDER_RENDERED, RENDER_TIMEOUT, RENDER_FAILED, RENDER_UNSUPPORTED):
+            return
+        key = f"{ext} {self.size_class(size)}"
+        with self.lock:
+            for stats_by_key in (self.history, self.pending):
+                stats = stats_by_key.setdefault(key, self.empty_stats())
+                stats[outcome] += 1
+                if outcome in (RENDER_RENDERED, RENDER_TIMEOUT):
+                    stats["renders"] += 1
+                    stats["seconds"] += seconds
+                    stats["predicted"] += predicted
+                if outcome == RENDER_RENDERED:
+                    stats["max"] = max(stats["max"], seconds)
+            save = time.time() - self.saved_at > self.SAVE_SECONDS
+        metrics.observe("render_prediction_error_seconds", abs(seconds - predicted), format=ext)
+        if save:
+            self.save()
+    
+    @staticmethod
+    def empty_stats():
+        return {"renders": 0, "seconds": 0.0, "predicted": 0.0, "max": 0.0,
+                RENDER_RENDERED: 0, RENDER_TIMEOUT: 0, RENDER_FAILED: 0, RENDER_UNSUPPORTED: 0}
+    
+    def read_file(self):
+        try:
+            with open(self.history_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def load(self):
+        """Read the shared history - call off the GUI thread, the cache may be on a share"""
+        history = self.read_file()
+        with self.lock:
+            self.history = self.merged(history, self.pending)
+    
+    def save(self):
+        """Add this session's new stats to the shared history file (read, add, atomically replace)"""
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            self.saved_at = time.time()
+        if not pending:
+            return
+        history = self.merged(self.read_file(), pending)
+        for stats in history.values():
+            if stats["renders"] > self.HISTORY_LIMIT:
+                for field in ("renders", "seconds", "predicted"):
+                    stats[field] /= 2
+        temp_file = f"{self.history_file}.{os.getpid()}-{threading.get_ident()}.tmp"
+        try:
+            with open(temp_file, 'w') as f:
+                json.dump(history, f, indent=1)
+            os.replace(temp_file, self.history_file)
+        except OSError as e:
+            print(f"❌ Could not save render history: {e}")
+            with self.lock:
+                self.pending = self.merged(pending, self.pending)
+            return
+        with self.lock:
+            self.history = self.merged(history, self.pending)
+    
+    @classmethod
+    def merged(cls, history, added):
+        """Stats of history with the stats of added summed in"""
+        result = {key: dict(stats) for key, stats in history.items()}
+        for key, stats in added.items():
+            total = result.setdefault(key, cls.empty_stats())
+            for field, value in stats.items():
+                total[field] = max(total.get(field, 0), value) if field == "max" else total.get(field, 0) + value
+        return result
+    
+    def summary_lines(self, limit=10):
+        """Most rendered classes with their average and predicted seconds, for the Debug dialog"""
+        with self.lock:
+            classes = sorted(self.history.items(), key=lambda item: -item[1]["renders"])[:limit]
+        lines = []
+        for key, stats in classes:
+            if not stats["renders"]:
+                continue
+            renders = stats["renders"]
+            lines.append(f"{key}: {stats[RENDER_RENDERED]} rendered, {stats[RENDER_TIMEOUT]} timed out, "
+                         f"avg {stats['seconds'] / renders:.1f}s (predicted {stats['predicted'] / renders:.1f}s), "
+                         f"max {stats['max']:.1f}s")
+        return lines
+
+
+class TextureReader:
+    """Reads textures straight at thumbnail size into a QImage - safe off the GUI thread.
+    Float formats (EXR, HDR) are read from a lower mip level or a subset of their scanlines and tone-mapped."""
+    FLOAT_FORMATS = {'.exr', '.hdr'}
+    
+    @classmethod
+    def read(cls, file_path, max_size):
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext not in cls.FLOAT_FORMATS:
+            return cls.read_qt(file_path, max_size)
         
-        # Verify we can write to cache directory
-        test_file = os.path.join(self.cache_dir, "test_write.tmp")
+        pixels = None
         try:
-            with open(test_file, 'w') as f:
-                f.write("test")
-            os.remove(test_file)
-            print("✅ Cache directory is writable")
+            if oiio is not None:
+                pixels = cls.read_oiio(file_path, max_size)
+            elif ext == '.exr' and OpenEXR is not None:
+                pixels = cls.read_openexr(file_path, max_size)
+            elif ext == '.hdr':
+                pixels = cls.read_hdr(file_path, max_size)
         except Exception as e:
-            print(f"❌ Cache directory not writable: {e}")
-            # Fallback to user's home directory if neither network nor temp is available
-            self.cache_dir = os.path.expanduser("~/nuke_3d_thumbnails")
-            os.makedirs(self.cache_dir, exist_ok=True)
-            print(f"🔄 Using fallback cache directory: {self.cache_dir}")
-    
-    def get_thumbnail(self, file_path, size=128):
-        """Get colored icon based on file type, or actual image preview for textures"""
+            print(f"❌ Error reading {os.path.basename(file_path)}: {e}")
+        if pixels is None:
+            # Last resort - an image format plugin of the Qt build may know the format
+            return cls.read_qt(file_path, max_size)
+        return cls.tone_map(*pixels)
+    
+    @staticmethod
+    def read_qt(file_path, max_size):
+        """Formats Qt reads - decoded at reduced size where the format supports it (e.g. JPEG)"""
+        reader = QtGui.QImageReader(file_path)
+        source_size = reader.size()
+        if source_size.isValid() and (source_size.width() > max_size or source_size.height() > max_size):
+            reader.setScaledSize(source_size.scaled(max_size, max_size, QtCore.Qt.KeepAspectRatio))
+        image = reader.read()
+        if image.isNull():
+            return None
+        if image.width() > max_size or image.height() > max_size:
+            image = image.scaled(max_size, max_size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+        return image
+    
+    @staticmethod
+    def sample_step(width, height, max_size):
+        """Keep every n-th row and column so the result fits in max_size"""
+        return max(1, math.ceil(max(width, height) / max_size))
+    
+    @classmethod
+    def read_oiio(cls, file_path, max_size):
+        """OpenImageIO - picks the smallest mip level that still covers max_size"""
+        image_input = oiio.ImageInput.open(file_path)
+        if not image_input:
+            return None
+        try:
+            miplevel = 0
+            while image_input.seek_subimage(0, miplevel + 1):
+                spec = image_input.spec()
+                if max(spec.width, spec.height) < max_size:
+                    break
+                miplevel += 1
+            image_input.seek_subimage(0, miplevel)
+            spec = image_input.spec()
+            channels = min(3, spec.nchannels)
+            data = image_input.read_image(0, miplevel, 0, channels, "float")
+        finally:
+            image_input.close()
+        if data is None:
+            return None
+        step = cls.sample_step(spec.width, spec.height, max_size)
+        data = data.reshape(spec.height, spec.width, channels)[::step, ::step]
+        if channels < 3:
+            data = data[:, :, :1].repeat(3, axis=2)
+        return data.shape[1], data.shape[0], data.astype(np.float32)  # OpenImageIO returns numpy arrays
+    
+    @classmethod
+    def read_openexr(cls, file_path, max_size):
+        """OpenEXR python bindings - only every n-th scanline is read and decompressed"""
+        exr_file = OpenEXR.InputFile(file_path)
+        try:
+            header = exr_file.header()
+            data_window = header['dataWindow']
+            width = data_window.max.x - data_window.min.x + 1
+            height = data_window.max.y - data_window.min.y + 1
+            names = [name for name in ('R', 'G', 'B') if name in header['channels']]
+            if len(names) < 3:
+                # Grey or single channel images (Y, Z, masks...) - show their first channel
+                names = [names[0] if names else sorted(header['channels'])[0]] * 3
+            
+            step = cls.sample_step(width, height, max_size)
+            pixel_type = Imath.PixelType(Imath.PixelType.FLOAT)
+            pixels = [] if np is not None else array.array('f')
+            rows = 0
+            for y in range(data_window.min.y, data_window.max.y + 1, step):
+                channels = exr_file.channels(names, pixel_type, y, y)
+                if np is not None:
+                    pixels.append(np.stack([np.frombuffer(data, np.float32)[::step] for data in channels], axis=1))
+                else:
+                    for rgb in zip(*(array.array('f', data)[::step] for data in channels)):
+                        pixels.extend(rgb)
+                rows += 1
+        finally:
+            exr_file.close()
+        if np is not None:
+            pixels = np.stack(pixels)
+            return pixels.shape[1], pixels.shape[0], pixels
+        return len(pixels) // (3 * rows), rows, pixels
+    
+    @classmethod
+    def read_hdr(cls, file_path, max_size):
+        """Radiance RGBE reader - rows that are not sampled are only skipped, not decoded"""
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            # Header lines end with an empty line, followed by the resolution line e.g. "-Y 2048 +X 4096"
+            pos = data.find(b"\n\n")
+            if not data[:2] == b"#?" or pos < 0:
+                return None
+            end = data.find(b"\n", pos + 2)
+            resolution = data[pos + 2:end].split()
+            if len(resolution) != 4 or resolution[0][1:] != b"Y":
+                return None
+            height, width = int(resolution[1]), int(resolution[3])
+            pos = end + 1
+            
+            step = cls.sample_step(width, height, max_size)
+            # "+Y" files store the bottom row first
+            bottom_up = resolution[0][:1] == b"+"
+            if np is not None and len(data) - pos == 4 * width * height and not cls.hdr_is_rle(data, pos, width):
+                # Uncompressed - the sampled pixels are sliced straight out of the file
+                rgbe = np.frombuffer(data, np.uint8, 4 * width * height, pos).reshape(height, width, 4)[::step, ::step]
+                pixels = cls.hdr_decode(rgbe, bottom_up)
+                del rgbe  # The file cannot be unmapped while a view of it is alive
+                return pixels
+            
+            rows = []
+            for y in range(height):
+                keep = y % step == 0
+                channels, pos = cls.hdr_scanline(data, pos, width, keep)
+                if keep:
+                    rows.append(channels)
+        if bottom_up:
+            rows.reverse()
+        if np is not None:
+            # (rows, 4 components, width) to (rows, width, RGBE)
+            rgbe = np.array([[np.frombuffer(bytes(channel), np.uint8) for channel in channels] for channels in rows])
+            return cls.hdr_decode(rgbe.transpose(0, 2, 1)[:, ::step], False)
+        
+        scale = [math.ldexp(1.0, exponent - 136) for exponent in range(256)]
+        pixels = array.array('f')
+        for channels in rows:
+            for r, g, b, e in zip(*(channel[::step] for channel in channels)):
+                factor = scale[e] if e else 0.0
+                pixels.extend((r * factor, g * factor, b * factor))
+        return len(pixels) // (3 * len(rows)), len(rows), pixels
+    
+    @staticmethod
+    def hdr_decode(rgbe, bottom_up):
+        """RGBE bytes (rows, columns, 4) to linear float RGB with numpy - a copy, safe once the file is closed"""
+        exponent = rgbe[..., 3].astype(np.int32)
+        factor = np.where(exponent > 0, np.ldexp(1.0, exponent - 136), 0.0).astype(np.float32)
+        pixels = rgbe[..., :3].astype(np.float32) * factor[..., None]
+        if bottom_up:
+            pixels = pixels[::-1]
+        return pixels.shape[1], pixels.shape[0], pixels
+    
+    @staticmethod
+    def hdr_is_rle(data, pos, width):
+        """True if the scanline at pos is run-length encoded"""
+        return 8 <= width < 0x8000 and data[pos] == 2 and data[pos + 1] == 2 and not data[pos + 2] & 0x80
+    
+    @staticmethod
+    def hdr_scanline(data, pos, width, keep):
+        """One RGBE scanline: (r, g, b, e byte strings or None when not kept, next position)"""
+        if not TextureReader.hdr_is_rle(data, pos, width):
+            # Flat scanline
+            end = pos + 4 * width
+            if not keep:
+                return None, end
+            row = data[pos:end]
+            return [row[0::4], row[1::4], row[2::4], row[3::4]], end
+        
+        # Run-length encoded scanline, each of the four components is stored in turn
+        pos += 4
+        channels = []
+        for _ in range(4):
+            channel = bytearray()
+            x = 0
+            while x < width:
+                count = data[pos]
+                if count > 128:
+                    count -= 128
+                    if keep:
+                        channel += bytes((data[pos + 1],)) * count
+                    pos += 2
+                else:
+                    if keep:
+                        channel += data[pos + 1:pos + 1 + count]
+                    pos += 1 + count
+                x += count
+            channels.append(channel)
+        return (channels if keep else None), pos
+    
+    @staticmethod
+    def tone_map(width, height, pixels):
+        """Linear float RGB (numpy array or array('f')) to an 8 bit display image - Reinhard curve and 2.2 gamma"""
+        gamma = 1.0 / 2.2
+        if np is not None:
+            values = np.asarray(pixels, np.float32).reshape(-1)
+            with np.errstate(all="ignore"):
+                mapped = np.where(values < 1e30, values / (1.0 + values), 1.0)
+                # Comparisons with NaN are false, so NaNs turn black like negative values
+                out = np.where(values > 0.0, 255.0 * mapped ** gamma + 0.5, 0.0).astype(np.uint8).tobytes()
+        else:
+            out = bytearray(len(pixels))
+            for i, value in enumerate(pixels):
+                if value > 0.0:  # Also drops NaNs
+                    out[i] = int(255.0 * (value / (1.0 + value) if value < 1e30 else 1.0) ** gamma + 0.5)
+        # QImage does not keep its buffer alive - hold it until the copy owns the pixels
+        data = bytes(out)
+        image = QtGui.QImage(data, width, height, 3 * width, QtGui.QImage.Format_RGB888)
+        return image.copy()
+
+
+class PointCloudReader:
+    """Previews point clouds and gaussian splats (.ply, .splat) without F3D - safe off the GUI thread.
+    The file is memory-mapped and only a strided sample of its points is read, so even huge captures
+    on the network get a thumbnail in a fraction of a second, without a local copy. Needs numpy."""
+    FORMATS = {'.ply', '.splat'}
+    MAX_POINTS = 200000  # Points sampled from a file, whatever its size
+    PREVIEW_SIZE = THUMBNAIL_LEVELS[-1]  # Stored as the top pyramid level, like an F3D render
+    # .splat records: position 3 x float32, scale 3 x float32, color RGBA 4 x uint8, rotation 4 x uint8
+    SPLAT_DTYPE = [('position', '<f4', 3), ('scale', '<f4', 3), ('color', 'u1', 4), ('rotation', 'u1', 4)]
+    PLY_TYPES = {
+        'char': 'i1', 'int8': 'i1', 'uchar': 'u1', 'uint8': 'u1', 'short': 'i2', 'int16': 'i2',
+        'ushort': 'u2', 'uint16': 'u2', 'int': 'i4', 'int32': 'i4', 'uint': 'u4', 'uint32': 'u4',
+        'float': 'f4', 'float32': 'f4', 'double': 'f8', 'float64': 'f8',
+    }
+    SH_C0 = 0.28209479177387814  # Zeroth spherical harmonic - turns a splat's f_dc_* into its base color
+    
+    @classmethod
+    def can_read(cls, file_path):
+        return np is not None and os.path.splitext(file_path)[1].lower() in cls.FORMATS
+    
+    @classmethod
+    def read(cls, file_path, size=None):
+        """Preview QImage of the points of a file, or None if this reader does not handle it
+        (ASCII or mesh PLY files are left to F3D)"""
+        size = size or cls.PREVIEW_SIZE
         ext = os.path.splitext(file_path)[1].lower()
-        texture_formats = {'.exr', '.png', '.jpg', '.jpeg', '.tga', '.tif', '.tiff', '.hdr'}
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                # Every array below is a copy - nothing may point into the map once it is closed
+                points = cls.read_splat(data) if ext == '.splat' else cls.read_ply(data)
+        if points is None:
+            return None
+        return cls.project(*points, size)
+    
+    @classmethod
+    def sample(cls, data, dtype, count, offset=0):
+        """Every n-th record of a binary table, so at most MAX_POINTS are read from the map"""
+        step = max(1, count // cls.MAX_POINTS)
+        return np.frombuffer(data, dtype=dtype, count=count, offset=offset)[::step]
+    
+    @classmethod
+    def read_splat(cls, data):
+        """(positions, colors, alphas, is splat) from a .splat file - fixed size records, no header"""
+        dtype = np.dtype(cls.SPLAT_DTYPE)
+        count = len(data) // dtype.itemsize
+        if not count:
+            return None
+        records = cls.sample(data, dtype, count)
+        colors = records['color'].astype(np.float32) / 255.0
+        return records['position'].astype(np.float32), colors[:, :3], colors[:, 3], True
+    
+    @classmethod
+    def read_ply(cls, data):
+        """(positions, colors, alphas, is splat) from a binary PLY, or None for ASCII PLY and meshes"""
+        end = data.find(b"end_header", 0, 1 << 16)
+        if not data[:3] == b"ply" or end < 0:
+            return None
+        header_end = data.find(b"\n", end) + 1
         
-        # Create a UNIQUE key based on the file's full path and size
-        path_hash = hashlib.md5(file_path.encode()).hexdigest()[:12]  # Create a short unique hash from the full path
-        cache_key = f"{path_hash}_{size}"
-        cache_file = os.path.join(self.cache_dir, f"{path_hash}_{size}.png")
+        # Elements in file order: [name, count, [(property, numpy type)], has list properties]
+        elements = []
+        binary_format = None
+        for line in data[:header_end].decode('ascii', 'replace').splitlines():
+            words = line.split()
+            if not words:
+                continue
+            if words[0] == "format":
+                binary_format = {"binary_little_endian": "<", "binary_big_endian": ">"}.get(words[1])
+            elif words[0] == "element":
+                elements.append([words[1], int(words[2]), [], False])
+            elif words[0] == "property" and elements:
+                if words[1] == "list":
+                    elements[-1][3] = True
+                elif words[1] in cls.PLY_TYPES:
+                    elements[-1][2].append((words[2], binary_format or "<", cls.PLY_TYPES[words[1]]))
+                else:
+                    return None
+        if binary_format is None:
+            return None
+        if any(name == "face" and count for name, count, _, _ in elements):
+            return None  # A mesh - F3D renders its surface
         
-        # Return cached thumbnail if exists in memory
-        if cache_key in self.cache:
-            return self.cache[cache_key]
-        
-        # Check if a base thumbnail exists on disk (even after Nuke restart)
-        # First try to find the largest available thumbnail for this file
-        base_sizes = [256, 128, 100]  # Ordered from largest to smallest
-        base_thumbnail = None
-        base_size = None
-        
-        for base_size in base_sizes:
-            base_cache_file = os.path.join(self.cache_dir, f"{path_hash}_{base_size}.png")
-            if os.path.exists(base_cache_file) and (time.time() - os.path.getmtime(base_cache_file)) < 604800:
+        # Skip the elements stored before the vertices, as long as their records have a fixed size
+        offset = header_end
+        for name, count, properties, has_list in elements:
+            if has_list:
+                return None
+            dtype = np.dtype([(prop, endian + kind) for prop, endian, kind in properties])
+            if name == "vertex":
+                break
+            offset += count * dtype.itemsize
+        else:
+            return None
+        names = set(dtype.names or ())
+        if not {"x", "y", "z"} <= names or not count or offset + count * dtype.itemsize > len(data):
+            return None
+        
+        vertices = cls.sample(data, dtype, count, offset)
+        positions = np.stack([vertices[axis] for axis in "xyz"], axis=1).astype(np.float32)
+        splat = {"f_dc_0", "f_dc_1", "f_dc_2"} <= names
+        if splat:
+            colors = 0.5 + cls.SH_C0 * np.stack([vertices[f"f_dc_{i}"] for i in range(3)], axis=1)
+        elif {"red", "green", "blue"} <= names:
+            colors = np.stack([vertices[channel] for channel in ("red", "green", "blue")], axis=1).astype(np.float32)
+            if vertices["red"].dtype.kind in "iu":
+                colors /= np.iinfo(vertices["red"].dtype).max
+        else:
+            colors = None
+        if "opacity" in names:
+            # Stored as a logit
+            alphas = 1.0 / (1.0 + np.exp(-vertices["opacity"].astype(np.float32)))
+        elif "alpha" in names:
+            alphas = vertices["alpha"].astype(np.float32) / (255.0 if vertices["alpha"].dtype.kind in "iu" else 1.0)
+        else:
+            alphas = np.ones(len(positions), np.float32)
+        return positions, (None if colors is None else np.clip(colors, 0.0, 1.0).astype(np.float32)), alphas, splat
+    
+    @staticmethod
+    def view_rotation(splat):
+        """Three quarter view from slightly above - splat captures are stored Y down (COLMAP convention)"""
+        yaw, pitch = math.radians(35.0), math.radians(25.0)
+        rotate_y = np.array([[math.cos(yaw), 0, math.sin(yaw)], [0, 1, 0], [-math.sin(yaw), 0, math.cos(yaw)]])
+        rotate_x = np.array([[1, 0, 0], [0, math.cos(pitch), -math.sin(pitch)], [0, math.sin(pitch), math.cos(pitch)]])
+        rotation = rotate_x @ rotate_y
+        if splat:
+            rotation = rotation @ np.diag([1.0, -1.0, -1.0])
+        return rotation.astype(np.float32)
+    
+    @classmethod
+    def project(cls, positions, colors, alphas, splat, size):
+        """Draw the points from an auto-fitted orthographic camera, nearest point wins per pixel"""
+        keep = np.isfinite(positions).all(axis=1) & (alphas > 0.1)
+        if colors is not None:
+            keep &= np.isfinite(colors).all(axis=1)
+        positions = positions[keep]
+        if not len(positions):
+            return None
+        
+        # Frame the bulk of the points - splat captures have stray points far away from the subject
+        low, high = np.percentile(positions, [2, 98], axis=0)
+        inside = np.all((positions >= low) & (positions <= high), axis=1)
+        positions = positions[inside] - (low + high) / 2
+        view = positions @ cls.view_rotation(splat).T
+        extent = float(np.abs(view[:, :2]).max()) or 1.0
+        scale = (size / 2 - 2) / extent
+        x = (view[:, 0] * scale + size / 2).astype(np.int32)
+        y = (size / 2 - view[:, 1] * scale).astype(np.int32)
+        depth = view[:, 2]  # The camera looks down -Z, larger is nearer
+        
+        if colors is None:
+            # No colors in the file - shade by depth
+            shade = 0.35 + 0.65 * (depth - depth.min()) / (float(np.ptp(depth)) or 1.0)
+            colors = np.repeat(shade[:, None], 3, axis=1)
+        else:
+            colors = colors[keep][inside]
+        rgba = np.empty((len(positions), 4), np.uint8)
+        rgba[:, :3] = (colors * 255.0 + 0.5).astype(np.uint8)
+        rgba[:, 3] = 255
+        
+        # Sparse clouds are drawn with 2x2 pixel points so the shape still reads
+        if len(positions) < size * size // 2:
+            x = np.concatenate([x, x + 1, x, x + 1])
+            y = np.concatenate([y, y, y + 1, y + 1])
+            depth = np.tile(depth, 4)
+            rgba = np.tile(rgba, (4, 1))
+        valid = (x >= 0) & (x < size) & (y >= 0) & (y < size)
+        pixel = (y * size + x)[valid]
+        depth, rgba = depth[valid], rgba[valid]
+        
+        # Sort by pixel then depth, the last point of every pixel is the nearest one
+        order = np.lexsort((depth, pixel))
+        nearest = order[np.append(pixel[order][1:] != pixel[order][:-1], True)]
+        buffer = np.zeros((size * size, 4), np.uint8)  # Transparent, like F3D's --no-background
+        buffer[pixel[nearest]] = rgba[nearest]
+        # QImage does not keep its buffer alive - hold it until the copy owns the pixels
+        data = buffer.tobytes()
+        image = QtGui.QImage(data, size, size, 4 * size, QtGui.QImage.Format_RGBA8888)
+        return image.copy()
+
+
+class ThumbnailRenderer:
+    """Renders thumbnails with F3D into the cache directory.
+    Needs no GUI, so the panel and the headless crate_bake.py share the same cache layout."""
+    CANCEL_POLL_SECONDS = 0.25  # How often a running F3D checks whether its render was cancelled
+    STOP_GRACE_SECONDS = 2  # Time F3D gets to quit on a cancel or timeout before it is killed
+    
+    def __init__(self, cache_dir, temp_dir, staging=None, failures=None, f3d_available=True):
+        self.cache_dir = cache_dir
+        self.temp_dir = temp_dir
+        self.f3d_available = f3d_available  # Without F3D only textures and point clouds are rendered
+        self.staging = staging or StagingCache(os.path.join(temp_dir, "staging"))
+        self.failures = failures or FailureLog(os.path.join(cache_dir, "failures"))
+        self.leases = RenderLeases(os.path.join(cache_dir, "leases"))
+        # Render time history - load() it off the GUI thread, predictions use format defaults until then
+        self.costs = RenderCostModel(os.path.join(cache_dir, "render_costs.json"))
+    
+    def thumbnail_path(self, thumb_key, size=THUMBNAIL_LEVELS[-1]):
+        return os.path.join(self.cache_dir, f"{thumb_key}_{size}.png")
+    
+    def sidecar_path(self, thumb_key):
+        return os.path.join(self.cache_dir, f"{thumb_key}.json")
+    
+    def is_cached(self, thumb_key):
+        """True if the whole readable pyramid exists for this exact key"""
+        cache_file = self.thumbnail_path(thumb_key)
+        if not os.path.exists(cache_file) or not QtGui.QImageReader(cache_file).canRead():
+            return False
+        return all(os.path.exists(self.thumbnail_path(thumb_key, level)) for level in THUMBNAIL_LEVELS[:-1])
+    
+    @staticmethod
+    def temp_name(path):
+        """Unique name next to a cache file to write it under before renaming it into place"""
+        return f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    
+    def publish_image(self, image, path):
+        """Write an image under a temporary name and atomically rename it into place"""
+        temp_file = self.temp_name(path)
+        try:
+            if not image.save(temp_file, "PNG"):
+                print(f"❌ Could not write {temp_file}")
+                return False
+            os.replace(temp_file, path)
+            return True
+        finally:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+    
+    def publish_levels(self, image, thumb_key):
+        """Write the whole pyramid of a key from its top level image.
+        Smallest level first and the top level last, so is_cached() only turns true once every level is there."""
+        levels = [(THUMBNAIL_LEVELS[-1], image)]
+        for level in reversed(THUMBNAIL_LEVELS[:-1]):
+            # Each level is scaled from the one above it - cheaper and as sharp as scaling from the top
+            if image.width() > level or image.height() > level:
+                image = image.scaled(level, level, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+            levels.append((level, image))
+        return all(self.publish_image(level_image, self.thumbnail_path(thumb_key, level))
+                   for level, level_image in reversed(levels))
+    
+    def write_sidecar(self, thumb_key, identity):
+        """Record what a cached thumbnail was rendered from, next to it in the cache"""
+        sidecar = dict(identity, rendered_by=socket.gethostname(), rendered_at=time.time())
+        sidecar_file = self.sidecar_path(thumb_key)
+        temp_file = self.temp_name(sidecar_file)
+        try:
+            with open(temp_file, 'w') as f:
+                json.dump(sidecar, f, indent=1)
+            os.replace(temp_file, sidecar_file)
+        except Exception as e:
+            print(f"❌ Could not write cache sidecar {sidecar_file}: {e}")
+    
+    def mark_used(self, thumb_key):
+        """Touch the sidecar of a thumbnail that was shown - the cache cleanup evicts the least recently used"""
+        try:
+            os.utime(self.sidecar_path(thumb_key))
+        except OSError:
+            pass  # No sidecar (older render) or read-only cache
+    
+    def remove(self, thumb_key):
+        """Delete every cached file of a key, top level first so is_cached() turns false right away.
+        Returns the bytes freed."""
+        freed = 0
+        paths = [self.thumbnail_path(thumb_key, level) for level in reversed(THUMBNAIL_LEVELS)]
+        for path in paths + [self.sidecar_path(thumb_key)]:
+            try:
+                size = os.path.getsize(path)
+                os.remove(path)
+                freed += size
+            except OSError:
+                pass
+        return freed
+    
+    def render(self, file_path, thumb_key, identity=None, cancel_event=None, retry_failed=False):
+        """Render one thumbnail for this key. Returns one of the RENDER_* outcomes.
+        Failures are recorded and not retried before their backoff expires, unless retry_failed is set."""
+        if not retry_failed and self.failures.blocks(file_path, thumb_key):
+            metrics.count("render_backoff_skips")
+            return self.failures.load(file_path)["class"]
+        
+        # Identity of the source as it is now, recorded next to the thumbnail
+        if identity is None:
+            identity = ThumbnailCache.file_identity(file_path)
+        
+        # A file that timed out before gets a longer timeout with every attempt
+        ext = os.path.splitext(file_path)[1].lower()
+        previous = self.failures.load(file_path)
+        previous_timeouts = previous["attempts"] if (previous and previous["thumb_key"] == thumb_key and
+                                                     previous["class"] == RENDER_TIMEOUT) else 0
+        predicted = self.costs.predict(ext, identity["size"])
+        timeout = self.costs.timeout(ext, identity["size"], previous_timeouts)
+        
+        start = time.perf_counter()
+        outcome = self.render_file(file_path, thumb_key, identity, cancel_event, timeout)
+        seconds = time.perf_counter() - start
+        metrics.count("renders", format=ext, outcome=outcome)
+        if outcome in (RENDER_RENDERED, RENDER_FAILED, RENDER_TIMEOUT, RENDER_UNSUPPORTED):
+            # Render latency of the attempts that actually ran F3D or a texture decode
+            metrics.observe("render_seconds", seconds, format=ext)
+            self.costs.record(ext, identity["size"], outcome, seconds, predicted)
+        if outcome in RENDER_SUCCESS:
+            self.failures.clear(file_path)
+        elif outcome not in (RENDER_CANCELLED, RENDER_BUSY):
+            self.failures.record(file_path, thumb_key, outcome, identity, predicted_seconds=round(predicted, 2),
+                                 timeout_seconds=round(timeout), seconds=round(seconds, 2))
+        return outcome
+    
+    def render_file(self, file_path, thumb_key, identity, cancel_event=None, timeout=RENDER_TIMEOUT_MIN_SECONDS):
+        """Render one thumbnail, without looking at earlier failures"""
+        try:
+            # Skip if already rendered - the key is exact, no age check needed
+            if self.is_cached(thumb_key):
+                return RENDER_CACHED
+            
+            # Another workstation may be rendering this exact key already - leave it to it
+            if not self.leases.acquire(thumb_key):
+                print(f"⏳ Rendered on another workstation: {os.path.basename(file_path)}")
+                return RENDER_BUSY
+            try:
+                # It may have finished between the cache check and the lease
+                if self.is_cached(thumb_key):
+                    return RENDER_CACHED
+                return self.render_source(file_path, thumb_key, identity, cancel_event, timeout)
+            finally:
+                self.leases.release(thumb_key)
+        except StagingCancelled:
+            print(f"⏹️  Render cancelled while copying {os.path.basename(file_path)}")
+            return RENDER_CANCELLED
+        except RenderCancelled:
+            print(f"⏹️  Render cancelled, no longer shown: {os.path.basename(file_path)}")
+            return RENDER_CANCELLED
+        except subprocess.CalledProcessError as e:
+            print(f"❌ F3D command failed for {os.path.basename(file_path)}:")
+            print(f"   Error: {e}")
+            if e.stderr:
+                print(f"   Stderr: {e.stderr}")
+        except subprocess.TimeoutExpired:
+            print(f"⏰ F3D timed out after {timeout:.0f}s for {os.path.basename(file_path)}")
+            return RENDER_TIMEOUT
+        except Exception as e:
+            print(f"💥 Unexpected error generating thumbnail: {e}")
+            print(f"   Traceback: {traceback.format_exc()}")
+        
+        return RENDER_FAILED
+    
+    def render_source(self, file_path, thumb_key, identity, cancel_event=None, timeout=RENDER_TIMEOUT_MIN_SECONDS):
+        """Render a thumbnail while holding its lease"""
+        # Textures are decoded at reduced size in Python, no F3D and no staged copy needed
+        if os.path.splitext(file_path)[1].lower() in TEXTURE_FORMATS:
+            return self.render_texture(file_path, thumb_key, identity)
+        
+        # Point clouds and splats are sampled in place - whatever their size, nothing is copied locally
+        if PointCloudReader.can_read(file_path):
+            outcome = self.render_points(file_path, thumb_key, identity)
+            if outcome is not None:
+                return outcome
+            if not self.f3d_available:
+                # ASCII or mesh PLY - not a failure of F3D. The cache key includes the F3D version,
+                # so this record no longer applies once F3D is installed.
+                return RENDER_UNSUPPORTED
+        
+        # Handle network paths differently - render from a local staged copy
+        if is_network_path(file_path):
+            # Check file size before copying (skip files larger than 500MB)
+            file_size = identity["size"]
+            if file_size > 500 * 1024 * 1024:  # 500MB limit
+                print(f"⚠️  Skipping large file: {os.path.basename(file_path)} ({file_size/(1024*1024):.1f}MB)")
+                return RENDER_TOO_LARGE
+            
+            with self.staging.staged(file_path, identity["mtime_ns"], file_size, cancel_event) as local_path:
+                return self.run_f3d(file_path, local_path, thumb_key, identity, timeout, cancel_event)
+        
+        # Local file, use directly
+        return self.run_f3d(file_path, file_path, thumb_key, identity, timeout, cancel_event)
+    
+    def render_texture(self, file_path, thumb_key, identity):
+        """Decode a texture at thumbnail size and store it in the cache like a model render"""
+        print(f"🔄 Generating texture thumbnail: {os.path.basename(file_path)}")
+        image = TextureReader.read(file_path, THUMBNAIL_LEVELS[-1])
+        if image is None or image.isNull():
+            print(f"❌ Cannot read texture: {os.path.basename(file_path)}")
+            return RENDER_UNSUPPORTED
+        if self.publish_levels(image, thumb_key):
+            self.write_sidecar(thumb_key, identity)
+            print(f"✅ Thumbnail generated: {os.path.basename(file_path)}")
+            return RENDER_RENDERED
+        print(f"❌ Could not write texture thumbnail: {os.path.basename(file_path)}")
+        return RENDER_FAILED
+    
+    def render_points(self, file_path, thumb_key, identity):
+        """Preview a point cloud or splat in Python. None if F3D has to render it (ASCII PLY, meshes)."""
+        print(f"🔄 Generating point cloud thumbnail: {os.path.basename(file_path)}")
+        try:
+            image = PointCloudReader.read(file_path)
+        except (OSError, ValueError) as e:
+            print(f"❌ Cannot read points of {os.path.basename(file_path)}: {e}")
+            image = None
+        if image is None:
+            return None
+        if self.publish_levels(image, thumb_key):
+            self.write_sidecar(thumb_key, dict(identity, renderer="points"))
+            print(f"✅ Thumbnail generated: {os.path.basename(file_path)}")
+            return RENDER_RENDERED
+        print(f"❌ Could not write point cloud thumbnail: {os.path.basename(file_path)}")
+        return RENDER_FAILED
+    
+    def run_process(self, cmd, timeout, cancel_event=None):
+        """subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=timeout) that also stops
+        the process as soon as cancel_event is set (raises RenderCancelled)"""
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        deadline = time.perf_counter() + timeout
+        while True:
+            try:
+                stdout, stderr = process.communicate(timeout=self.CANCEL_POLL_SECONDS)
+                break
+            except subprocess.TimeoutExpired:
+                if cancel_event is not None and cancel_event.is_set():
+                    self.stop_process(process)
+                    raise RenderCancelled(cmd[1])
+                if time.perf_counter() > deadline:
+                    self.stop_process(process)
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, cmd, stdout, stderr)
+        return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+    
+    def stop_process(self, process):
+        """Ask a process to quit, kill it if it does not within STOP_GRACE_SECONDS"""
+        process.terminate()
+        try:
+            process.communicate(timeout=self.STOP_GRACE_SECONDS)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+    
+    def run_f3d(self, file_path, f3d_input_path, thumb_key, identity, timeout=RENDER_TIMEOUT_MIN_SECONDS,
+                cancel_event=None):
+        """Run F3D on a local input file, check its output and publish it to the cache"""
+        # F3D writes to a local file first - the shared cache only ever sees complete, checked images
+        render_file = os.path.join(self.temp_dir, f"{thumb_key}.{os.getpid()}-{threading.get_ident()}.png")
+        
+        # F3D command - using compatible parameters
+        cmd = [
+            F3D_PATH,
+            os.path.normpath(f3d_input_path),
+            "--output", os.path.normpath(render_file),
+        ] + f3d_render_options()
+        
+        print(f"🔄 Generating thumbnail: {os.path.basename(file_path)}")
+        start = time.perf_counter()
+        try:
+            result = self.run_process(cmd, timeout, cancel_event)
+            if not os.path.exists(render_file):
+                # F3D ran fine but had nothing to render - it cannot read this file
+                print(f"❌ Thumbnail file was not created: {os.path.basename(file_path)}")
+                if result.stderr:
+                    print(f"   F3D stderr: {result.stderr}")
+                return RENDER_UNSUPPORTED
+            # F3D has exited, so the file is complete - QImage is safe to use off the GUI thread, QPixmap is not
+            image = QtGui.QImage(render_file)
+        finally:
+            if os.path.exists(render_file):
+                os.remove(render_file)
+        
+        top = THUMBNAIL_LEVELS[-1]
+        if image.isNull() or (image.width(), image.height()) != (top, top):
+            print(f"❌ Generated thumbnail is invalid: {os.path.basename(file_path)} "
+                  f"({image.width()}x{image.height()}, expected {top}x{top})")
+            return RENDER_FAILED
+        if not self.publish_levels(image, thumb_key):
+            return RENDER_FAILED
+        self.write_sidecar(thumb_key, dict(identity, f3d_seconds=round(time.perf_counter() - start, 2),
+                                           timeout_seconds=round(timeout)))
+        print(f"✅ Thumbnail generated: {os.path.basename(file_path)}")
+        return RENDER_RENDERED
+
+
+class CacheCollector:
+    """Background cleanup of the shared thumbnail cache, run by one workstation at a time every CACHE_GC_HOURS.
+    Removes thumbnails of assets that were deleted, moved or changed (their key is superseded), older mosaics
+    of a folder, temporary files and leases left by crashes and failure records of changed assets - then the
+    least recently used thumbnails until the cache fits CACHE_BUDGET_MB. Thumbnails of other F3D versions or
+    render options are only evicted by age, workstations may still be using them."""
+    KEY_FILE = re.compile(r"^([0-9a-f]{12}-[0-9a-f]{12})(?:_\d+\.png|\.json)$")
+    MOSAIC_FILE = re.compile(r"^([0-9a-f]{12})-mosaic-[0-9a-f]{12}_\d+\.png$")
+    STATE_NAME = "cache_gc.json"
+    LEASE_KEY = "cache-gc"
+    STALE_SECONDS = 3600  # Temporary files and expired leases this old were left by a crash
+    RECENT_SECONDS = 3600  # Thumbnails shown or rendered this recently are never evicted
+    TARGET_RATIO = 0.9  # Eviction goes this far below the budget, so the next run has little to do
+    # More deleted assets than this share of the cache (and at least MIN_DELETED_CHECK of them) looks like an
+    # unreachable library rather than a cleanup - they are kept for a later run
+    MAX_DELETED_SHARE = 0.5
+    MIN_DELETED_CHECK = 100
+    
+    def __init__(self, renderer):
+        self.renderer = renderer
+        self.cache_dir = renderer.cache_dir
+        self.state_file = os.path.join(self.cache_dir, self.STATE_NAME)
+        self.running = False
+    
+    def read_state(self):
+        """Summary of the last cleanup, by any workstation - {} if there was none"""
+        try:
+            with open(self.state_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def start(self, force=False):
+        """Clean up on a background thread, unless a cleanup is running or one ran less than CACHE_GC_HOURS ago"""
+        if self.running:
+            return
+        self.running = True
+        threading.Thread(target=self._run, args=(force,), daemon=True, name="CrateCacheGC").start()
+    
+    def _run(self, force):
+        try:
+            self.run(force)
+        except Exception as e:
+            print(f"❌ Cache cleanup failed: {e}")
+        finally:
+            self.running = False
+    
+    def run(self, force=False):
+        """Clean up now if due and no other workstation is at it. Returns the summary, None if skipped."""
+        if not force and time.time() - self.read_state().get("finished_at", 0) < CACHE_GC_HOURS * 3600:
+            return None
+        if not self.renderer.leases.acquire(self.LEASE_KEY):
+            return None
+        try:
+            start = time.perf_counter()
+            summary = self.collect()
+            seconds = time.perf_counter() - start
+            metrics.observe("cache_gc_seconds", seconds)
+            summary.update(finished_at=time.time(), host=socket.gethostname(), seconds=round(seconds, 1))
+            temp_file = self.renderer.temp_name(self.state_file)
+            try:
+                with open(temp_file, 'w') as f:
+                    json.dump(summary, f, indent=1)
+                os.replace(temp_file, self.state_file)
+            except OSError as e:
+                print(f"❌ Could not record the cache cleanup: {e}")
+        finally:
+            self.renderer.leases.release(self.LEASE_KEY)
+        
+        for reason, count in summary["removed"].items():
+            metrics.count("cache_gc_removed", count, reason=reason)
+        metrics.count("cache_gc_freed_bytes", summary["freed_bytes"])
+        print(f"🧹 Cache cleanup: {sum(summary['removed'].values())} entries removed, "
+              f"{summary['freed_bytes'] / (1024 * 1024):.0f} MB freed, cache {summary['cache_bytes'] / (1024 * 1024):.0f} MB "
+              f"({seconds:.1f}s)")
+        return summary
+    
+    def collect(self):
+        """One cleanup pass over the cache directory - see the class docstring"""
+        now = time.time()
+        self.removed = collections.Counter()
+        self.freed = 0
+        groups = {}  # thumb key -> {"files", "bytes", "used", "sidecar"}
+        mosaics = collections.defaultdict(list)  # folder path hash -> [(mtime, bytes, path)]
+        with os.scandir(self.cache_dir) as it:
+            for dir_entry in it:
                 try:
-                    base_thumbnail = QtGui.QPixmap(base_cache_file)
-                    if not base_thumbnail.isNull():
-                        # Scale the base thumbnail to the requested size
-                        scaled_thumbnail = base_thumbnail.scaled(size, size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-                        self.cache[cache_key] = scaled_thumbnail
-                        return scaled_thumbnail
-                except Exception as e:
-                    print(f"❌ Error loading cached thumbnail {base_cache_file}: {e}")
-        
-        # For image/texture files, load actual image
-        if ext in texture_formats:
+                    if not dir_entry.is_file():
+                        continue
+                    stat = dir_entry.stat()
+                except OSError:
+                    continue
+                name = dir_entry.name
+                if name.endswith('.tmp'):
+                    if now - stat.st_mtime > self.STALE_SECONDS:
+                        self.delete([dir_entry.path], "temporary")
+                    continue
+                match = self.KEY_FILE.match(name)
+                if match:
+                    group = groups.setdefault(match.group(1), {"files": [], "bytes": 0, "used": 0, "sidecar": None})
+                    group["files"].append(dir_entry.path)
+                    group["bytes"] += stat.st_size
+                    # The sidecar is touched when the thumbnail is shown, see ThumbnailRenderer.mark_used()
+                    group["used"] = max(group["used"], stat.st_mtime)
+                    if name.endswith('.json'):
+                        group["sidecar"] = dir_entry.path
+                    continue
+                match = self.MOSAIC_FILE.match(name)
+                if match:
+                    mosaics[match.group(1)].append((stat.st_mtime, stat.st_size, dir_entry.path))
+                # Anything else (library index, render history, bake journal, older Crate versions) is left alone
+        
+        # Thumbnails of assets that are gone or changed - the source is stat'ed once per thumbnail
+        folders = {}  # folder -> reachable, shared by every check of this pass
+        orphans = collections.defaultdict(list)  # reason -> [thumb key]
+        for thumb_key, group in groups.items():
+            identity = self.read_json(group["sidecar"]) if group["sidecar"] else None
+            reason = self.orphan_reason(identity, folders)
+            if reason:
+                orphans[reason].append(thumb_key)
+        if len(orphans["deleted"]) > max(self.MIN_DELETED_CHECK, self.MAX_DELETED_SHARE * len(groups)):
+            print(f"⚠️  Cache cleanup: {len(orphans['deleted'])} of {len(groups)} assets seem deleted - "
+                  f"is the library offline? Keeping their thumbnails")
+            del orphans["deleted"]
+        for reason, thumb_keys in orphans.items():
+            for thumb_key in thumb_keys:
+                self.delete(groups.pop(thumb_key)["files"], reason)
+        
+        # A folder's mosaic is replaced whenever its children change - only the newest one is ever shown
+        entries = [(group["used"], group["bytes"], group["files"]) for group in groups.values()]
+        for folder_mosaics in mosaics.values():
+            folder_mosaics.sort()
+            for mtime, size, path in folder_mosaics[:-1]:
+                self.delete([path], "old mosaic")
+            mtime, size, path = folder_mosaics[-1]
+            entries.append((mtime, size, [path]))
+        
+        self.collect_records(now, folders)
+        
+        # Least recently used first until the cache fits its budget
+        total = sum(size for _, size, _ in entries)
+        if CACHE_BUDGET_MB is not None and total > CACHE_BUDGET_MB * 1024 * 1024:
+            target = CACHE_BUDGET_MB * 1024 * 1024 * self.TARGET_RATIO
+            for used, size, files in sorted(entries, key=operator.itemgetter(0)):
+                if total <= target or now - used < self.RECENT_SECONDS:
+                    break
+                self.delete(files, "evicted")
+                total -= size
+        return {"removed": dict(self.removed), "freed_bytes": self.freed, "cache_bytes": total,
+                "budget_mb": CACHE_BUDGET_MB}
+    
+    def collect_records(self, now, folders):
+        """Expired leases, and failure records of assets that are gone or changed (a new version is retried anyway)"""
+        leases_dir = self.renderer.leases.leases_dir
+        failures_dir = self.renderer.failures.failures_dir
+        for dir_path in (leases_dir, failures_dir):
             try:
-                pixmap = QtGui.QPixmap(file_path)
-                if not pixmap.isNull():
-                    pixmap = pixmap.scaled(size, size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-                    self.cache[cache_key] = pixmap
-                    return pixmap
+                names = os.listdir(dir_path)
+            except OSError:
+                continue
+            for name in names:
+                path = os.path.join(dir_path, name)
+                try:
+                    age = now - os.path.getmtime(path)
+                except OSError:
+                    continue
+                if name.endswith('.tmp'):
+                    if age > self.STALE_SECONDS:
+                        self.delete([path], "temporary")
+                elif dir_path == leases_dir:
+                    if name != f"{self.LEASE_KEY}.lease" and age > RenderLeases.LEASE_SECONDS + self.STALE_SECONDS:
+                        self.delete([path], "lease")
+                elif name.endswith('.json'):
+                    record = self.read_json(path)
+                    if record and self.orphan_reason(record.get("identity"), folders):
+                        self.delete([path], "failure record")
+    
+    def orphan_reason(self, identity, folders):
+        """'deleted' or 'changed' if the asset a thumbnail (or failure) was made from is gone or changed, else None.
+        Anything uncertain - no identity, unreachable share, permission error - keeps the thumbnail."""
+        if not isinstance(identity, dict) or not os.path.isabs(identity.get("path", "")):
+            return None
+        file_path = identity["path"]
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return "deleted" if self.reachable(os.path.dirname(file_path), folders) else None
+        except OSError:
+            return None
+        # Within a second - shares report mtimes at different precisions to different workstations
+        if stat.st_size != identity.get("size") or abs(stat.st_mtime_ns - identity.get("mtime_ns", 0)) >= 10 ** 9:
+            return "changed"
+        return None
+    
+    @staticmethod
+    def reachable(folder, folders):
+        """True if the folder or one of its parents below the drive or share root exists - the asset was then
+        deleted or moved, rather than on a share that is offline"""
+        while folder and os.path.dirname(folder) != folder:
+            if folder not in folders:
+                folders[folder] = os.path.isdir(folder)
+            if folders[folder]:
+                return True
+            folder = os.path.dirname(folder)
+        return False
+    
+    @staticmethod
+    def read_json(path):
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def delete(self, paths, reason):
+        """Delete the files of one cache entry, its sidecar last"""
+        for path in sorted(paths, key=lambda path: path.endswith('.json')):
+            try:
+                size = os.path.getsize(path)
+                os.remove(path)
+                self.freed += size
+            except OSError:
+                pass  # Removed by another workstation, or in use
+        self.removed[reason] += 1
+    
+    def summary_line(self):
+        """The last cleanup, for the Debug dialog"""
+        state = self.read_state()
+        if not state:
+            return "Cache Cleanup: not run yet"
+        budget = "no budget" if state.get("budget_mb") is None else f"{state['budget_mb']} MB budget"
+        return (f"Cache Cleanup: {time.strftime('%Y-%m-%d %H:%M', time.localtime(state['finished_at']))} on "
+                f"{state['host']}, {sum(state['removed'].values())} entries removed, "
+                f"{state['freed_bytes'] / (1024 * 1024):.0f} MB freed, cache "
+                f"{state['cache_bytes'] / (1024 * 1024):.0f} MB ({budget})")
+
+
+class PixmapCache:
+    """In-memory LRU of thumbnail pixmaps bounded by a byte budget - GUI thread only.
+    Holds the pyramid levels decoded for each asset, keyed '<cache key>_<level>', and the variants
+    scaled to the current cell size, keyed (<key>, <size>)."""
+    def __init__(self, budget_bytes=None):
+        self.budget_bytes = budget_bytes if budget_bytes is not None else PIXMAP_CACHE_MB * 1024 * 1024
+        self.entries = collections.OrderedDict()  # key -> (pixmap, bytes), oldest first
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def pixmap_bytes(pixmap):
+        """Estimated memory of a pixmap from its dimensions and depth"""
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth()) // 8
+    
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry[0]
+    
+    def __contains__(self, key):
+        """Whether a pixmap is held - neither a lookup for the hit rate nor a use for the LRU"""
+        return key in self.entries
+    
+    def put(self, key, pixmap):
+        self.discard(key)
+        size = self.pixmap_bytes(pixmap)
+        self.entries[key] = (pixmap, size)
+        self.total_bytes += size
+        # Evict the coldest entries, but never the one just added
+        while self.total_bytes > self.budget_bytes and len(self.entries) > 1:
+            _, (_, evicted_size) = self.entries.popitem(last=False)
+            self.total_bytes -= evicted_size
+    
+    def discard(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry[1]
+    
+    def fitted(self, key, pixmap, size):
+        """The pixmap scaled once to fit a size x size cell, so painting never scales"""
+        if pixmap.width() <= size and pixmap.height() <= size:
+            return pixmap
+        entry = self.entries.get((key, size))
+        if entry is not None:
+            self.entries.move_to_end((key, size))
+            return entry[0]
+        scaled = pixmap.scaled(size, size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+        self.put((key, size), scaled)
+        return scaled
+    
+    def discard_fitted(self, key=None):
+        """Drop the scaled variants of one pixmap, or all of them when the cell size changed"""
+        for entry_key in [entry_key for entry_key in self.entries
+                          if isinstance(entry_key, tuple) and (key is None or entry_key[0] == key)]:
+            self.discard(entry_key)
+    
+    def discard_asset(self, thumb_key):
+        """Drop every decoded level of an asset, and its scaled variants"""
+        prefix = f"{thumb_key}_"
+        for key in [key for key in self.entries
+                    if (key[0] if isinstance(key, tuple) else key).startswith(prefix)]:
+            self.discard(key)
+    
+    def clear(self):
+        self.entries.clear()
+        self.total_bytes = 0
+    
+    def stats(self):
+        """Occupancy and hit rate, for the Debug dialog"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "bytes": self.total_bytes,
+            "budget_bytes": self.budget_bytes,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class StorageProbe(QtCore.QObject):
+    """Startup checks of the thumbnail cache directory and of F3D, run in the background.
+    Every check is time-boxed, so a slow or offline share degrades to a local cache instead of hanging Nuke."""
+    # (cache directory to use, F3D found) - emitted from the probe thread
+    finished = QtCore.Signal(str, bool)
+    
+    def start(self):
+        thread = threading.Thread(target=self._probe, daemon=True)
+        thread.start()
+    
+    @staticmethod
+    def cache_candidates():
+        """Cache directories to try in order: the shared cache, then local fallbacks"""
+        return [
+            CACHE_DIR,
+            os.path.join(tempfile.gettempdir(), "nuke_3d_thumbnails"),
+            os.path.expanduser("~/nuke_3d_thumbnails"),
+        ]
+    
+    @staticmethod
+    def check_cache_dir(cache_dir):
+        """Create the cache directory if needed and make sure we can write to it"""
+        os.makedirs(cache_dir, exist_ok=True)
+        # Unique name - other workstations run the same check on the shared cache
+        test_file = os.path.join(cache_dir, f"test_write.{socket.gethostname()}-{os.getpid()}.tmp")
+        with open(test_file, 'w') as f:
+            f.write("test")
+        os.remove(test_file)
+    
+    def _probe(self):
+        start = time.perf_counter()
+        candidates = self.cache_candidates()
+        cache_dir = candidates[-1]
+        for candidate in candidates:
+            try:
+                run_with_timeout(self.check_cache_dir, PROBE_TIMEOUT_SECONDS, candidate)
             except Exception as e:
-                print(f"❌ Error loading texture {file_path}: {e}")
-        
-        # For 3D models, try async F3D generation (if not failed before)
-        # Added .splat to the model formats list
-        model_formats = {'.obj', '.fbx', '.stl', '.ply', '.gltf', '.glb', '.abc', '.usd', '.usdc', '.splat'}
-        if (ext in model_formats and 
-            file_path not in self.failed_attempts.get(ext, set()) and
-            os.path.exists(F3D_PATH)):
-            
-            # Track this generation
-            self.active_generations[cache_key] = True
+                print(f"❌ Cache directory not usable: {candidate} ({e})")
+                continue
+            cache_dir = candidate
+            break
+        if cache_dir == CACHE_DIR:
+            print(f"💾 Using network cache directory: {cache_dir}")
+        else:
+            print(f"🔄 Using local cache directory: {cache_dir}")
+        
+        try:
+            f3d_available = bool(run_with_timeout(os.path.exists, PROBE_TIMEOUT_SECONDS, F3D_PATH))
+        except TimeoutError as e:
+            print(f"❌ F3D path not reachable: {F3D_PATH} ({e})")
+            f3d_available = False
+        if f3d_available:
+            print("F3D executable found!")
+            # Asked here, off the GUI thread - every cache key includes it
+            get_f3d_version()
+        else:
+            print(f"❌ F3D not found at: {F3D_PATH}")
+            set_f3d_version("unknown")
+        
+        metrics.observe("startup_probe_seconds", time.perf_counter() - start)
+        self.finished.emit(cache_dir, f3d_available)
+
+
+class ThumbnailCache(QtCore.QObject):
+    """Cache for storing thumbnails with smart generation strategies"""
+    # Emitted from render workers once a render finished: (cache key, file path, RENDER_* outcome)
+    thumbnail_ready = QtCore.Signal(str, str, str)
+    # Emitted from decode workers: (level cache key, file path, QImage or None if there is nothing to show yet)
+    image_decoded = QtCore.Signal(str, str, object)
+    # Emitted on the GUI thread once a decoded pixmap is in memory: (file path)
+    pixmap_ready = QtCore.Signal(str)
+    # Emitted from render workers when another workstation holds the render lease: (cache key, file path, RenderJob)
+    render_deferred = QtCore.Signal(str, str, object)
+    # Emitted on the GUI thread once the startup checks chose the cache directory: (cache dir)
+    cache_ready = QtCore.Signal(str)
+    # Emitted from the mosaic worker: (folder path, QImage or None if no child thumbnail is cached yet)
+    mosaic_ready = QtCore.Signal(str, object)
+    # Emitted from the regenerate worker once the thumbnails are deleted: [(file path, identity, cache key)]
+    regenerated = QtCore.Signal(object)
+    
+    LEASE_POLL_SECONDS = 10  # How often renders leased by other workstations are checked for their result
+    MOSAIC_SIZE = 256  # Folder mosaics are stored at this size and fitted into the cell when painted
+    MOSAIC_TILES = 4  # Child thumbnails shown in a folder mosaic
+    MOSAIC_SCAN_LIMIT = 48  # Children checked for a cached thumbnail - bounds the work on huge folders
+    NEARLY_DONE = 0.75  # Renders this far into their predicted time finish even when their folder was left
+    GC_DELAY_SECONDS = 120  # The first cache cleanup waits for the panel to settle
+    GC_CHECK_SECONDS = 3600  # How often a long session checks whether a cleanup is due
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        print("📸 Initializing thumbnail cache...")
+        self.cache = PixmapCache()  # In-memory pixmaps - only ever touched on the GUI thread
+        self.keys = {}  # file path -> (mtime_ns, size, cache key), see cache_key()
+        self.placeholders = {}  # (ext, size, status) -> placeholder pixmap
+        # Bounded pool of F3D workers - replaces one thread per thumbnail
+        self.scheduler = RenderScheduler(self.generate_thumbnail)
+        self.view = None  # Folder or search on screen - renders are tied to it, see set_view()
+        # Cached thumbnails are read and decoded off the GUI thread, which only converts them to pixmaps
+        self.decoder = RenderScheduler(self.decode_level, DECODE_WORKERS, thread_name="CrateDecode")
+        self.missing = set()  # Level cache keys with nothing on disk to decode - GUI thread only
+        # Renders another workstation is doing: cache key -> (file path, view, cost) - GUI thread only
+        self.deferred = {}
+        self.render_deferred.connect(self.on_render_deferred)
+        self.deferred_timer = QtCore.QTimer(self)
+        self.deferred_timer.setInterval(self.LEASE_POLL_SECONDS * 1000)
+        self.deferred_timer.timeout.connect(self.check_deferred)
+        self.image_decoded.connect(self.on_image_decoded)
+        # Folder tiles: composed in the background from children already in the cache, never rendered
+        self.mosaic_builder = RenderScheduler(self.compose_mosaic, 1, thread_name="CrateMosaic")
+        # folder path -> True (pixmap in memory), False (nothing to show) or None (to check again) - GUI thread only
+        self.mosaics = {}
+        self.mosaic_ready.connect(self.on_mosaic_ready)
+        self.regenerated.connect(self.on_regenerated)
+        # Thumbnails shown this session - each marks itself used once for the cache cleanup, see load_level()
+        self.used = set()
+        self.collector = None
+        self.gc_timer = QtCore.QTimer(self)
+        self.gc_timer.setInterval(self.GC_CHECK_SECONDS * 1000)
+        
+        # Create temp directory for network file processing (local to each machine)
+        self.temp_dir = os.path.join(tempfile.gettempdir(), "nuke_3d_temp")
+        os.makedirs(self.temp_dir, exist_ok=True)
+        
+        # The cache directory (often on a network share) and F3D are checked in the background -
+        # nothing is rendered or read from the cache before cache_ready
+        self.cache_dir = None
+        self.renderer = None
+        self.f3d_available = False
+        self.ready = False
+        self.probe = StorageProbe(self)
+        self.probe.finished.connect(self.on_probe_finished)
+        self.probe.start()
+    
+    def on_probe_finished(self, cache_dir, f3d_available):
+        """The startup checks are done - use the cache directory they settled on"""
+        self.cache_dir = cache_dir
+        self.f3d_available = f3d_available
+        self.renderer = ThumbnailRenderer(self.cache_dir, self.temp_dir, f3d_available=f3d_available)
+        threading.Thread(target=self.renderer.costs.load, daemon=True).start()
+        # Every session checks whether the shared cache is due a cleanup - the first one to find it due runs it
+        self.collector = CacheCollector(self.renderer)
+        self.gc_timer.timeout.connect(self.collector.start)
+        self.gc_timer.start()
+        QtCore.QTimer.singleShot(self.GC_DELAY_SECONDS * 1000, self.collector.start)
+        self.ready = True
+        self.cache_ready.emit(cache_dir)
+    
+    def get_thumbnail(self, file_path, size=128, priority=PRIORITY_NORMAL):
+        """Get the cached thumbnail of a model or texture, or a colored placeholder while it is rendered"""
+        ext = os.path.splitext(file_path)[1].lower()
+        
+        # Create a UNIQUE key based on the file's identity (path, mtime, size) and render settings
+        thumb_key = self.cache_key(file_path)
+        # The nearest stored pyramid level, scaled once to the cell size
+        level = thumbnail_level(size)
+        cache_key = f"{thumb_key}_{level}"
+        
+        # Return cached thumbnail if exists in memory
+        pixmap = self.cache.get(cache_key)
+        if pixmap is not None:
+            metrics.count("thumbnail_lookups", tier="memory", result="hit")
+            return self.cache.fitted(cache_key, pixmap, size)
+        
+        # Not in memory - decode it in the background unless we already know there is nothing on disk
+        if cache_key not in self.missing:
+            if self.decoder.submit(cache_key, file_path, priority):
+                metrics.count("thumbnail_lookups", tier="memory", result="miss")
+            return self.create_placeholder(ext, size)
+        
+        # Rendered on another workstation - check_deferred() picks up its result
+        if thumb_key in self.deferred:
+            return self.create_placeholder(ext, size, "generating...")
+        
+        # Queue a render (if not failed before) - F3D for 3D models, a reduced size decode for textures
+        if not self.is_failed(file_path) and self.can_render(ext):
             
-            # Try to generate thumbnail in background - always generate at 256px for best scaling
-            self.try_async_f3d_generation(file_path, 256, cache_key, path_hash)
+            # Renders are deduplicated per file, whatever size the cell asked for
+            self.try_async_f3d_generation(file_path, thumb_key, priority)
             
             # Return placeholder immediately while generating
             return self.create_placeholder(ext, size, "generating...")
@@ -133,112 +2087,320 @@ class ThumbnailCache:
         # Final fallback - colored placeholder
         return self.create_placeholder(ext, size)
     
-    def try_async_f3d_generation(self, file_path, size, cache_key, path_hash):
-        """Attempt F3D thumbnail generation with better network path handling"""
-        def generate_thumbnail():
-            try:
-                # Use our cache directory with unique hash-based filename
-                # Always generate at 256px for best scaling quality
-                cache_file = os.path.join(self.cache_dir, f"{path_hash}_256.png")
-                
-                # Skip if already exists and is recent
-                if (os.path.exists(cache_file) and 
-                    (time.time() - os.path.getmtime(cache_file)) < 604800):
-                    pixmap = QtGui.QPixmap(cache_file)
-                    if not pixmap.isNull():
-                        # Cache the base size thumbnail
-                        self.cache[f"{path_hash}_256"] = pixmap
-                        # Remove from active generations
-                        if cache_key in self.active_generations:
-                            del self.active_generations[cache_key]
-                        return
-                
-                # Handle network paths differently - copy file locally first
-                if file_path.startswith(('L:/', 'L:\\', '\\\\')):
-                    # Copy the file to a temporary local location for F3D to process
-                    filename = os.path.basename(file_path)
-                    local_temp_path = os.path.join(self.temp_dir, filename)
-                    
-                    # Check file size before copying (skip files larger than 500MB)
-                    file_size = os.path.getsize(file_path)
-                    if file_size > 500 * 1024 * 1024:  # 500MB limit
-                        print(f"⚠️  Skipping large file: {filename} ({file_size/(1024*1024):.1f}MB)")
-                        # Mark as failed to avoid retries
-                        ext = os.path.splitext(file_path)[1].lower()
-                        if ext not in self.failed_attempts:
-                            self.failed_attempts[ext] = set()
-                        self.failed_attempts[ext].add(file_path)
-                        del self.active_generations[cache_key]
-                        return
-                    
-                    # Copy the file
-                    shutil.copy2(file_path, local_temp_path)
-                    f3d_input_path = local_temp_path.replace('/', '\\')
-                else:
-                    # Local file, use directly
-                    f3d_input_path = file_path.replace('/', '\\')
-                
-                # Always use local path for output
-                cache_file_f3d = cache_file.replace('/', '\\')
-                
-                # F3D command - using compatible parameters
-                cmd = [
-                    F3D_PATH,
-                    f3d_input_path,
-                    "--output", cache_file_f3d,
-                    "--no-background"
-                ]
-                
-                print(f"🔄 Generating thumbnail: {os.path.basename(file_path)}")
-                result = subprocess.run(cmd, check=True, capture_output=True, timeout=60, text=True)
-                
-                # Clean up temporary file if we created one
-                if file_path.startswith(('L:/', 'L:\\', '\\\\')) and os.path.exists(local_temp_path):
-                    os.remove(local_temp_path)
-                
-                if os.path.exists(cache_file):
-                    time.sleep(0.5)  # Wait for file to be fully written
-                    
-                    # Load the generated image
-                    pixmap = QtGui.QPixmap(cache_file)
-                    if not pixmap.isNull():
-                        # Cache the base size thumbnail
-                        self.cache[f"{path_hash}_256"] = pixmap
-                        print(f"✅ Thumbnail generated: {os.path.basename(file_path)}")
-                    else:
-                        print(f"❌ Generated thumbnail is invalid: {os.path.basename(file_path)}")
-                else:
-                    print(f"❌ Thumbnail file was not created: {os.path.basename(file_path)}")
-                    if result.stderr:
-                        print(f"   F3D stderr: {result.stderr}")
-                        
-            except subprocess.CalledProcessError as e:
-                print(f"❌ F3D command failed for {os.path.basename(file_path)}:")
-                print(f"   Error: {e}")
-                if e.stderr:
-                    print(f"   Stderr: {e.stderr}")
-            except subprocess.TimeoutExpired:
-                print(f"⏰ F3D timed out for {os.path.basename(file_path)}")
-            except Exception as e:
-                print(f"💥 Unexpected error generating thumbnail: {e}")
-                print(f"   Traceback: {traceback.format_exc()}")
-                
-            # Mark this extension as failed to avoid repeated attempts
-            ext = os.path.splitext(file_path)[1].lower()
-            if ext not in self.failed_attempts:
-                self.failed_attempts[ext] = set()
-            self.failed_attempts[ext].add(file_path)
-            
-            # Remove from active generations
-            if cache_key in self.active_generations:
-                del self.active_generations[cache_key]
+    def decode_level(self, job):
+        """Decoder entry point - reads one pyramid level on a worker thread and hands it to the GUI thread"""
+        level_key = job.job_key
+        thumb_key, level = level_key.rsplit("_", 1)
+        with metrics.timer("decode_seconds"):
+            image = self.load_level(thumb_key, int(level))
+        metrics.count("thumbnail_lookups", tier="disk", result="miss" if image is None else "hit")
+        self.image_decoded.emit(level_key, job.file_path, image)
+    
+    def load_level(self, thumb_key, level):
+        """Decode one cached pyramid level into a QImage, or None if there is none yet.
+        Runs on decode workers - QImage is safe off the GUI thread, QPixmap is not."""
+        # Check if the level exists on disk (even after Nuke restart)
+        # The key changes whenever the source or the render settings change, so existing means valid
+        level_file = os.path.join(self.cache_dir, f"{thumb_key}_{level}.png")
+        if os.path.exists(level_file):
+            image = QtGui.QImage(level_file)
+            if not image.isNull():
+                if thumb_key not in self.used:
+                    self.used.add(thumb_key)
+                    self.renderer.mark_used(thumb_key)
+                return image
+            print(f"❌ Error loading cached thumbnail {level_file}")
+        return None
+    
+    def on_image_decoded(self, level_key, file_path, image):
+        """A decode finished - runs on the GUI thread, the only place pixmaps are created"""
+        if image is None:
+            # Nothing cached yet - the next paint falls through to a render or a placeholder
+            self.missing.add(level_key)
+        else:
+            self.cache.put(level_key, QtGui.QPixmap.fromImage(image))
+        self.pixmap_ready.emit(file_path)
+    
+    def get_folder_thumbnail(self, folder_path, size, priority=PRIORITY_NORMAL):
+        """Mosaic of a folder's cached child thumbnails fitted to size, or None to show the folder icon"""
+        if not self.ready:
+            return None
+        state = self.mosaics.get(folder_path)
+        mosaic_key = f"mosaic:{folder_path}"
+        pixmap = self.cache.get(mosaic_key)
+        if pixmap is not None:
+            pixmap = self.cache.fitted(mosaic_key, pixmap, size)
+            if state:
+                return pixmap
+        # Unknown, out of date or evicted from memory - the worker reuses the mosaic file if the children
+        # did not change. An out of date mosaic is still shown until the new one is ready.
+        if state is not False:
+            self.mosaic_builder.submit(folder_path, folder_path, priority)
+        return pixmap
+    
+    def compose_mosaic(self, job):
+        """Mosaic worker entry point - builds or loads one folder's mosaic and hands it to the GUI thread"""
+        with metrics.timer("mosaic_seconds"):
+            image = self.load_mosaic(job.file_path)
+        self.mosaic_ready.emit(job.file_path, image)
+    
+    def load_mosaic(self, folder_path):
+        """QImage of a folder's mosaic, composed from up to MOSAIC_TILES cached child thumbnails.
+        Only thumbnails already in the cache are used - a folder tile never triggers a render."""
+        try:
+            entries = DirectoryScanner.read_directory(folder_path)
+        except OSError:
+            return None
         
-        # Start generation in background thread
-        thread = threading.Thread(target=generate_thumbnail, daemon=True)
-        thread.start()
+        tile_level = thumbnail_level(self.MOSAIC_SIZE // 2)
+        tiles = []  # (thumb key, level file)
+        for entry in [entry for entry in entries if entry.kind != "folder"][:self.MOSAIC_SCAN_LIMIT]:
+            thumb_key = self.identity_key(self.file_identity(entry.path, entry.mtime_ns, entry.size))
+            level_file = self.renderer.thumbnail_path(thumb_key, tile_level)
+            if os.path.exists(level_file):
+                tiles.append((thumb_key, level_file))
+                if len(tiles) == self.MOSAIC_TILES:
+                    break
+        if not tiles:
+            return None
+        
+        # Keyed on the children it shows - a child that changes or gets its thumbnail gives a new mosaic
+        tiles_hash = hashlib.md5("|".join(thumb_key for thumb_key, _ in tiles).encode()).hexdigest()[:12]
+        mosaic_file = self.renderer.thumbnail_path(f"{self.path_hash(folder_path)}-mosaic-{tiles_hash}", self.MOSAIC_SIZE)
+        if os.path.exists(mosaic_file):
+            image = QtGui.QImage(mosaic_file)
+            if not image.isNull():
+                try:
+                    os.utime(mosaic_file)  # Mark as recently used for the cache cleanup
+                except OSError:
+                    pass
+                return image
+        
+        image = QtGui.QImage(self.MOSAIC_SIZE, self.MOSAIC_SIZE, QtGui.QImage.Format_ARGB32_Premultiplied)
+        image.fill(QtCore.Qt.transparent)
+        painter = QtGui.QPainter(image)
+        painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
+        # A single child fills the tile, more are laid out on a 2x2 grid
+        cell = self.MOSAIC_SIZE if len(tiles) == 1 else self.MOSAIC_SIZE // 2
+        for i, (_, level_file) in enumerate(tiles):
+            tile = QtGui.QImage(level_file)
+            if tile.isNull():
+                continue
+            tile = tile.scaled(cell - 2, cell - 2, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+            x = (i % 2) * cell + (cell - tile.width()) // 2
+            y = (i // 2) * cell + (cell - tile.height()) // 2
+            painter.drawImage(x, y, tile)
+        painter.end()
+        self.renderer.publish_image(image, mosaic_file)
+        return image
+    
+    def on_mosaic_ready(self, folder_path, image):
+        """A folder mosaic was composed or loaded - runs on the GUI thread"""
+        self.cache.discard_fitted(f"mosaic:{folder_path}")
+        if image is None:
+            self.mosaics[folder_path] = False
+            self.cache.discard(f"mosaic:{folder_path}")
+        else:
+            self.mosaics[folder_path] = True
+            pixmap = QtGui.QPixmap.fromImage(image)
+            # Folder badge in the corner - tells a folder tile from a model thumbnail
+            badge = self.MOSAIC_SIZE // 4
+            icon = QtWidgets.QApplication.style().standardIcon(QtWidgets.QStyle.SP_DirIcon)
+            painter = QtGui.QPainter(pixmap)
+            painter.drawPixmap(4, self.MOSAIC_SIZE - badge - 4, icon.pixmap(badge, badge))
+            painter.end()
+            self.cache.put(f"mosaic:{folder_path}", pixmap)
+        self.pixmap_ready.emit(folder_path)
+    
+    def forget_mosaic(self, folder_path):
+        """A child of this folder got a new thumbnail - check its mosaic again when it is next painted"""
+        if folder_path in self.mosaics:
+            self.mosaics[folder_path] = None
+    
+    def forget_mosaics(self):
+        """Check every folder mosaic again (Refresh) - unchanged ones are reloaded from the cache"""
+        for folder_path in self.mosaics:
+            self.mosaics[folder_path] = None
+    
+    def regenerate(self, file_paths):
+        """Render these assets again - their cached thumbnails and failure records are deleted on a worker thread,
+        then they are queued like a newly opened folder. The rest of the shared cache is left alone."""
+        threading.Thread(target=self._regenerate, args=(list(file_paths),), daemon=True).start()
+    
+    def _regenerate(self, file_paths):
+        regenerated = []
+        for file_path in file_paths:
+            # Keyed on the file as it is now - thumbnails of older versions are left to the cache cleanup
+            identity = self.file_identity(file_path)
+            thumb_key = self.identity_key(identity)
+            self.renderer.remove(thumb_key)
+            self.renderer.failures.clear(file_path)
+            regenerated.append((file_path, identity, thumb_key))
+        self.regenerated.emit(regenerated)
+    
+    def on_regenerated(self, regenerated):
+        """The thumbnails are deleted - runs on the GUI thread, repaints the cells and queues the renders"""
+        for file_path, identity, thumb_key in regenerated:
+            known = self.keys.get(file_path)
+            if known is not None:
+                self.forget(known[2])
+            self.keys[file_path] = (identity["mtime_ns"], identity["size"], thumb_key)
+            self.forget(thumb_key)
+            self.forget_mosaic(os.path.dirname(file_path))
+            self.pixmap_ready.emit(file_path)
+        self.queue_renders([file_path for file_path, _, _ in regenerated])
+    
+    def try_async_f3d_generation(self, file_path, thumb_key, priority=PRIORITY_NORMAL):
+        """Queue an F3D thumbnail render on the shared scheduler - cheap assets first within a priority"""
+        self.scheduler.submit(thumb_key, file_path, priority, self.render_cost(file_path), self.view)
+    
+    def render_cost(self, file_path):
+        """Predicted render seconds of an asset, from its format and the size known from its cache key"""
+        known = self.keys.get(file_path)
+        return self.renderer.costs.predict(os.path.splitext(file_path)[1].lower(), known[1] if known else None)
+    
+    def set_view(self, view):
+        """The grid now shows another folder or search (any hashable id). Renders queued for the previous one are
+        dropped and running ones stopped - unless NEARLY_DONE of their predicted time has passed."""
+        if view == self.view:
+            return
+        self.view = view
+        now = time.perf_counter()
+        dropped, cancelled = self.scheduler.retain_view(
+            view, lambda job: now - job.started_at >= self.NEARLY_DONE * job.cost)
+        metrics.count("renders_dropped", dropped)
+        metrics.count("renders_cancelled", cancelled)
+        if dropped or cancelled:
+            print(f"⏹️  Left the view: {dropped} queued renders dropped, {cancelled} running renders stopped")
+    
+    def queue_renders(self, file_paths, priority=PRIORITY_NORMAL):
+        """Queue renders for a folder's models so off-screen cells are ready when scrolled to.
+        Assets with a decoded pixmap are skipped, the cache files of the others are checked on a worker
+        thread - render workers only get the thumbnails that are missing."""
+        candidates = []
+        for file_path in file_paths:
+            ext = os.path.splitext(file_path)[1].lower()
+            if ext in F3D_FORMATS and self.can_render(ext) and not self.is_failed(file_path):
+                thumb_key = self.cache_key(file_path)
+                if not any(f"{thumb_key}_{level}" in self.cache for level in THUMBNAIL_LEVELS):
+                    candidates.append((file_path, thumb_key, self.render_cost(file_path)))
+        if candidates:
+            threading.Thread(target=self._queue_missing, args=(candidates, priority, self.view), daemon=True).start()
+    
+    def _queue_missing(self, candidates, priority, view):
+        for file_path, thumb_key, cost in candidates:
+            if view != self.view:
+                return  # Left while checking - set_view() already dropped the renders of this view
+            # The top level is written last, so it being there means the whole pyramid is
+            if not os.path.exists(self.renderer.thumbnail_path(thumb_key)):
+                self.scheduler.submit(thumb_key, file_path, priority, cost, view)
+    
+    def can_render(self, ext):
+        """True if thumbnails of this format can be made - textures, and point clouds with numpy, need no F3D"""
+        if ext in TEXTURE_FORMATS or (np is not None and ext in PointCloudReader.FORMATS):
+            return True
+        return ext in F3D_FORMATS and self.f3d_available
+    
+    @staticmethod
+    def path_hash(file_path):
+        """Short unique hash from the full path, used to name cache files"""
+        return hashlib.md5(file_path.encode()).hexdigest()[:12]
+    
+    @staticmethod
+    def file_identity(file_path, mtime_ns=None, file_size=None):
+        """Everything a thumbnail depends on: source path, mtime and size, F3D version and render options"""
+        if mtime_ns is None or file_size is None:
+            try:
+                stat = os.stat(file_path)
+                mtime_ns, file_size = stat.st_mtime_ns, stat.st_size
+            except OSError:
+                mtime_ns, file_size = 0, -1
+        return {
+            "path": file_path,
+            "mtime_ns": mtime_ns,
+            "size": file_size,
+            "f3d_version": get_f3d_version(),
+            "render_options": " ".join(f3d_render_options()),
+        }
+    
+    @classmethod
+    def identity_key(cls, identity):
+        """Cache key for an identity: '<path hash>-<identity hash>', cache files are '<key>_<size>.png'"""
+        identity_text = "|".join(str(identity[field]) for field in
+                                 ("path", "mtime_ns", "size", "f3d_version", "render_options"))
+        identity_hash = hashlib.md5(identity_text.encode()).hexdigest()[:12]
+        return f"{cls.path_hash(identity['path'])}-{identity_hash}"
+    
+    def cache_key(self, file_path, mtime_ns=None, file_size=None):
+        """Cache key of a file. Pass mtime/size when known (e.g. from a directory scan) to skip the stat,
+        otherwise the file is stat'ed once per session until invalidate_keys() is called."""
+        known = self.keys.get(file_path)
+        if known is not None and (mtime_ns is None or (known[0], known[1]) == (mtime_ns, file_size)):
+            return known[2]
+        identity = self.file_identity(file_path, mtime_ns, file_size)
+        thumb_key = self.identity_key(identity)
+        self.keys[file_path] = (identity["mtime_ns"], identity["size"], thumb_key)
+        return thumb_key
+    
+    def invalidate_keys(self, file_paths=None):
+        """Forget memoized keys (all, or for the given paths) so changed files get new keys"""
+        if file_paths is None:
+            self.keys = {}
+        else:
+            for file_path in file_paths:
+                self.keys.pop(file_path, None)
+    
+    def generate_thumbnail(self, job):
+        """Scheduler entry point - renders on a worker thread and announces the result to the GUI thread"""
+        # Failures are recorded by the renderer in the shared failure log
+        outcome = self.renderer.render(job.file_path, job.job_key, cancel_event=job.cancel_event)
+        # Queued to the GUI thread, which owns the in-memory cache and the view
+        if outcome == RENDER_BUSY:
+            self.render_deferred.emit(job.job_key, job.file_path, job)
+        else:
+            self.thumbnail_ready.emit(job.job_key, job.file_path, outcome)
+    
+    def on_render_deferred(self, cache_key, file_path, job):
+        """Another workstation is rendering this asset - wait for its result instead of rendering it too"""
+        self.deferred[cache_key] = (file_path, job.view, job.cost)
+        if not self.deferred_timer.isActive():
+            self.deferred_timer.start()
+    
+    def check_deferred(self):
+        """Queue the deferred assets again - the worker picks up a finished thumbnail from the cache,
+        renders it if the lease expired, or defers it once more. Assets of a view that was left are dropped,
+        they are queued again when it is shown."""
+        deferred, self.deferred = self.deferred, {}
+        self.deferred_timer.stop()
+        for cache_key, (file_path, view, cost) in deferred.items():
+            if view is None or view == self.view:
+                # Same view and cost as the first submit, so leaving the folder still cancels it
+                self.scheduler.submit(cache_key, file_path, PRIORITY_NORMAL, cost, view)
+    
+    def is_failed(self, file_path):
+        """True if this version of the file failed to render and is not due for a retry yet.
+        Only looks at failures already seen this session - render workers read the shared records."""
+        return self.renderer.failures.blocks(file_path, self.cache_key(file_path), load=False)
+    
+    def forget(self, cache_key):
+        """Drop every in-memory level of a thumbnail so the next paint reloads it from disk"""
+        self.cache.discard_asset(cache_key)
+        for level in THUMBNAIL_LEVELS:
+            self.missing.discard(f"{cache_key}_{level}")
+    
+    def forget_missing(self, cache_key):
+        """Look up levels of a thumbnail found missing earlier on disk again. True if there were any."""
+        levels = {f"{cache_key}_{level}" for level in THUMBNAIL_LEVELS} & self.missing
+        self.missing -= levels
+        return bool(levels)
     
     def create_placeholder(self, ext, size, status=""):
         """Create a colored placeholder with extension text"""
+        # Placeholders are requested on every repaint of a cell - build each one only once
+        placeholder_key = (ext, size, status)
+        if placeholder_key in self.placeholders:
+            return self.placeholders[placeholder_key]
+        
         if ext == '.abc':
             color = QtGui.QColor("#e67e22")  # Distinct color for Alembic
         elif ext in ['.obj', '.fbx']:
@@ -273,27 +2435,1110 @@ class ThumbnailCache:
         painter.drawText(pixmap.rect(), QtCore.Qt.AlignCenter, ext_text)
         painter.end()
         
+        self.placeholders[placeholder_key] = pixmap
         return pixmap
 
+class MetadataReader:
+    """Reads polygon/point counts, bounds and layer metadata of 3D assets from their headers, or by
+    streaming through text formats - a file is never loaded whole. Safe off the GUI thread."""
+    VERSION = 1  # Stored with cached metadata - bump it when a reader changes and assets are read again
+    FORMATS = {'.ply', '.splat', '.obj', '.stl', '.gltf', '.glb', '.usd', '.usda', '.usdc', '.usdz'}
+    HEADER_BYTES = 1 << 16  # PLY headers and USD layer metadata live in the first bytes
+    STREAM_LIMIT = 256 * 1024 * 1024  # Bytes of an OBJ / ASCII STL counted at most, larger files are extrapolated
+    JSON_LIMIT = 64 * 1024 * 1024  # Largest .gltf parsed (embedded buffers make them big)
+    CHUNK_SIZE = 1 << 20
+    SPLAT_RECORD = 32  # Bytes per gaussian in a .splat file, see PointCloudReader.SPLAT_DTYPE
+    USD_FIELDS = {"upAxis": "up_axis", "metersPerUnit": "meters_per_unit", "defaultPrim": "default_prim",
+                  "startTimeCode": "start_frame", "endTimeCode": "end_frame"}
+    
+    @classmethod
+    def read(cls, file_path):
+        """Metadata dict of a file, {} if there is nothing cheap to read. Raises OSError if it cannot be opened."""
+        ext = os.path.splitext(file_path)[1].lower()
+        readers = {'.ply': cls.read_ply, '.splat': cls.read_splat, '.obj': cls.read_obj, '.stl': cls.read_stl,
+                   '.gltf': cls.read_gltf, '.glb': cls.read_gltf, '.usd': cls.read_usd, '.usda': cls.read_usd,
+                   '.usdc': cls.read_usd, '.usdz': cls.read_usdz}
+        reader = readers.get(ext)
+        if reader is None:
+            return {}
+        with open(file_path, 'rb') as f:
+            try:
+                return reader(f)
+            except (ValueError, KeyError, IndexError, TypeError, AttributeError, struct.error) as e:
+                print(f"⚠️  Unreadable metadata in {os.path.basename(file_path)}: {e}")
+                return {}
+    
+    @staticmethod
+    def file_size(f):
+        return os.fstat(f.fileno()).st_size
+    
+    @classmethod
+    def stream_counts(cls, f, tokens):
+        """Count byte tokens ({token: field}) through a file. Past STREAM_LIMIT only chunks spread evenly over
+        the file are read and the counts are extrapolated - OBJ files list all vertices before the faces."""
+        counts = dict.fromkeys(tokens, 0)
+        size = cls.file_size(f)
+        sampled = size > cls.STREAM_LIMIT
+        chunk_count = cls.STREAM_LIMIT // cls.CHUNK_SIZE
+        overlap = max(len(token) for token in tokens) - 1
+        previous = b"\n"  # Tokens anchored on a line start also match the first line
+        read = 0
+        for index in itertools.count():
+            if sampled:
+                if index == chunk_count:
+                    break
+                f.seek(index * (size - cls.CHUNK_SIZE) // (chunk_count - 1))
+                previous = b""
+            chunk = f.read(cls.CHUNK_SIZE)
+            if not chunk:
+                break
+            read += len(chunk)
+            # The tail of the previous chunk catches tokens cut in two, it is too short to hold a whole one
+            text = previous + chunk
+            for token in tokens:
+                counts[token] += text.count(token)
+            previous = chunk[-overlap:]
+        meta = {"estimated": True} if sampled else {}
+        scale = size / read if sampled and read else 1
+        for token, field in tokens.items():
+            meta[field] = int(counts[token] * scale)
+        return meta
+    
+    @classmethod
+    def read_ply(cls, f):
+        header = f.read(cls.HEADER_BYTES)
+        end = header.find(b"end_header")
+        if not header.startswith(b"ply") or end < 0:
+            return {}
+        meta = {}
+        counts = {}
+        vertex_properties = set()
+        element = None
+        for line in header[:end].decode('ascii', 'replace').splitlines():
+            words = line.split()
+            if len(words) >= 2 and words[0] == "format":
+                meta["encoding"] = words[1]
+            elif len(words) >= 3 and words[0] == "element":
+                element = words[1]
+                counts[element] = int(words[2])
+            elif len(words) >= 3 and words[0] == "property" and element == "vertex":
+                vertex_properties.add(words[-1])
+        if counts.get("face"):
+            meta["vertices"] = counts.get("vertex", 0)
+            meta["faces"] = counts["face"]
+        else:
+            meta["points"] = counts.get("vertex", 0)
+            if {"f_dc_0", "opacity"} <= vertex_properties:
+                meta["splat"] = True
+        return meta
+    
+    @classmethod
+    def read_splat(cls, f):
+        return {"points": cls.file_size(f) // cls.SPLAT_RECORD, "splat": True}
+    
+    @classmethod
+    def read_obj(cls, f):
+        return cls.stream_counts(f, {b"\nv ": "vertices", b"\nf ": "faces"})
+    
+    @classmethod
+    def read_stl(cls, f):
+        header = f.read(84)
+        if len(header) == 84:
+            # Binary STL: 80 byte header, triangle count, 50 bytes per triangle
+            triangles = struct.unpack("<I", header[80:84])[0]
+            if 84 + triangles * 50 == cls.file_size(f):
+                return {"faces": triangles}
+        f.seek(0)
+        return cls.stream_counts(f, {b"endfacet": "faces"})
+    
+    @classmethod
+    def read_gltf(cls, f):
+        if f.read(4) == b"glTF":
+            # GLB: 12 byte header, then the JSON chunk - the binary chunk after it is never read
+            f.seek(12)
+            length, kind = struct.unpack("<II", f.read(8))
+            if kind != 0x4E4F534A:  # "JSON"
+                return {}
+            document = json.loads(f.read(length))
+        else:
+            if cls.file_size(f) > cls.JSON_LIMIT:
+                return {}
+            f.seek(0)
+            document = json.loads(f.read())
+        
+        accessors = document.get("accessors", [])
+        meta = {"meshes": len(document.get("meshes", [])), "vertices": 0, "faces": 0}
+        low = high = None
+        for mesh in document.get("meshes", []):
+            for primitive in mesh.get("primitives", []):
+                position = primitive.get("attributes", {}).get("POSITION")
+                if position is None:
+                    continue
+                accessor = accessors[position]
+                meta["vertices"] += accessor.get("count", 0)
+                indices = accessors[primitive["indices"]] if "indices" in primitive else accessor
+                corners = indices.get("count", 0)
+                mode = primitive.get("mode", 4)
+                if mode == 4:  # Triangles
+                    meta["faces"] += corners // 3
+                elif mode in (5, 6):  # Triangle strip / fan
+                    meta["faces"] += max(0, corners - 2)
+                # POSITION accessors must carry their bounds - mesh space, node transforms are not applied
+                if len(accessor.get("min", ())) == 3 and len(accessor.get("max", ())) == 3:
+                    low = accessor["min"] if low is None else [min(a, b) for a, b in zip(low, accessor["min"])]
+                    high = accessor["max"] if high is None else [max(a, b) for a, b in zip(high, accessor["max"])]
+        if low is not None:
+            meta["bounds"] = [low, high]
+        generator = document.get("asset", {}).get("generator")
+        if generator:
+            meta["generator"] = generator
+        return meta
+    
+    @classmethod
+    def read_usd(cls, f):
+        return cls.usd_layer(f.read(cls.HEADER_BYTES))
+    
+    @classmethod
+    def read_usdz(cls, f):
+        """A usdz is an uncompressed zip - the first file in it is the root layer"""
+        header = f.read(30)
+        if header[:4] != b"PK\x03\x04":
+            return {}
+        method = struct.unpack("<H", header[8:10])[0]
+        name_length, extra_length = struct.unpack("<HH", header[26:30])
+        name = f.read(name_length).decode('utf-8', 'replace')
+        f.seek(30 + name_length + extra_length)
+        meta = cls.usd_layer(f.read(cls.HEADER_BYTES)) if method == 0 else {}
+        meta["root_layer"] = name
+        return meta
+    
+    @classmethod
+    def usd_layer(cls, head):
+        """Encoding and layer metadata (up axis, units, default prim, frame range) from the start of a layer"""
+        if head.startswith(b"PXR-USDC"):
+            # Binary crate file - its layer metadata sits in tables at the end, only the version is cheap
+            return {"encoding": "usdc", "version": ".".join(str(part) for part in head[8:11])}
+        if not head.startswith(b"#usda"):
+            return {}
+        text = head.decode('utf-8', 'replace')
+        meta = {"encoding": "usda", "version": text.split("\n", 1)[0][5:].strip()}
+        # Layer metadata comes before the first prim
+        prim = re.search(r"^\s*(def|over|class)\b", text, re.M)
+        layer = text[:prim.start()] if prim else text
+        for field, key in cls.USD_FIELDS.items():
+            match = re.search(rf"\b{field}\s*=\s*\"?([^\"\s)]+)", layer)
+            if not match:
+                continue
+            value = match.group(1)
+            if key not in ("up_axis", "default_prim"):
+                try:
+                    value = float(value)
+                except ValueError:
+                    continue
+            meta[key] = value
+        return meta
+    
+    @staticmethod
+    def format_count(count):
+        """1234567 -> 1.2M"""
+        for limit, suffix in ((1e9, "G"), (1e6, "M"), (1e3, "k")):
+            if count >= limit:
+                return f"{count / limit:.3g}{suffix}"
+        return str(int(count))
+    
+    @staticmethod
+    def format_size(size):
+        for limit, suffix in ((1 << 30, "GB"), (1 << 20, "MB"), (1 << 10, "KB")):
+            if size >= limit:
+                return f"{size / limit:.1f} {suffix}"
+        return f"{size} B"
+    
+    @classmethod
+    def caption(cls, entry):
+        """Short line painted over a thumbnail, e.g. "1.2M faces" - "" if nothing is known yet"""
+        meta = entry.meta or {}
+        approx = "~" if meta.get("estimated") else ""
+        for field, name in (("faces", "face"), ("points", "splat" if meta.get("splat") else "point")):
+            count = meta.get(field)
+            if count:
+                return f"{approx}{cls.format_count(count)} {name}{'s' if count != 1 else ''}"
+        return ""
+    
+    @classmethod
+    def details(cls, entry):
+        """Lines for the tooltip of a grid cell"""
+        lines = [entry.path]
+        if entry.size is not None:
+            lines.append(f"Size: {cls.format_size(entry.size)}")
+        if entry.mtime_ns:
+            lines.append(f"Modified: {time.strftime('%Y-%m-%d %H:%M', time.localtime(entry.mtime_ns / 1e9))}")
+        meta = entry.meta or {}
+        approx = " (estimated)" if meta.get("estimated") else ""
+        for field in ("faces", "vertices", "points", "meshes"):
+            if meta.get(field):
+                lines.append(f"{field.capitalize()}: {meta[field]:,}{approx if field != 'meshes' else ''}")
+        if "bounds" in meta:
+            low, high = meta["bounds"]
+            lines.append("Bounds: " + " x ".join(f"{b - a:.3g}" for a, b in zip(low, high)))
+        for field, label in (("up_axis", "Up axis"), ("meters_per_unit", "Meters per unit"),
+                             ("default_prim", "Default prim"), ("encoding", "Encoding"), ("generator", "Generator")):
+            if field in meta:
+                lines.append(f"{label}: {meta[field]}")
+        if "start_frame" in meta and "end_frame" in meta:
+            lines.append(f"Frames: {meta['start_frame']:g}-{meta['end_frame']:g}")
+        return "\n".join(lines)
+
+
+class AssetEntry:
+    """One row of the asset grid: a folder, a 3D model or a texture"""
+    __slots__ = ("name", "path", "kind", "ext", "size", "mtime_ns", "meta")
+    
+    def __init__(self, name, path, kind, size=None, mtime_ns=None):
+        self.name = name
+        self.path = path
+        self.kind = kind  # "folder", "model" or "texture"
+        self.ext = "" if kind == "folder" else os.path.splitext(name)[1].lower()
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.meta = None  # MetadataReader dict, filled in the background once the folder is shown
+
+
+class DirectoryScanner(QtCore.QObject):
+    """Lists folders on a worker thread with os.scandir, streaming rows back to the GUI thread"""
+    # (scan id, [AssetEntry]) - emitted in batches while the folder is read
+    entries_found = QtCore.Signal(int, object)
+    # (scan id, path, error message or "")
+    scan_finished = QtCore.Signal(int, str, str)
+    # (path, [AssetEntry]) - fresh listing of a folder re-read by rescan()
+    folder_updated = QtCore.Signal(str, object)
+    
+    BATCH_SIZE = 200
+    BATCH_INTERVAL = 0.1  # Seconds between batches on slow shares
+    MAX_LISTINGS = 500  # Folders kept in memory
+    
+    def __init__(self, library_index=None, parent=None):
+        super().__init__(parent)
+        self.library_index = library_index  # Updated with every folder read from disk
+        self.lock = threading.Lock()
+        self.listings = collections.OrderedDict()  # path -> (dir mtime_ns, [AssetEntry])
+        self.rescans = set()  # Folders being re-read by rescan()
+        self.scan_id = 0
+    
+    def scan(self, path, force=False):
+        """Start listing a folder in the background. Returns the scan id carried by its signals."""
+        with self.lock:
+            self.scan_id += 1
+            scan_id = self.scan_id
+        thread = threading.Thread(target=self._scan, args=(scan_id, path, force), daemon=True)
+        thread.start()
+        return scan_id
+    
+    def rescan(self, path):
+        """Re-read a folder in the background after a change was seen - emits folder_updated"""
+        with self.lock:
+            if path in self.rescans:
+                return  # Still reading it, e.g. a slow share polled again
+            self.rescans.add(path)
+        thread = threading.Thread(target=self._rescan, args=(path,), daemon=True)
+        thread.start()
+    
+    @classmethod
+    def read_directory(cls, path):
+        """Synchronously list a folder (used by background crawls) - returns [AssetEntry]"""
+        entries = []
+        with os.scandir(path) as it:
+            for dir_entry in it:
+                try:
+                    entry = cls.make_entry(dir_entry, path)
+                except OSError as e:
+                    print(f"❌ Cannot read {dir_entry.name}: {e}")
+                    continue
+                if entry is not None:
+                    entries.append(entry)
+        entries.sort(key=lambda entry: entry.name)
+        return entries
+    
+    @staticmethod
+    def make_entry(dir_entry, path):
+        """AssetEntry for a scandir entry, or None if the browser does not show it"""
+        # Ignore folders starting with dot
+        if dir_entry.name.startswith('.'):
+            return None
+        item_path = os.path.join(path, dir_entry.name).replace('\\', '/')
+        # scandir caches the entry type (and on Windows the stat) from the directory read itself
+        if dir_entry.is_dir():
+            return AssetEntry(dir_entry.name, item_path, "folder")
+        ext = os.path.splitext(dir_entry.name)[1].lower()
+        if ext in MODEL_FORMATS:
+            kind = "model"
+        elif ext in TEXTURE_FORMATS:
+            kind = "texture"
+        else:
+            return None
+        stat = dir_entry.stat()
+        return AssetEntry(dir_entry.name, item_path, kind, stat.st_size, stat.st_mtime_ns)
+    
+    def _is_current(self, scan_id):
+        return scan_id == self.scan_id
+    
+    def _scan(self, scan_id, path, force):
+        start = time.perf_counter()
+        try:
+            dir_mtime = os.stat(path).st_mtime_ns
+            with self.lock:
+                listing = self.listings.get(path)
+                if listing is not None:
+                    self.listings.move_to_end(path)
+            
+            # Unchanged folder - hand back the cached rows without reading it again
+            if listing is not None and listing[0] == dir_mtime and not force:
+                self.entries_found.emit(scan_id, listing[1])
+                self.scan_finished.emit(scan_id, path, "")
+                metrics.observe("scan_seconds", time.perf_counter() - start, source="memory")
+                return
+            
+            entries = []
+            batch = []
+            last_emit = time.time()
+            with os.scandir(path) as it:
+                for dir_entry in it:
+                    if not self._is_current(scan_id):
+                        return  # The browser moved on to another folder
+                    try:
+                        entry = self.make_entry(dir_entry, path)
+                    except OSError as e:
+                        print(f"❌ Cannot read {dir_entry.name}: {e}")
+                        continue
+                    if entry is None:
+                        continue
+                    entries.append(entry)
+                    batch.append(entry)
+                    if len(batch) >= self.BATCH_SIZE or time.time() - last_emit > self.BATCH_INTERVAL:
+                        self.entries_found.emit(scan_id, batch)
+                        batch = []
+                        last_emit = time.time()
+            if batch:
+                self.entries_found.emit(scan_id, batch)
+            
+            entries.sort(key=lambda entry: entry.name)
+            self._store_listing(path, dir_mtime, entries)
+            self.scan_finished.emit(scan_id, path, "")
+            metrics.observe("scan_seconds", time.perf_counter() - start, source="disk")
+            metrics.count("scan_entries", len(entries))
+            
+            # Keep the library index in step with what was just read
+            if self.library_index is not None:
+                self.library_index.update_directory(path, dir_mtime, entries)
+        except FileNotFoundError:
+            self.scan_finished.emit(scan_id, path, "❌ Directory not found")
+        except Exception as e:
+            self.scan_finished.emit(scan_id, path, f"Error loading assets: {str(e)}")
+    
+    def _rescan(self, path):
+        try:
+            dir_mtime = os.stat(path).st_mtime_ns
+            entries = self.read_directory(path)
+        except OSError as e:
+            print(f"❌ Cannot re-read {path}: {e}")
+            return
+        finally:
+            with self.lock:
+                self.rescans.discard(path)
+        self._store_listing(path, dir_mtime, entries)
+        self.folder_updated.emit(path, entries)
+        if self.library_index is not None:
+            self.library_index.update_directory(path, dir_mtime, entries)
+    
+    def _store_listing(self, path, dir_mtime, entries):
+        with self.lock:
+            self.listings[path] = (dir_mtime, entries)
+            self.listings.move_to_end(path)
+            while len(self.listings) > self.MAX_LISTINGS:
+                self.listings.popitem(last=False)
+
+
+class FolderWatcher(QtCore.QObject):
+    """Reports changes to the folder shown in the browser, debounced.
+    Local folders use QFileSystemWatcher, network shares (where change notifications are unreliable) are polled."""
+    folder_changed = QtCore.Signal(str)
+    
+    DEBOUNCE_MS = 500  # A publish writes several files, report them as one change
+    MAX_WATCHED_FILES = 1000  # Files watched for in-place edits, the folder itself is always watched
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.path = None
+        self.watcher = QtCore.QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.on_change)
+        self.watcher.fileChanged.connect(self.on_change)
+        self.debounce_timer = QtCore.QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(self.DEBOUNCE_MS)
+        self.debounce_timer.timeout.connect(self.emit_change)
+        self.poll_timer = QtCore.QTimer(self)
+        self.poll_timer.setInterval(WATCH_POLL_SECONDS * 1000)
+        self.poll_timer.timeout.connect(self.emit_change)
+    
+    def watch(self, path, entries=()):
+        """Watch a folder and its asset files (as listed), replacing what was watched before"""
+        if path != self.path:
+            self.stop()
+        if not WATCH_FOLDERS:
+            return
+        self.path = path
+        if is_network_path(path):
+            # Polling re-lists the folder, which also catches files changed in place
+            if not self.poll_timer.isActive():
+                self.poll_timer.start()
+            return
+        watched = set(self.watcher.directories() + self.watcher.files())
+        wanted = {path}
+        wanted.update(entry.path for entry in itertools.islice(
+            (entry for entry in entries if entry.kind != "folder"), self.MAX_WATCHED_FILES))
+        if watched - wanted:
+            self.watcher.removePaths(list(watched - wanted))
+        if wanted - watched:
+            self.watcher.addPaths(list(wanted - watched))
+    
+    def stop(self):
+        self.path = None
+        self.poll_timer.stop()
+        self.debounce_timer.stop()
+        watched = self.watcher.directories() + self.watcher.files()
+        if watched:
+            self.watcher.removePaths(watched)
+    
+    def on_change(self, changed_path):
+        self.debounce_timer.start()
+    
+    def emit_change(self):
+        if self.path is not None:
+            self.folder_changed.emit(self.path)
+
+
+class LibraryIndex(QtCore.QObject):
+    """Persistent SQLite index of the whole asset library, stored next to the thumbnail cache"""
+    # (search id, [AssetEntry]) - emitted from the search thread
+    search_finished = QtCore.Signal(int, object)
+    # Number of folders read from disk by a crawl
+    crawl_finished = QtCore.Signal(int)
+    # (request id, {path: metadata}) - emitted in batches from the metadata thread
+    metadata_found = QtCore.Signal(int, object)
+    
+    SEARCH_LIMIT = 1000
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS assets (
+            path TEXT PRIMARY KEY,
+            dir TEXT NOT NULL,
+            name TEXT NOT NULL,
+            name_lower TEXT NOT NULL,
+            ext TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            size INTEGER,
+            mtime_ns INTEGER,
+            thumb_key TEXT
+        );
+        CREATE INDEX IF NOT EXISTS assets_dir ON assets(dir);
+        CREATE INDEX IF NOT EXISTS assets_name ON assets(name_lower);
+        CREATE TABLE IF NOT EXISTS dirs (
+            path TEXT PRIMARY KEY,
+            mtime_ns INTEGER,
+            scanned_at REAL
+        );
+        CREATE TABLE IF NOT EXISTS metadata (
+            path TEXT PRIMARY KEY,
+            size INTEGER,
+            mtime_ns INTEGER,
+            version INTEGER,
+            data TEXT NOT NULL
+        );
+    """
+    METADATA_BATCH_SECONDS = 0.25  # Metadata read from disk is sent to the grid at this pace
+    
+    def __init__(self, db_path, parent=None):
+        super().__init__(parent)
+        self.db_path = db_path
+        self.local = threading.local()  # One connection per thread, as sqlite3 requires
+        self.write_lock = threading.Lock()
+        self.search_id = 0
+        self.metadata_id = 0
+        self.crawling = False
+    
+    def connection(self):
+        """SQLite connection for the calling thread, schema created on first use"""
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            # Generous timeout - other workstations may be writing to the shared index
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.executescript(self.SCHEMA)
+            self.local.conn = conn
+        return conn
+    
+    @staticmethod
+    def entry_from_row(row):
+        path, name, kind, size, mtime_ns = row
+        return AssetEntry(name, path, kind, size, mtime_ns)
+    
+    def update_directory(self, dir_path, dir_mtime, entries):
+        """Replace the indexed contents of one folder - never call from the GUI thread"""
+        try:
+            with self.write_lock:
+                conn = self.connection()
+                with conn:
+                    # Folders that disappeared take their whole subtree out of the index
+                    new_paths = {entry.path for entry in entries}
+                    old_folders = [row[0] for row in conn.execute(
+                        "SELECT path FROM assets WHERE dir = ? AND kind = 'folder'", (dir_path,))]
+                    for folder in old_folders:
+                        if folder not in new_paths:
+                            self._delete_tree(conn, folder)
+                    conn.executemany("DELETE FROM metadata WHERE path = ?", [
+                        row for row in conn.execute(
+                            "SELECT path FROM assets WHERE dir = ? AND kind != 'folder'", (dir_path,))
+                        if row[0] not in new_paths])
+                    
+                    conn.execute("DELETE FROM assets WHERE dir = ?", (dir_path,))
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO assets VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        [(entry.path, dir_path, entry.name, entry.name.lower(), entry.ext, entry.kind,
+                          entry.size, entry.mtime_ns, self.thumb_key(entry)) for entry in entries])
+                    conn.execute("INSERT OR REPLACE INTO dirs VALUES (?, ?, ?)", (dir_path, dir_mtime, time.time()))
+        except Exception as e:
+            print(f"❌ Library index update failed for {dir_path}: {e}")
+    
+    def remove_directory(self, dir_path):
+        """Drop a folder that no longer exists, with everything below it"""
+        try:
+            with self.write_lock:
+                conn = self.connection()
+                with conn:
+                    self._delete_tree(conn, dir_path)
+        except Exception as e:
+            print(f"❌ Library index update failed for {dir_path}: {e}")
+    
+    @staticmethod
+    def like_escape(text):
+        """Escape LIKE wildcards so paths and search text match literally (with ESCAPE '\\')"""
+        return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    
+    @classmethod
+    def _delete_tree(cls, conn, dir_path):
+        pattern = cls.like_escape(dir_path) + '/%'
+        conn.execute("DELETE FROM assets WHERE path = ? OR dir = ? OR dir LIKE ? ESCAPE '\\'",
+                     (dir_path, dir_path, pattern))
+        conn.execute("DELETE FROM dirs WHERE path = ? OR path LIKE ? ESCAPE '\\'", (dir_path, pattern))
+        conn.execute("DELETE FROM metadata WHERE path LIKE ? ESCAPE '\\'", (pattern,))
+    
+    @staticmethod
+    def thumb_key(entry):
+        """Thumbnail cache key stored with each file, so cache tools can match rows to cache files"""
+        if entry.kind == "folder":
+            return None
+        return ThumbnailCache.identity_key(ThumbnailCache.file_identity(entry.path, entry.mtime_ns, entry.size))
+    
+    def crawl(self, root):
+        """Bring the index up to date for the whole tree under root, in the background.
+        Folders whose mtime matches the index are not read again."""
+        if self.crawling:
+            return
+        self.crawling = True
+        thread = threading.Thread(target=self._crawl, args=(root,), daemon=True)
+        thread.start()
+    
+    def _crawl(self, root):
+        folders_read = 0
+        start = time.perf_counter()
+        try:
+            pending = [root]
+            while pending:
+                dir_path = pending.pop()
+                try:
+                    dir_mtime = os.stat(dir_path).st_mtime_ns
+                except OSError:
+                    self.remove_directory(dir_path)
+                    continue
+                
+                conn = self.connection()
+                row = conn.execute("SELECT mtime_ns FROM dirs WHERE path = ?", (dir_path,)).fetchone()
+                if row is not None and row[0] == dir_mtime:
+                    # Unchanged folder - only walk into its known subfolders
+                    pending.extend(path for (path,) in conn.execute(
+                        "SELECT path FROM assets WHERE dir = ? AND kind = 'folder'", (dir_path,)))
+                    continue
+                
+                try:
+                    entries = DirectoryScanner.read_directory(dir_path)
+                except OSError as e:
+                    print(f"❌ Cannot index {dir_path}: {e}")
+                    continue
+                self.update_directory(dir_path, dir_mtime, entries)
+                folders_read += 1
+                pending.extend(entry.path for entry in entries if entry.kind == "folder")
+            print(f"📚 Library index up to date ({folders_read} folders read)")
+        except Exception as e:
+            print(f"❌ Library index crawl failed: {e}")
+        finally:
+            metrics.observe("crawl_seconds", time.perf_counter() - start)
+            metrics.count("crawl_folders_read", folders_read)
+            self.crawling = False
+            self.crawl_finished.emit(folders_read)
+    
+    def search(self, text):
+        """Query the index in the background - results arrive through search_finished. Returns the search id."""
+        self.search_id += 1
+        search_id = self.search_id
+        thread = threading.Thread(target=self._search, args=(search_id, text), daemon=True)
+        thread.start()
+        return search_id
+    
+    def _search(self, search_id, text):
+        entries = []
+        start = time.perf_counter()
+        try:
+            needle = self.like_escape(text.lower())
+            # Prefix matches first, then any substring match
+            rows = self.connection().execute(
+                "SELECT path, name, kind, size, mtime_ns FROM assets "
+                "WHERE name_lower LIKE ? ESCAPE '\\' "
+                "ORDER BY name_lower LIKE ? ESCAPE '\\' DESC, kind != 'folder', name_lower LIMIT ?",
+                (f"%{needle}%", f"{needle}%", self.SEARCH_LIMIT)).fetchall()
+            entries = [self.entry_from_row(row) for row in rows]
+        except Exception as e:
+            print(f"❌ Library search failed: {e}")
+        metrics.observe("search_seconds", time.perf_counter() - start)
+        if search_id == self.search_id:
+            self.search_finished.emit(search_id, entries)
+    
+    def load_metadata(self, entries):
+        """Metadata of the files among entries, from the index or read from disk for new and changed files.
+        It arrives in batches through metadata_found. Returns the request id - a newer request stops this one."""
+        self.metadata_id += 1
+        request_id = self.metadata_id
+        files = [entry for entry in entries if entry.meta is None and entry.ext in MetadataReader.FORMATS]
+        if files:
+            thread = threading.Thread(target=self._load_metadata, args=(request_id, files), daemon=True)
+            thread.start()
+        return request_id
+    
+    def _load_metadata(self, request_id, entries):
+        try:
+            # Cached rows are valid while the file keeps its size and mtime
+            conn = self.connection()
+            rows = {}
+            for start in range(0, len(entries), 500):
+                paths = [entry.path for entry in entries[start:start + 500]]
+                rows.update((row[0], row[1:]) for row in conn.execute(
+                    f"SELECT path, size, mtime_ns, version, data FROM metadata WHERE path IN ({','.join('?' * len(paths))})",
+                    paths))
+            cached = {}
+            missing = []
+            for entry in entries:
+                row = rows.get(entry.path)
+                if row is not None and row[:3] == (entry.size, entry.mtime_ns, MetadataReader.VERSION):
+                    cached[entry.path] = json.loads(row[3])
+                else:
+                    missing.append(entry)
+            metrics.count("metadata_cached", len(cached))
+            if cached:
+                self.metadata_found.emit(request_id, cached)
+            
+            batch = {}
+            new_rows = []
+            last_sent = time.perf_counter()
+            for entry in missing:
+                if request_id != self.metadata_id:
+                    break  # The grid moved on - the rest is read when it is shown again
+                start = time.perf_counter()
+                try:
+                    meta = MetadataReader.read(entry.path)
+                except OSError as e:
+                    print(f"❌ Cannot read metadata of {entry.name}: {e}")
+                    continue
+                metrics.observe("metadata_read_seconds", time.perf_counter() - start, format=entry.ext)
+                batch[entry.path] = meta
+                new_rows.append((entry.path, entry.size, entry.mtime_ns, MetadataReader.VERSION, json.dumps(meta)))
+                if time.perf_counter() - last_sent >= self.METADATA_BATCH_SECONDS:
+                    self._store_metadata(request_id, batch, new_rows)
+                    batch, new_rows = {}, []
+                    last_sent = time.perf_counter()
+            if batch:
+                self._store_metadata(request_id, batch, new_rows)
+        except Exception as e:
+            print(f"❌ Metadata lookup failed: {e}")
+    
+    def _store_metadata(self, request_id, batch, rows):
+        try:
+            with self.write_lock:
+                conn = self.connection()
+                with conn:
+                    conn.executemany("INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?, ?)", rows)
+        except sqlite3.Error as e:
+            print(f"❌ Could not store asset metadata: {e}")
+        self.metadata_found.emit(request_id, batch)
+    
+    def asset_count(self):
+        """Number of indexed files and folders"""
+        try:
+            return self.connection().execute("SELECT COUNT(*) FROM assets").fetchone()[0]
+        except Exception:
+            return 0
+
+
+class AssetListModel(QtCore.QAbstractListModel):
+    """Rows of the current folder - filtering never touches the view's widgets"""
+    EntryRole = QtCore.Qt.UserRole + 1
+    
+    # Sort orders offered in the panel - everything but Name puts folders first, then the largest / newest
+    SORT_FIELDS = {"Name": "name", "Size": "size", "Modified": "mtime", "Faces / Points": "complexity"}
+    # Search box terms filtering on file size and metadata, e.g. "size>50mb", "faces<10k", "points>1m"
+    FILTER_TERM = re.compile(r"\b(size|faces|polys|points|verts|vertices)\s*(<=|>=|<|>|=)\s*(\d+(?:\.\d+)?)\s*([kmg]?)b?\b",
+                             re.I)
+    FILTER_FIELDS = {"size": "size", "faces": "faces", "polys": "faces", "points": "points",
+                     "verts": "vertices", "vertices": "vertices"}
+    OPERATORS = {"<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge, "=": operator.eq}
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.entries = []  # Everything found in the folder
+        self.rows = []  # Entries passing the search and texture filters
+        self.row_by_path = {}  # path -> row, to update single cells
+        self.filter_text = ""
+        self.filter_terms = []  # (field, operator, value) parsed from the search text
+        self.show_textures = True
+        self.sort_field = "name"
+    
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+    
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.rows):
+            return None
+        entry = self.rows[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return entry.name
+        if role == QtCore.Qt.ToolTipRole:
+            return MetadataReader.details(entry) if entry.kind != "folder" else entry.path
+        if role == self.EntryRole:
+            return entry
+        return None
+    
+    def set_entries(self, entries):
+        """Replace the folder contents"""
+        self.beginResetModel()
+        self.entries = list(entries)
+        self.rows = self._filtered(self.entries)
+        self.endResetModel()
+    
+    def append_entries(self, entries):
+        """Add rows streamed in by the directory scanner"""
+        self.entries.extend(entries)
+        new_rows = self._filtered(entries, start=len(self.rows))
+        if new_rows:
+            self.beginInsertRows(QtCore.QModelIndex(), len(self.rows), len(self.rows) + len(new_rows) - 1)
+            self.rows.extend(new_rows)
+            self.endInsertRows()
+    
+    @classmethod
+    def parse_filter(cls, text):
+        """(name text, [(field, operator, value)]) from the search box text"""
+        terms = []
+        for field, op, number, unit in cls.FILTER_TERM.findall(text):
+            field = cls.FILTER_FIELDS[field.lower()]
+            # k / m / g are thousands, millions... of faces or points, and KB / MB / GB of file size
+            scale = (1024 if field == "size" else 1000) ** " kmg".index(unit.lower() or " ")
+            terms.append((field, cls.OPERATORS[op], float(number) * scale))
+        return " ".join(cls.FILTER_TERM.sub(" ", text).split()), terms
+    
+    @staticmethod
+    def entry_value(entry, field):
+        """Size, mtime or metadata value an entry is sorted or filtered on - None if unknown"""
+        if field == "size":
+            return entry.size if entry.kind != "folder" else None
+        if field == "mtime":
+            return entry.mtime_ns
+        meta = entry.meta or {}
+        if field == "complexity":
+            return meta.get("faces") or meta.get("points") or meta.get("vertices")
+        if field == "points":
+            return meta.get("points", meta.get("vertices"))
+        return meta.get(field)
+    
+    def sort_key(self, entry):
+        if self.sort_field == "name":
+            return entry.name
+        value = self.entry_value(entry, self.sort_field)
+        return entry.kind != "folder", value is None, -(value or 0), entry.name
+    
+    def set_sort(self, field):
+        """Order the rows by "name", "size", "mtime" or "complexity" (faces or points)"""
+        self.sort_field = field
+        self.sort_entries()
+    
+    def set_metadata(self, metadata):
+        """Attach metadata read in the background ({path: dict}), then update the cells, filter and order using it"""
+        changed = False
+        for entry in self.entries:
+            meta = metadata.get(entry.path)
+            if meta is not None:
+                entry.meta = meta
+                changed = True
+        if not changed:
+            return
+        if any(field != "size" for field, _, _ in self.filter_terms):
+            self.set_filter()
+        if self.sort_field == "complexity":
+            self.sort_entries()
+        if self.rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self.rows) - 1, 0))
+    
+    def sort_entries(self):
+        """Put streamed rows in order once the scan is complete"""
+        self.entries.sort(key=self.sort_key)
+        sorted_rows = sorted(self.rows, key=self.sort_key)
+        if sorted_rows == self.rows:
+            return
+        self.layoutAboutToBeChanged.emit()
+        old_rows = self.rows
+        self.rows = sorted_rows
+        self.row_by_path = {entry.path: row for row, entry in enumerate(self.rows)}
+        # Keep selection and current index on the same entries
+        old_indexes = self.persistentIndexList()
+        new_indexes = [self.index(self.row_by_path[old_rows[index.row()].path], 0) for index in old_indexes]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+    
+    def apply_listing(self, entries):
+        """Bring the rows in line with a fresh listing of the same folder, touching only what changed.
+        Returns the (added, removed, changed) entries."""
+        old = {entry.path: entry for entry in self.entries}
+        new = {entry.path: entry for entry in entries}
+        added = [entry for path, entry in new.items() if path not in old]
+        removed = [entry for path, entry in old.items() if path not in new]
+        changed = [entry for path, entry in new.items()
+                   if path in old and (old[path].mtime_ns, old[path].size) != (entry.mtime_ns, entry.size)]
+        # Unchanged files keep their entry, with the metadata already read for it
+        changed_paths = {entry.path for entry in changed}
+        for path in new:
+            if path in old and path not in changed_paths:
+                new[path] = old[path]
+
+        # Remove rows bottom up so the row numbers still to remove stay valid
+        for row in sorted((self.row_by_path[entry.path] for entry in removed if entry.path in self.row_by_path),
+                          reverse=True):
+            self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+            del self.rows[row]
+            self.endRemoveRows()
+        
+        # Swap in the new entries, changed cells are repainted
+        self.entries = [new[entry.path] for entry in self.entries if entry.path in new]
+        self.rows = [new[entry.path] for entry in self.rows]
+        self.row_by_path = {entry.path: row for row, entry in enumerate(self.rows)}
+        for entry in changed:
+            self.refresh_path(entry.path)
+        
+        if added:
+            self.append_entries(added)
+            self.sort_entries()
+        return added, removed, changed
+    
+    def set_filter(self, text=None, show_textures=None):
+        """Update the search text and/or texture visibility without rescanning"""
+        if text is not None:
+            text, self.filter_terms = self.parse_filter(text)
+            self.filter_text = text.lower()
+        if show_textures is not None:
+            self.show_textures = show_textures
+        self.beginResetModel()
+        self.rows = self._filtered(self.entries)
+        self.endResetModel()
+    
+    def entry(self, index):
+        """Entry for a model index (None if invalid)"""
+        return self.data(index, self.EntryRole)
+    
+    def refresh_path(self, path):
+        """Repaint the cell showing this path, if it is in the current rows"""
+        row = self.row_by_path.get(path)
+        if row is not None:
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index)
+    
+    def _filtered(self, entries, start=0):
+        """Entries passing the filters, indexed by path from row 'start' on"""
+        rows = [entry for entry in entries
+                if (self.show_textures or entry.kind != "texture") and
+                (not self.filter_text or self.filter_text in entry.name.lower()) and
+                all(self.entry_value(entry, field) is not None and compare(self.entry_value(entry, field), value)
+                    for field, compare, value in self.filter_terms)]
+        if start == 0:
+            self.row_by_path = {}
+        self.row_by_path.update((entry.path, start + row) for row, entry in enumerate(rows))
+        return rows
+
+
+class AssetItemDelegate(QtWidgets.QStyledItemDelegate):
+    """Paints one grid cell (thumbnail, name and F3D button) - only visible cells are ever painted"""
+    open_in_f3d = QtCore.Signal(str)
+    
+    NAME_LINES = 2
+    BUTTON_HEIGHT = 20
+    CAPTION_MIN_SIZE = 80  # Smaller cells leave out the face / point count
+    
+    def __init__(self, pixmap_provider, parent=None):
+        super().__init__(parent)
+        self.pixmap_provider = pixmap_provider  # callable(entry, size) -> QPixmap
+        self.thumbnail_size = 100
+    
+    def cell_size(self):
+        """Outer size of a cell, same proportions as the old QFrame items"""
+        return self.thumbnail_size + 50
+    
+    def sizeHint(self, option, index):
+        size = self.cell_size()
+        return QtCore.QSize(size, size)
+    
+    def button_rect(self, cell_rect):
+        return QtCore.QRect(cell_rect.left() + 4, cell_rect.bottom() - self.BUTTON_HEIGHT - 3,
+                            cell_rect.width() - 8, self.BUTTON_HEIGHT)
+    
+    def paint(self, painter, option, index):
+        entry = index.data(AssetListModel.EntryRole)
+        if entry is None:
+            return
+        
+        painter.save()
+        rect = option.rect.adjusted(0, 0, -1, -1)
+        palette = option.palette
+        
+        if option.state & QtWidgets.QStyle.State_Selected:
+            painter.fillRect(rect, palette.color(QtGui.QPalette.Highlight).darker(150))
+        painter.setPen(palette.color(QtGui.QPalette.Mid))
+        painter.drawRect(rect)
+        
+        font_metrics = option.fontMetrics
+        name_height = font_metrics.height() * self.NAME_LINES
+        button_height = self.BUTTON_HEIGHT + 4 if entry.kind == "model" else 0
+        image_rect = QtCore.QRect(rect.left() + 2, rect.top() + 2, rect.width() - 4,
+                                  rect.height() - name_height - button_height - 4)
+        
+        # The provider returns pixmaps already fitted to this box, painting only centers them
+        fit_size = min(image_rect.width(), image_rect.height())
+        if entry.kind != "folder":
+            fit_size = min(fit_size, self.thumbnail_size)
+        pixmap = self.pixmap_provider(entry, fit_size)
+        if pixmap is not None and not pixmap.isNull():
+            target = QtCore.QSize(pixmap.width(), pixmap.height())
+            if target.width() > fit_size or target.height() > fit_size:
+                target.scale(fit_size, fit_size, QtCore.Qt.KeepAspectRatio)
+                painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
+            target_rect = QtCore.QRect(QtCore.QPoint(0, 0), target)
+            target_rect.moveCenter(image_rect.center())
+            painter.drawPixmap(target_rect, pixmap)
+        
+        # Face / point count in a corner of the image, once the metadata arrived
+        caption = MetadataReader.caption(entry) if self.thumbnail_size >= self.CAPTION_MIN_SIZE else ""
+        if caption:
+            caption_rect = QtCore.QRect(0, 0, font_metrics.horizontalAdvance(caption) + 8, font_metrics.height())
+            caption_rect.moveCenter(image_rect.center())
+            caption_rect.moveBottom(image_rect.bottom())
+            painter.fillRect(caption_rect, QtGui.QColor(0, 0, 0, 150))
+            painter.setPen(QtGui.QColor(220, 220, 220))
+            painter.drawText(caption_rect, QtCore.Qt.AlignCenter, caption)
+        
+        name_rect = QtCore.QRect(rect.left() + 5, image_rect.bottom() + 1, rect.width() - 10, name_height)
+        painter.setPen(palette.color(QtGui.QPalette.Text))
+        painter.drawText(name_rect, QtCore.Qt.AlignHCenter | QtCore.Qt.AlignTop | QtCore.Qt.TextWrapAnywhere,
+                         entry.name)
+        
+        if entry.kind == "model":
+            button = QtWidgets.QStyleOptionButton()
+            button.rect = self.button_rect(option.rect)
+            button.text = "Open in F3D"
+            button.state = QtWidgets.QStyle.State_Enabled | QtWidgets.QStyle.State_Raised
+            style = option.widget.style() if option.widget else QtWidgets.QApplication.style()
+            style.drawControl(QtWidgets.QStyle.CE_PushButton, button, painter, option.widget)
+        
+        painter.restore()
+    
+    def editorEvent(self, event, model, option, index):
+        entry = index.data(AssetListModel.EntryRole)
+        if (entry is not None and entry.kind == "model" and
+                event.type() == QtCore.QEvent.MouseButtonRelease and
+                event.button() == QtCore.Qt.LeftButton and
+                self.button_rect(option.rect).contains(event.pos())):
+            self.open_in_f3d.emit(entry.path)
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
 class ThreeDAssetBrowser(QtWidgets.QWidget):
     # Create a signal for UI updates
     update_ui_signal = QtCore.Signal()
+    # (test image path, or "" when the test failed, message) - emitted from the F3D test thread
+    f3d_tested = QtCore.Signal(str, str)
+    
+    # Test F3D copies network assets up to this size like a render does, larger ones are opened
+    # from the share directly
+    TEST_STAGING_LIMIT_MB = 64
     
     def __init__(self):
         super().__init__()
-        self.thumbnail_cache = ThumbnailCache()
+        self.thumbnail_cache = ThumbnailCache(self)
+        self.thumbnail_cache.thumbnail_ready.connect(self.on_thumbnail_ready)
+        self.thumbnail_cache.pixmap_ready.connect(self.on_pixmap_ready)
+        self.thumbnail_cache.cache_ready.connect(self.on_cache_ready)
+        # Lives next to the thumbnail cache, created once the startup checks found it
+        self.library_index = None
+        self.directory_scanner = DirectoryScanner(None, self)
+        self.directory_scanner.entries_found.connect(self.on_entries_found)
+        self.directory_scanner.scan_finished.connect(self.on_scan_finished)
+        self.directory_scanner.folder_updated.connect(self.on_folder_updated)
+        self.folder_watcher = FolderWatcher(self)
+        self.folder_watcher.folder_changed.connect(self.directory_scanner.rescan)
+        self.scan_id = 0
+        self.load_started = time.perf_counter()
+        self.first_rows_shown = False
         self.current_path = ASSET_DIR
         self.show_textures = True
         self.thumbnail_size = 100  # Base thumbnail size
         self.zoom_level = 1.0  # Current zoom level
         self.max_cols = 4  # Default number of columns
+        self.folder_icons = {}  # icon size -> folder pixmap
         
         # Connect the update signal
         self.update_ui_signal.connect(self.refresh_ui)
+        self.f3d_tested.connect(self.on_f3d_tested)
         
         self.setup_ui()
+        # Shows "Connecting..." until the cache checks are done, on_cache_ready() then lists the folder
+        self.load_assets(self.current_path)
+        
+        self.crawl_timer = QtCore.QTimer(self)
+        self.crawl_timer.timeout.connect(lambda: self.library_index.crawl(ASSET_DIR))
+        
+        # Export the performance metrics for monitoring - written on a thread, the file may be on a share
+        self.metrics_timer = QtCore.QTimer(self)
+        self.metrics_timer.timeout.connect(
+            lambda: threading.Thread(target=metrics.export, daemon=True).start())
+        if METRICS_FILE:
+            self.metrics_timer.start(METRICS_EXPORT_SECONDS * 1000)
+        
+    def on_cache_ready(self, cache_dir):
+        """The startup checks settled on a cache directory - open the library index there and list the folder"""
+        self.library_index = LibraryIndex(os.path.join(cache_dir, "crate_library_index.sqlite"), self)
+        self.library_index.search_finished.connect(self.on_search_finished)
+        self.library_index.metadata_found.connect(self.on_metadata_found)
+        self.directory_scanner.library_index = self.library_index
         self.load_assets(self.current_path)
         
+        # Bring the library-wide search index up to date once the panel is up, then keep it current
+        # (the crawl only re-reads folders whose mtime changed)
+        QtCore.QTimer.singleShot(3000, lambda: self.library_index.crawl(ASSET_DIR))
+        if LIBRARY_RECRAWL_MINUTES:
+            self.crawl_timer.start(LIBRARY_RECRAWL_MINUTES * 60 * 1000)
+    
     def setup_ui(self):
         main_layout = QtWidgets.QVBoxLayout(self)
         main_layout.setContentsMargins(4, 4, 4, 4)
@@ -323,7 +3568,7 @@ class ThreeDAssetBrowser(QtWidgets.QWidget):
         # Add thumbnail regeneration button
         self.regen_thumbs_btn = QtWidgets.QPushButton("Regenerate Thumbs")
         self.regen_thumbs_btn.clicked.connect(self.regenerate_thumbnails)
-        self.regen_thumbs_btn.setToolTip("Force regenerate all thumbnails")
+        self.regen_thumbs_btn.setToolTip("Render the selected thumbnails again - or all thumbnails shown when nothing is selected")
         nav_layout.addWidget(self.regen_thumbs_btn)
         
         # Add debug button
@@ -371,8 +3616,26 @@ class ThreeDAssetBrowser(QtWidgets.QWidget):
         search_layout = QtWidgets.QHBoxLayout()
         self.search_field = QtWidgets.QLineEdit()
         self.search_field.setPlaceholderText("Search assets...")
+        self.search_field.setToolTip("Filters the current folder as you type, then searches the whole library.\n"
+                                     "Also filters on size and contents: size>50mb faces<10k points>1m")
         self.search_field.textChanged.connect(self.filter_assets)
         search_layout.addWidget(self.search_field)
+        
+        search_layout.addWidget(QtWidgets.QLabel("Sort:"))
+        self.sort_combo = QtWidgets.QComboBox()
+        self.sort_combo.addItems(list(AssetListModel.SORT_FIELDS))
+        self.sort_combo.setToolTip("Face and point counts are read from the files in the background")
+        self.sort_combo.currentTextChanged.connect(
+            lambda text: self.asset_model.set_sort(AssetListModel.SORT_FIELDS[text]))
+        search_layout.addWidget(self.sort_combo)
+        self.metadata_id = 0
+        
+        # Library searches wait until typing pauses
+        self.search_timer = QtCore.QTimer()
+        self.search_timer.setSingleShot(True)
+        self.search_timer.timeout.connect(self.search_library)
+        self.search_id = 0
+        self.showing_search = False
         main_layout.addLayout(search_layout)
         
         # Create a container for the scroll area to make it responsive
@@ -380,15 +3643,28 @@ class ThreeDAssetBrowser(QtWidgets.QWidget):
         scroll_container_layout = QtWidgets.QVBoxLayout(self.scroll_container)
         scroll_container_layout.setContentsMargins(0, 0, 0, 0)
         
-        self.scroll_area = QtWidgets.QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.assets_container = QtWidgets.QWidget()
-        self.grid_layout = QtWidgets.QGridLayout(self.assets_container)
-        self.grid_layout.setAlignment(QtCore.Qt.AlignTop)
-        self.grid_layout.setSpacing(10)  # Add some spacing between items
-        self.scroll_area.setWidget(self.assets_container)
+        # Virtualized icon grid - only the cells on screen are painted
+        self.asset_model = AssetListModel(self)
+        self.asset_delegate = AssetItemDelegate(self.cell_pixmap, self)
+        self.asset_delegate.open_in_f3d.connect(self.launch_f3d)
         
-        scroll_container_layout.addWidget(self.scroll_area)
+        self.asset_view = QtWidgets.QListView()
+        self.asset_view.setViewMode(QtWidgets.QListView.IconMode)
+        self.asset_view.setResizeMode(QtWidgets.QListView.Adjust)
+        self.asset_view.setMovement(QtWidgets.QListView.Static)
+        self.asset_view.setUniformItemSizes(True)
+        self.asset_view.setLayoutMode(QtWidgets.QListView.Batched)
+        self.asset_view.setBatchSize(200)
+        self.asset_view.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.asset_view.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.asset_view.setMouseTracking(True)
+        self.asset_view.setModel(self.asset_model)
+        self.asset_view.setItemDelegate(self.asset_delegate)
+        self.asset_view.clicked.connect(self.on_item_clicked)
+        self.asset_view.doubleClicked.connect(self.on_item_double_clicked)
+        self.apply_cell_size()
+        
+        scroll_container_layout.addWidget(self.asset_view)
         main_layout.addWidget(self.scroll_container)
         
         self.status_label = QtWidgets.QLabel()
@@ -405,68 +3681,97 @@ class ThreeDAssetBrowser(QtWidgets.QWidget):
         super().resizeEvent(event)
     
     def handle_resize(self):
-        """Handle window resize by recalculating the layout"""
-        if self.current_path and os.path.exists(self.current_path):
-            self.calculate_columns()
-            self.load_assets(self.current_path)
+        """Handle window resize - the view re-flows its cells itself, only the column count is updated"""
+        self.calculate_columns()
     
     def calculate_columns(self):
-        """Calculate the optimal number of columns based on available width"""
-        # Get the available width (accounting for scrollbar and margins)
-        available_width = self.scroll_area.width() - 30  # Account for scrollbar
-        
-        # Calculate how many columns we can fit
-        item_width = self.thumbnail_size * self.zoom_level + 20  # Item width + margin
-        self.max_cols = max(1, math.floor(available_width / item_width))
+        """Calculate the number of columns the view fits in the available width"""
+        available_width = self.asset_view.viewport().width()
+        item_width = self.asset_view.gridSize().width()
+        self.max_cols = max(1, math.floor(available_width / max(1, item_width)))
+    
+    def apply_cell_size(self):
+        """Push the current zoom to the delegate and grid - a layout change only, no rescan"""
+        self.asset_delegate.thumbnail_size = int(self.thumbnail_size * self.zoom_level)
+        # Pixmaps scaled to the previous cell size are never painted again
+        self.thumbnail_cache.cache.discard_fitted()
+        cell_size = self.asset_delegate.cell_size()
+        self.asset_view.setGridSize(QtCore.QSize(cell_size + 10, cell_size + 10))  # 10px spacing between items
+        self.calculate_columns()
     
     def zoom_in(self):
         """Increase zoom level"""
         self.zoom_level = min(2.0, self.zoom_level + 0.2)
-        self.calculate_columns()
-        self.load_assets(self.current_path)
+        self.apply_cell_size()
     
     def zoom_out(self):
         """Decrease zoom level"""
         self.zoom_level = max(0.4, self.zoom_level - 0.2)
-        self.calculate_columns()
-        self.load_assets(self.current_path)
+        self.apply_cell_size()
     
     def fit_to_view(self):
         """Reset zoom to fit the view"""
         self.zoom_level = 1.0
-        self.calculate_columns()
-        self.load_assets(self.current_path)
+        self.apply_cell_size()
     
     def refresh_ui(self):
         """Refresh the UI - called from the signal"""
-        self.load_assets(self.current_path)
+        self.asset_view.viewport().update()
     
     def show_debug_info(self):
         """Show debug information"""
+        if not self.thumbnail_cache.ready:
+            nuke.message("Crate is still checking the thumbnail cache and F3D - try again in a moment")
+            return
+        staged_files, staged_bytes = self.thumbnail_cache.renderer.staging.usage()
+        pixmap_stats = self.thumbnail_cache.cache.stats()
         debug_info = [
             f"F3D Path: {F3D_PATH}",
-            f"F3D Exists: {os.path.exists(F3D_PATH)}",
+            f"F3D Exists: {self.thumbnail_cache.f3d_available}",
             f"Cache Dir: {self.thumbnail_cache.cache_dir}",
             f"Cache Writable: {os.access(self.thumbnail_cache.cache_dir, os.W_OK)}",
             f"Temp Dir: {self.thumbnail_cache.temp_dir}",
-            f"Active Generations: {len(self.thumbnail_cache.active_generations)}",
-            f"Failed Attempts: {len(self.thumbnail_cache.failed_attempts)}",
+            f"Staging: {staged_files} files, {staged_bytes / (1024 * 1024):.0f} / {STAGING_BUDGET_MB} MB",
+            f"Pixmap Cache: {pixmap_stats['entries']} pixmaps, {pixmap_stats['bytes'] / (1024 * 1024):.1f} / "
+            f"{pixmap_stats['budget_bytes'] / (1024 * 1024):.0f} MB, hit rate {pixmap_stats['hit_rate']:.0%}",
+            f"Active Generations: {self.thumbnail_cache.scheduler.pending_count()}",
+            f"Running Renders: {self.thumbnail_cache.scheduler.running_count()} / {self.thumbnail_cache.scheduler.max_workers}",
+            f"Failed Renders: {self.thumbnail_cache.renderer.failures.count()}",
+            f"Render Timeouts: {RENDER_TIMEOUT_MIN_SECONDS}-{RENDER_TIMEOUT_MAX_SECONDS}s, adapted to format and size",
+            f"Rendering on other workstations: {len(self.thumbnail_cache.deferred)}",
+            self.thumbnail_cache.collector.summary_line(),
+            f"Library Index: {self.library_index.asset_count()} items{' (updating)' if self.library_index.crawling else ''}",
             f"Current Path: {self.current_path}",
             f"Zoom Level: {self.zoom_level:.1f}",
             f"Columns: {self.max_cols}",
-        ]
+            "",
+            "Render times by format and size:",
+        ] + self.thumbnail_cache.renderer.costs.summary_lines() + [
+            "",
+            "Performance:",
+        ] + metrics.summary_lines()
         
         nuke.message("Debug Information:\n\n" + "\n".join(debug_info))
     
     def test_f3d_with_current_file(self):
-        """Test F3D with the first file in the current directory"""
+        """Test F3D with the first file in the current directory - run in the background, see on_f3d_tested()"""
+        if not self.thumbnail_cache.ready:
+            nuke.message("Crate is still checking the thumbnail cache and F3D - try again in a moment")
+            return
+        # One test at a time - they share the output file
+        self.test_f3d_btn.setEnabled(False)
+        threading.Thread(target=self._test_f3d, args=(self.current_path,), daemon=True).start()
+    
+    def _test_f3d(self, folder_path):
+        """Worker thread - listing, staging and the F3D run can take seconds on a network share"""
+        test_output = ""
         try:
             # Find the first 3D file in the current directory
             model_formats = {'.obj', '.fbx', '.stl', '.ply', '.gltf', '.glb', '.abc', '.splat'}
             test_file = None
             
-            for item in os.listdir(self.current_path):
-                item_path = os.path.join(self.current_path, item)
+            for item in os.listdir(folder_path):
+                item_path = os.path.join(folder_path, item)
                 if os.path.isfile(item_path):
                     ext = os.path.splitext(item)[1].lower()
                     if ext in model_formats:
@@ -474,67 +3779,74 @@ class ThreeDAssetBrowser(QtWidgets.QWidget):
                         break
             
             if not test_file:
-                nuke.message("No 3D files found to test with F3D")
+                message = "No 3D files found to test with F3D"
                 return
             
             # Test F3D with this file
             test_output = os.path.join(self.thumbnail_cache.cache_dir, "test_output.png")
             
-            # Use compatible parameters for your F3D version
-            cmd = [
-                F3D_PATH,
-                test_file.replace('/', '\\'),
-                "--output", test_output.replace('/', '\\'),
-                "--no-background"
-            ]
+            # Network assets are tested from the same local staged copy the renders use, unless large
+            if is_network_path(test_file) and os.path.getsize(test_file) <= self.TEST_STAGING_LIMIT_MB * 1024 * 1024:
+                staging_context = self.thumbnail_cache.renderer.staging.staged(test_file)
+            else:
+                staging_context = contextlib.nullcontext(test_file)
             
-            print(f"🧪 Testing F3D with: {os.path.basename(test_file)}")
-            print(f"   Command: {' '.join(cmd)}")
+            with staging_context as f3d_input_path:
+                # Use compatible parameters for your F3D version
+                cmd = [
+                    F3D_PATH,
+                    os.path.normpath(f3d_input_path),
+                    "--output", os.path.normpath(test_output),
+                    "--no-background"
+                ]
             
-            try:
-                result = subprocess.run(cmd, capture_output=True, timeout=30, text=True)
-                
-                if os.path.exists(test_output):
-                    # Load and resize to standard thumbnail size
-                    pixmap = QtGui.QPixmap(test_output)
-                    if not pixmap.isNull():
-                        pixmap = pixmap.scaled(100, 100, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-                        success = pixmap.save(test_output)
-                        if success:
-                            success_msg = f"✅ F3D test successful!\nThumbnail created: {test_output}"
-                            print(success_msg)
-                            
-                            # Show the test result to the user
-                            self.show_test_result(test_output, success_msg)
-                            
-                            os.remove(test_output)  # Clean up
-                        else:
-                            error_msg = "❌ Failed to resize test image"
-                            print(error_msg)
-                            nuke.message(error_msg)
-                    else:
-                        error_msg = "❌ Test image is invalid"
-                        print(error_msg)
-                        nuke.message(error_msg)
+                print(f"🧪 Testing F3D with: {os.path.basename(test_file)}")
+                print(f"   Command: {' '.join(cmd)}")
+            
+                try:
+                    result = subprocess.run(cmd, capture_output=True, timeout=30, text=True)
+                except subprocess.TimeoutExpired:
+                    message = "⏰ F3D test timed out after 30 seconds"
+                    test_output = ""
+                    return
+            
+            if os.path.exists(test_output):
+                # Load and resize to standard thumbnail size - QImage, pixmaps belong to the GUI thread
+                image = QtGui.QImage(test_output)
+                if not image.isNull():
+                    image = image.scaled(100, 100, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+                    if image.save(test_output):
+                        message = f"✅ F3D test successful!\nThumbnail created: {test_output}"
+                        return
+                    message = "❌ Failed to resize test image"
                 else:
-                    error_msg = f"❌ F3D test failed for {os.path.basename(test_file)}"
-                    if result.stderr:
-                        error_msg += f"\nF3D stderr: {result.stderr}"
-                    if result.stdout:
-                        error_msg += f"\nF3D stdout: {result.stdout}"
-                    
-                    print(error_msg)
-                    nuke.message(error_msg)
-                    
-            except subprocess.TimeoutExpired:
-                error_msg = "⏰ F3D test timed out after 30 seconds"
-                print(error_msg)
-                nuke.message(error_msg)
-                
+                    message = "❌ Test image is invalid"
+            else:
+                message = f"❌ F3D test failed for {os.path.basename(test_file)}"
+                if result.stderr:
+                    message += f"\nF3D stderr: {result.stderr}"
+                if result.stdout:
+                    message += f"\nF3D stdout: {result.stdout}"
+            test_output = ""
+            
         except Exception as e:
-            error_msg = f"💥 F3D test error: {e}"
-            print(error_msg)
-            nuke.message(error_msg)
+            message = f"💥 F3D test error: {e}"
+            test_output = ""
+        finally:
+            print(message)
+            self.f3d_tested.emit(test_output, message)
+    
+    def on_f3d_tested(self, image_path, message):
+        """Show the outcome of a F3D test - runs on the GUI thread"""
+        self.test_f3d_btn.setEnabled(True)
+        if not image_path:
+            nuke.message(message)
+            return
+        self.show_test_result(image_path, message)
+        try:
+            os.remove(image_path)  # Clean up
+        except OSError:
+            pass
     
     def show_test_result(self, image_path, message):
         """Show the test result in a dialog with the generated image"""
@@ -573,163 +3885,164 @@ class ThreeDAssetBrowser(QtWidgets.QWidget):
         else:
             self.textures_btn.setText("Show Textures")
             self.textures_btn.setStyleSheet("QPushButton { background-color: #e67e22; color: white; }")
-        self.refresh()
+        self.asset_model.set_filter(show_textures=self.show_textures)
         
     def refresh(self):
-        self.load_assets(self.current_path)
-        self.status_label.setText("View refreshed")
+        # Re-stat files on the next paint so assets changed in place get new cache keys
+        self.thumbnail_cache.invalidate_keys()
+        self.thumbnail_cache.forget_mosaics()
+        self.load_assets(self.current_path, force=True)
     
     def regenerate_thumbnails(self):
-        """Force regeneration of all thumbnails"""
-        # Clear all caches and failed attempts
-        self.thumbnail_cache.failed_attempts = {}
-        self.thumbnail_cache.cache = {}
-        self.thumbnail_cache.active_generations = {}
-        
-        # Clear disk cache
-        for filename in os.listdir(self.thumbnail_cache.cache_dir):
-            if filename.endswith('.png'):
-                file_path = os.path.join(self.thumbnail_cache.cache_dir, filename)
-                if os.path.isfile(file_path):
-                    os.remove(file_path)
-        
-        self.load_assets(self.current_path)
-        self.status_label.setText("Thumbnails regenerated")
-        
-    def load_assets(self, path):
-        for i in reversed(range(self.grid_layout.count())):
-            widget = self.grid_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
+        """Render the selected assets again, or every asset shown when nothing is selected.
+        Only their thumbnails are deleted - other folders keep theirs, on every workstation sharing the cache."""
+        if not self.thumbnail_cache.ready:
+            return
+        selected = [self.asset_model.entry(index) for index in self.asset_view.selectionModel().selectedIndexes()]
+        entries = [entry for entry in selected if entry is not None] or self.asset_model.rows
+        file_paths = [entry.path for entry in entries if entry.kind != "folder"]
+        if not file_paths:
+            self.status_label.setText("No thumbnails to regenerate")
+            return
+        self.thumbnail_cache.regenerate(file_paths)
+        self.status_label.setText(f"Regenerating {len(file_paths)} thumbnails")
         
+    def load_assets(self, path, force=False):
+        """Show a folder - it is listed on a worker thread and rows stream in as they are found"""
+        if self.showing_search:
+            self.clear_search()
         self.current_path = path
         self.path_label.setText(f"Location: {os.path.basename(path)}")
+        self.folder_watcher.stop()
+        # Renders still queued or running for the previous folder give way to this one
+        self.thumbnail_cache.set_view(path)
         
-        if not os.path.exists(path):
-            self.status_label.setText("❌ Directory not found")
+        self.asset_model.set_entries([])
+        self.asset_view.scrollToTop()
+        if self.library_index is not None:
+            # Stop reading metadata for the folder left behind
+            self.metadata_id = self.library_index.load_metadata([])
+        if not self.thumbnail_cache.ready:
+            # Listed as soon as the cache checks are done - see on_cache_ready()
+            self.status_label.setText("Connecting to the thumbnail cache...")
             return
+        self.status_label.setText("Scanning...")
+        self.load_started = time.perf_counter()
+        self.first_rows_shown = False
+        self.scan_id = self.directory_scanner.scan(path, force)
+    
+    def on_entries_found(self, scan_id, entries):
+        """Rows of the folder being listed - ignored if the browser already moved on"""
+        if scan_id != self.scan_id:
+            return
+        # The scan already stat'ed every file, prime the cache keys with it
+        for entry in entries:
+            if entry.kind != "folder":
+                self.thumbnail_cache.cache_key(entry.path, entry.mtime_ns, entry.size)
+        self.asset_model.append_entries(entries)
+        self.status_label.setText(f"Scanning... {self.asset_model.rowCount()} items")
+        if not self.first_rows_shown:
+            self.first_rows_shown = True
+            metrics.observe("folder_first_rows_seconds", time.perf_counter() - self.load_started)
         
-        # Calculate columns based on current window size
+        # Visible cells queue their renders when painted, the rest of the folder waits behind them
+        self.thumbnail_cache.queue_renders([entry.path for entry in entries if entry.kind == "model"])
+    
+    def on_scan_finished(self, scan_id, path, error):
+        if scan_id != self.scan_id:
+            return
+        if error:
+            self.status_label.setText(error)
+            return
+        self.asset_model.sort_entries()
         self.calculate_columns()
+        metrics.observe("folder_open_seconds", time.perf_counter() - self.load_started)
+        self.status_label.setText(f"Loaded {self.asset_model.rowCount()} items (Zoom: {self.zoom_level:.1f}x, Columns: {self.max_cols})")
+        self.folder_watcher.watch(path, self.asset_model.entries)
+        self.load_metadata()
+    
+    def on_folder_updated(self, path, entries):
+        """The watched folder changed on disk - apply it row by row instead of reloading the view"""
+        # Ignore changes that raced a reload - the watch starts again once the new listing is complete
+        if path != self.folder_watcher.path or path != self.current_path or self.showing_search:
+            return
+        added, removed, changed = self.asset_model.apply_listing(entries)
+        if not (added or removed or changed):
+            return
         
-        try:
-            # Comprehensive model formats - Added .splat to the list
-            model_formats = {
-                '.obj', '.fbx', '.stl', '.ply', '.dae', '.3ds', '.abc', '.usd', '.usda', '.usdc', '.usdz',
-                '.gltf', '.glb', '.step', '.stp', '.iges', '.igs', '.x3d', '.wrl', '.bgeo', '.bgeo.sc',
-                '.blend', '.lxo', '.c4d', '.ma', '.mb', '.ifc', '.skp', '.vrml', '.ac', '.ase', '.dxf', '.spz', '.splat'
-            }
-            texture_formats = {'.exr', '.png', '.jpg', '.jpeg', '.tga', '.tif', '.tiff', '.hdr'}
-            
-            row, col = 0, 0
-            items = os.listdir(path)
-            
-            for item in sorted(items):
-                # Ignore folders starting with dot
-                if item.startswith('.'):
-                    continue
-                
-                item_path = os.path.join(path, item).replace('\\', '/')
-                
-                if os.path.isdir(item_path):
-                    self.add_folder_item(item, item_path, row, col)
-                    col += 1
-                else:
-                    ext = os.path.splitext(item)[1].lower()
-                    if ext in model_formats:
-                        self.add_asset_item(item, item_path, row, col, "model")
-                        col += 1
-                    elif self.show_textures and ext in texture_formats:
-                        self.add_asset_item(item, item_path, row, col, "texture")
-                        col += 1
-                
-                if col >= self.max_cols:
-                    col = 0
-                    row += 1
-            
-            self.status_label.setText(f"Loaded {row * self.max_cols + col} items (Zoom: {self.zoom_level:.1f}x, Columns: {self.max_cols})")
-            
-            # Check for active generations and set up a timer to refresh when done
-            if self.thumbnail_cache.active_generations:
-                QtCore.QTimer.singleShot(2000, self.check_generations)
-                
-        except Exception as e:
-            self.status_label.setText(f"Error loading assets: {str(e)}")
+        # New keys for changed files, so only they are rendered again (earlier failures no longer apply)
+        for entry in added + changed:
+            if entry.kind != "folder":
+                self.thumbnail_cache.cache_key(entry.path, entry.mtime_ns, entry.size)
+        self.thumbnail_cache.queue_renders([entry.path for entry in added + changed if entry.kind == "model"])
+        self.folder_watcher.watch(path, self.asset_model.entries)
+        # Added and changed files have no metadata yet - the index answers for the others
+        self.load_metadata()
+        
+        print(f"📂 {os.path.basename(path)} changed: {len(added)} added, {len(removed)} removed, {len(changed)} modified")
+        self.status_label.setText(f"Updated: {len(added)} added, {len(removed)} removed, {len(changed)} modified "
+                                  f"({self.asset_model.rowCount()} items)")
     
-    def check_generations(self):
-        """Check if any thumbnail generations are still active"""
-        if self.thumbnail_cache.active_generations:
-            # Still generating, check again in 2 seconds
-            QtCore.QTimer.singleShot(2000, self.check_generations)
-        else:
-            # All generations done, refresh UI
-            self.refresh()
-    
-    def add_folder_item(self, name, path, row, col):
-        try:
-            frame = QtWidgets.QFrame()
-            frame.setFrameStyle(QtWidgets.QFrame.Box)
-            frame_size = int(self.thumbnail_size * self.zoom_level + 50)
-            frame.setFixedSize(frame_size, frame_size)
-            layout = QtWidgets.QVBoxLayout(frame)
-            layout.setContentsMargins(0, 0, 0, 0)  # Reduce margins for better filling
-            layout.setSpacing(0)  # Remove spacing between widgets
-            
-            # Calculate a larger icon size to occupy more of the frame (leave ~20px for name)
-            icon_size = frame_size - 20
-            
-            icon = self.style().standardIcon(QtWidgets.QStyle.SP_DirIcon)
-            # Generate pixmap in disabled mode for grey color
-            pixmap = icon.pixmap(QtCore.QSize(icon_size, icon_size), QtGui.QIcon.Disabled)
-            
-            icon_label = QtWidgets.QLabel()
-            icon_label.setPixmap(pixmap)
-            icon_label.setAlignment(QtCore.Qt.AlignCenter)
-            icon_label.setScaledContents(False)  # Preserve aspect, but since it's scaled in pixmap, it's fine
-            layout.addWidget(icon_label)
-            
-            name_label = QtWidgets.QLabel(name)
-            name_label.setAlignment(QtCore.Qt.AlignCenter)
-            name_label.setWordWrap(True)
-            name_label.setMaximumWidth(frame_size - 10)
-            layout.addWidget(name_label)
-            
-            frame.mousePressEvent = lambda event: self.load_assets(path)
-            self.grid_layout.addWidget(frame, row, col)
-        except Exception as e:
-            print(f"❌ Error adding folder item {name}: {e}")
-    
-    def add_asset_item(self, name, path, row, col, asset_type):
-        try:
-            frame = QtWidgets.QFrame()
-            frame.setFrameStyle(QtWidgets.QFrame.Box)
-            frame_size = int(self.thumbnail_size * self.zoom_level + 50)
-            frame.setFixedSize(frame_size, frame_size)
-            layout = QtWidgets.QVBoxLayout(frame)
-            thumbnail_size = int(self.thumbnail_size * self.zoom_level)
-            thumbnail = self.thumbnail_cache.get_thumbnail(path, thumbnail_size)
-            thumbnail_label = QtWidgets.QLabel()
-            thumbnail_label.setPixmap(thumbnail)
-            thumbnail_label.setAlignment(QtCore.Qt.AlignCenter)
-            layout.addWidget(thumbnail_label)
-            name_label = QtWidgets.QLabel(name)
-            name_label.setAlignment(QtCore.Qt.AlignCenter)
-            name_label.setWordWrap(True)
-            name_label.setMaximumWidth(frame_size - 10)
-            layout.addWidget(name_label)
-            
-            if asset_type == "model":
-                frame.mouseDoubleClickEvent = lambda event: self.create_readgeo_node(path)
-                f3d_btn = QtWidgets.QPushButton("Open in F3D")
-                f3d_btn.setFixedHeight(20)
-                layout.addWidget(f3d_btn)
-                f3d_btn.clicked.connect(functools.partial(self.launch_f3d, path))
-            else:
-                frame.mouseDoubleClickEvent = lambda event: self.create_read_node(path)
-            
-            self.grid_layout.addWidget(frame, row, col)
-        except Exception as e:
-            print(f"❌ Error adding {asset_type} item {name}: {e}")
+    def load_metadata(self):
+        """Read face / point counts of the rows in the background - the index answers for files already seen"""
+        if self.library_index is not None:
+            self.metadata_id = self.library_index.load_metadata(self.asset_model.entries)
+    
+    def on_metadata_found(self, request_id, metadata):
+        if request_id == self.metadata_id:
+            self.asset_model.set_metadata(metadata)
+    
+    def on_thumbnail_ready(self, cache_key, file_path, outcome):
+        """A render finished - swap only the affected cell's pixmap, and only if there is a new one"""
+        if outcome == RENDER_CACHED:
+            # Already on disk - pixmaps in memory stay valid, unless nothing was found there before
+            # (e.g. another workstation rendered it in the meantime)
+            if not self.thumbnail_cache.forget_missing(cache_key):
+                return
+        elif outcome == RENDER_RENDERED:
+            self.thumbnail_cache.forget(cache_key)
+        elif outcome == RENDER_CANCELLED:
+            return
+        self.asset_model.refresh_path(file_path)
+        if outcome in RENDER_SUCCESS:
+            # The folder's tile picks up the new thumbnail the next time it is shown
+            self.thumbnail_cache.forget_mosaic(os.path.dirname(file_path))
+    
+    def on_pixmap_ready(self, file_path):
+        """A cached thumbnail finished decoding in the background - repaint its cell"""
+        self.asset_model.refresh_path(file_path)
+    
+    def cell_pixmap(self, entry, size):
+        """Pixmap painted in a grid cell - called by the delegate for visible cells only"""
+        if entry.kind == "folder":
+            # Mosaic of the children already in the cache, the folder icon until there is one
+            mosaic = self.thumbnail_cache.get_folder_thumbnail(entry.path, size, PRIORITY_VISIBLE)
+            if mosaic is not None:
+                return mosaic
+            # The icon fills the image area of the cell
+            if size not in self.folder_icons:
+                icon = self.style().standardIcon(QtWidgets.QStyle.SP_DirIcon)
+                # Generate pixmap in disabled mode for grey color
+                self.folder_icons[size] = icon.pixmap(QtCore.QSize(size, size), QtGui.QIcon.Disabled)
+            return self.folder_icons[size]
+        return self.thumbnail_cache.get_thumbnail(entry.path, size, PRIORITY_VISIBLE)
+    
+    def on_item_clicked(self, index):
+        """Single click on a folder opens it"""
+        entry = self.asset_model.entry(index)
+        if (entry is not None and entry.kind == "folder" and
+                QtWidgets.QApplication.keyboardModifiers() == QtCore.Qt.NoModifier):
+            self.load_assets(entry.path)
+    
+    def on_item_double_clicked(self, index):
+        """Double click creates the matching node in the nodegraph"""
+        entry = self.asset_model.entry(index)
+        if entry is None:
+            return
+        if entry.kind == "model":
+            self.create_readgeo_node(entry.path)
+        elif entry.kind == "texture":
+            self.create_read_node(entry.path)
     
     def launch_f3d(self, asset_path):
         if os.path.exists(F3D_PATH) and os.path.exists(asset_path):
@@ -768,25 +4081,70 @@ class ThreeDAssetBrowser(QtWidgets.QWidget):
     
     def filter_assets(self, text):
         try:
-            for i in range(self.grid_layout.count()):
-                item = self.grid_layout.itemAt(i)
-                if item and item.widget():
-                    widget = item.widget()
-                    for child in widget.findChildren(QtWidgets.QLabel):
-                        if child.text() and not child.pixmap():
-                            widget.setVisible(text.lower() in child.text().lower())
-                            break
+            # Narrow what is shown right away, the library query follows once typing pauses
+            self.asset_model.set_filter(text=text)
+            if text.strip():
+                self.search_timer.start(250)
+            else:
+                self.search_timer.stop()
+                self.search_id = 0
+                if self.showing_search:
+                    # Back to the folder - its listing is cached, so this is instant
+                    self.showing_search = False
+                    self.load_assets(self.current_path)
         except Exception as e:
             print(f"❌ Filter error: {e}")
     
+    def search_library(self):
+        """Query the library index for the name part of the search text (size / count terms filter the results)"""
+        text = AssetListModel.parse_filter(self.search_field.text())[0]
+        if text and self.library_index is not None:
+            self.search_id = self.library_index.search(text)
+    
+    def on_search_finished(self, search_id, entries):
+        if search_id != self.search_id or not self.search_field.text().strip():
+            return
+        text = self.search_field.text().strip()
+        if not entries and self.library_index.crawling:
+            self.status_label.setText("Library index is still being built - showing matches in this folder")
+            return
+        
+        self.showing_search = True
+        self.scan_id = 0  # Drop rows still streaming in from a folder scan
+        for entry in entries:
+            if entry.kind != "folder":
+                self.thumbnail_cache.cache_key(entry.path, entry.mtime_ns, entry.size)
+        self.path_label.setText(f"Search: '{text}' in {os.path.basename(ASSET_DIR)}")
+        self.thumbnail_cache.set_view(("search", text))
+        self.asset_model.set_entries(entries)
+        if self.asset_model.sort_field != "name":
+            self.asset_model.sort_entries()  # Otherwise the index order is kept - prefix matches first
+        self.asset_view.scrollToTop()
+        self.thumbnail_cache.queue_renders([entry.path for entry in entries if entry.kind == "model"])
+        self.load_metadata()
+        limit_note = f" (first {LibraryIndex.SEARCH_LIMIT})" if len(entries) >= LibraryIndex.SEARCH_LIMIT else ""
+        self.status_label.setText(f"Found {len(entries)} items matching '{text}' in the library{limit_note}")
+    
+    def clear_search(self):
+        """Empty the search box without reloading the folder it was typed in"""
+        self.search_timer.stop()
+        self.search_id = 0
+        self.showing_search = False
+        self.search_field.blockSignals(True)
+        self.search_field.clear()
+        self.search_field.blockSignals(False)
+        self.asset_model.filter_text = ""
+        self.asset_model.filter_terms = []
+    
     def go_back(self):
+        # No existence check here - the scanner reports missing folders without blocking the UI
         parent = os.path.dirname(self.current_path)
-        if os.path.exists(parent):
+        if parent and parent != self.current_path:
             self.load_assets(parent)
     
     def go_up(self):
         parent = os.path.dirname(self.current_path)
-        if os.path.exists(parent):
+        if parent and parent != self.current_path:
             self.load_assets(parent)
     
     def go_home(self):
@@ -827,10 +4185,11 @@ ThreeDAssetBrowser.setup_ui = new_setup_ui
 			
 
 # Register the panel (single click)
-nukescripts.registerWidgetAsPanel(
-    "ThreeDAssetBrowser",
-    "Crate",
-    "uk.co.studio.3d_browser_panel"
-)
-
-print("Crate registered - Ready in Pane menu!")
\ No newline at end of file
+if nukescripts is not None:
+    nukescripts.registerWidgetAsPanel(
+        "ThreeDAssetBrowser",
+        "Crate",
+        "uk.co.studio.3d_browser_panel"
+    )
+    
+    print("Crate registered - Ready in Pane menu!")
\ No newline at end of file